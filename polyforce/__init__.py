@@ -1,10 +1,14 @@
 __version__ = "0.3.0"
 
+from .batch import ModelBatch
 from .config import Config
 from .core import PolyforceUndefinedType
 from .decorator import polycheck
 from .fields import Field, PolyField
+from .hooks import install_import_hook
 from .main import PolyModel
+from .monitoring import enforce
+from .policy import Policy, policy
 
 __all__ = [
     "Config",
@@ -14,4 +18,9 @@ __all__ = [
     "PolyField",
     "PolyModel",
     "Field",
+    "ModelBatch",
+    "Policy",
+    "policy",
+    "enforce",
+    "install_import_hook",
 ]
@@ -0,0 +1,53 @@
+import argparse
+import sys
+import time
+from typing import List, Union
+
+from .checker import check_paths, write_manifest
+
+
+def check(arguments: argparse.Namespace) -> int:
+    """
+    Checks the annotations of the given packages, printing the issues found.
+
+    Returns:
+        int: The exit code, 1 when any issue was found.
+    """
+    start = time.perf_counter()
+    reports = check_paths(arguments.paths, parallel=arguments.jobs)
+    issues = [issue for report in reports for issue in report.issues]
+
+    for issue in issues:
+        print(issue)
+
+    if arguments.manifest:
+        manifest = write_manifest(arguments.manifest, reports)
+        print(f"{len(manifest['modules'])} modules written to {arguments.manifest}.")
+
+    elapsed = time.perf_counter() - start
+    print(f"{len(issues)} issues found in {len(reports)} files ({elapsed:.2f}s).")
+    return 1 if issues else 0
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m polyforce")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    checker = commands.add_parser(
+        "check", help="Checks the annotations of the polycheck functions and PolyModels."
+    )
+    checker.add_argument("paths", nargs="+", help="The files, directories or packages.")
+    checker.add_argument(
+        "-j", "--jobs", type=int, default=None, help="The number of processes (one per CPU)."
+    )
+    checker.add_argument(
+        "--manifest", default=None, help="Writes the manifest of the modules without issues."
+    )
+    checker.set_defaults(handler=check)
+
+    arguments = parser.parse_args(argv)
+    return int(arguments.handler(arguments))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
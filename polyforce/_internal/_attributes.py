@@ -0,0 +1,185 @@
+import inspect
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Type, Union
+
+from ..constants import INIT_FUNCTION
+from ..fields import PolyField
+from ._config import ConfigWrapper
+from ._plan import FieldPlan, compile_field
+from ._typing import get_class_namespace, get_module_namespace, is_class_var
+
+if TYPE_CHECKING:
+    from ..main import PolyModel
+
+
+class ValidatedAttribute:
+    """
+    Data descriptor validating the values assigned to an attribute.
+
+    Only `__set__` is implemented and therefore reading the attribute
+    from an instance goes straight to the `__dict__`, as for any other attribute.
+    """
+
+    __slots__ = ("name", "source", "field", "plan", "coerce", "warn", "globalns", "localns")
+
+    def __init__(
+        self,
+        field: PolyField,
+        source: str,
+        coerce: bool = False,
+        globalns: Union[Dict[str, Any], None] = None,
+        localns: Union[Dict[str, Any], None] = None,
+        warn: bool = False,
+    ) -> None:
+        self.name: str = field.name
+        self.source = source
+        self.field = field
+        self.coerce = coerce
+        self.warn = warn
+        self.globalns = globalns
+        self.localns = localns
+        self.plan: Union[FieldPlan, None] = None
+
+    def compile(self) -> Union[FieldPlan, None]:
+        """
+        Compiles the validation of the attribute.
+
+        Raises:
+            NameError: When the annotation references a name not defined (yet).
+        """
+        self.plan = compile_field(
+            self.field, coerce=self.coerce, globalns=self.globalns, localns=self.localns
+        )
+        return self.plan
+
+    def validate(self, value: Any) -> Any:
+        plan = self.plan if self.plan is not None else self.compile()
+        if plan is None or plan.check(value):
+            return value
+        if self.warn:
+            return plan.warn(self.source, value)
+        return plan.validate(self.source, value)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = self.validate(value)
+
+    def __delete__(self, instance: Any) -> None:
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
+class ValidatedDefaultAttribute(ValidatedAttribute):
+    """
+    Validated attribute with a default value declared in the class.
+    """
+
+    __slots__ = ("default",)
+
+    def __init__(self, field: PolyField, source: str, default: Any, **kwargs: Any) -> None:
+        super().__init__(field, source, **kwargs)
+        self.default = default
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self.default
+        return instance.__dict__.get(self.name, self.default)
+
+
+class ValidatedSlot(ValidatedAttribute):
+    """
+    Validated attribute stored in a slot.
+    """
+
+    __slots__ = ("member",)
+
+    def __init__(self, field: PolyField, source: str, member: Any, **kwargs: Any) -> None:
+        super().__init__(field, source, **kwargs)
+        self.member = member
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        return self.member.__get__(instance, owner)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.member.__set__(instance, self.validate(value))
+
+    def __delete__(self, instance: Any) -> None:
+        self.member.__delete__(instance)
+
+
+def get_slot_member(cls: Type["PolyModel"], name: str) -> Any:
+    """
+    Returns the member descriptor of a slot, if the name is slotted.
+    """
+    attribute = inspect.getattr_static(cls, name, None)
+    if isinstance(attribute, ValidatedSlot):
+        return attribute.member
+    if inspect.ismemberdescriptor(attribute):
+        return attribute
+    return None
+
+
+def collect_attributes(cls: Type["PolyModel"]) -> Dict[str, PolyField]:
+    """
+    Collects the typed attributes declared by the class, from the parameters
+    of its `__init__` and from its annotations, the latter taking precedence.
+    """
+    attributes: Dict[str, PolyField] = {}
+
+    if INIT_FUNCTION in cls.__dict__:
+        for name, field in cls.poly_fields.get(INIT_FUNCTION, {}).items():
+            attributes[name] = PolyField(annotation=field.annotation, name=name)
+
+    for name, annotation in cls.__dict__.get("__annotations__", {}).items():
+        if not is_class_var(annotation):
+            attributes[name] = PolyField(annotation=annotation, name=name)
+    return attributes
+
+
+def apply_validate_assignment(cls: Type["PolyModel"], config: ConfigWrapper) -> Tuple[str, ...]:
+    """
+    Installs a validated attribute for each typed attribute declared in the class.
+
+    The checks are compiled at class creation or, when an annotation references
+    a name not defined yet, on the first assignment. Attributes without a check
+    (for instance, `Any`) are left untouched.
+
+    Returns:
+        Tuple[str, ...]: The names of the validated attributes.
+    """
+    globalns = get_module_namespace(cls)
+    localns = get_class_namespace(cls)
+    validated = []
+
+    for name, field in collect_attributes(cls).items():
+        kwargs: Dict[str, Any] = {
+            "coerce": config.coerce,
+            "globalns": globalns,
+            "localns": localns,
+            "warn": config.mode == "warn",
+        }
+        member = get_slot_member(cls, name)
+        attribute: ValidatedAttribute
+
+        if member is not None:
+            attribute = ValidatedSlot(field, cls.__name__, member, **kwargs)
+        elif name in cls.__dict__:
+            default = cls.__dict__[name]
+            if inspect.isroutine(default) or isinstance(default, (property, ValidatedAttribute)):
+                continue
+            attribute = ValidatedDefaultAttribute(field, cls.__name__, default, **kwargs)
+        else:
+            attribute = ValidatedAttribute(field, cls.__name__, **kwargs)
+
+        try:
+            if attribute.compile() is None:
+                continue
+        except NameError:
+            # Compiled on the first assignment.
+            ...
+
+        setattr(cls, name, attribute)
+        validated.append(name)
+    return tuple(validated)
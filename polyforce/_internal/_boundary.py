@@ -0,0 +1,103 @@
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Dict, Tuple, Union
+
+boundary: ContextVar[Any] = ContextVar("boundary", default=None)
+"""
+The owner of the outermost checked call running, an instance, a class or the
+globals of a module.
+
+Being a context variable, each thread and each asyncio task has its own.
+"""
+
+FillDefaults = Callable[[Tuple[Any, ...], Dict[str, Any]], Tuple[Tuple[Any, ...], Dict[str, Any]]]
+
+
+def at_boundary(
+    checked: Callable[..., Any],
+    func: Callable[..., Any],
+    fill_defaults: Union[FillDefaults, None] = None,
+) -> Callable[..., Any]:
+    """
+    Returns a method only running the checks when called from outside of its instance,
+    or class, the calls made by the checked methods of the same owner calling the
+    original function directly, with the `Field` defaults materialized by `fill_defaults`.
+
+    The owner of a coroutine function is set while its coroutine runs, meaning the
+    calls awaited by the coroutine are the ones skipped.
+    """
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def boundary_coroutine(__polymodel_self__: Any, *args: Any, **kwargs: Any) -> Any:
+            if boundary.get() is __polymodel_self__:
+                if fill_defaults is not None:
+                    args, kwargs = fill_defaults(args, kwargs)
+                return await func(__polymodel_self__, *args, **kwargs)
+
+            token = boundary.set(__polymodel_self__)
+            try:
+                return await checked(__polymodel_self__, *args, **kwargs)
+            finally:
+                boundary.reset(token)
+
+        return boundary_coroutine
+
+    @wraps(func)
+    def boundary_polycheck(__polymodel_self__: Any, *args: Any, **kwargs: Any) -> Any:
+        if boundary.get() is __polymodel_self__:
+            if fill_defaults is not None:
+                args, kwargs = fill_defaults(args, kwargs)
+            return func(__polymodel_self__, *args, **kwargs)
+
+        token = boundary.set(__polymodel_self__)
+        try:
+            return checked(__polymodel_self__, *args, **kwargs)
+        finally:
+            boundary.reset(token)
+
+    return boundary_polycheck
+
+
+def at_static_boundary(
+    checked: Callable[..., Any],
+    func: Callable[..., Any],
+    owner: Any,
+    fill_defaults: Union[FillDefaults, None] = None,
+) -> Callable[..., Any]:
+    """
+    Returns a function only running the checks when called from outside of its owner,
+    a class or the globals of a module.
+    """
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def boundary_coroutine(*args: Any, **kwargs: Any) -> Any:
+            if boundary.get() is owner:
+                if fill_defaults is not None:
+                    args, kwargs = fill_defaults(args, kwargs)
+                return await func(*args, **kwargs)
+
+            token = boundary.set(owner)
+            try:
+                return await checked(*args, **kwargs)
+            finally:
+                boundary.reset(token)
+
+        return boundary_coroutine
+
+    @wraps(func)
+    def boundary_polycheck(*args: Any, **kwargs: Any) -> Any:
+        if boundary.get() is owner:
+            if fill_defaults is not None:
+                args, kwargs = fill_defaults(args, kwargs)
+            return func(*args, **kwargs)
+
+        token = boundary.set(owner)
+        try:
+            return checked(*args, **kwargs)
+        finally:
+            boundary.reset(token)
+
+    return boundary_polycheck
@@ -0,0 +1,138 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, List, Type, Union
+
+from typing_extensions import get_args, get_origin
+
+from ._representation import origin_is_union
+
+Converter = Callable[[Any], Any]
+
+TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def str_to_bool(value: str) -> bool:
+    """
+    Converts the common textual representations of a boolean.
+    """
+    lowered = value.strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"'{value}' is not a valid boolean.")
+
+
+def str_to_datetime(value: str) -> datetime:
+    """
+    Parses an ISO 8601 datetime, accepting the `Z` suffix for UTC
+    that `datetime.fromisoformat` only understands from Python 3.11.
+    """
+    if value.endswith(("Z", "z")):
+        value = f"{value[:-1]}+00:00"
+    return datetime.fromisoformat(value)
+
+
+def str_to_enum(enum: Type[Enum]) -> Converter:
+    """
+    Builds the converter of a string into a member of the given enum,
+    looking up by value first and by name after.
+    """
+    is_int_enum = issubclass(enum, int)
+
+    def convert(value: str) -> Enum:
+        try:
+            return enum(int(value) if is_int_enum else value)
+        except ValueError:
+            try:
+                return enum[value]
+            except KeyError:
+                raise ValueError(f"'{value}' is not a valid '{enum.__name__}'.") from None
+
+    return convert
+
+
+def convert_from(source: Union[type, tuple], convert: Converter) -> Converter:
+    """
+    Restricts a converter to the given source type(s). Any other value
+    raises a `TypeError` without attempting any conversion.
+    """
+
+    def converter(value: Any) -> Any:
+        if not isinstance(value, source):
+            raise TypeError(f"Cannot convert type '{type(value).__name__}'.")
+        return convert(value)
+
+    return converter
+
+
+def first_of(converters: List[Converter]) -> Converter:
+    """
+    Combines the converters of the members of a Union, returning the
+    value of the first one able to convert.
+    """
+
+    def converter(value: Any) -> Any:
+        for convert in converters:
+            try:
+                return convert(value)
+            except (TypeError, ValueError):
+                continue
+        raise TypeError(f"Cannot convert type '{type(value).__name__}'.")
+
+    return converter
+
+
+def build_converter(annotation: Any) -> Union[Converter, None]:
+    """
+    Builds the converter for a given annotation.
+
+    The converter is chosen once, when the checking plan is built, and only
+    runs for values failing the type check. It raises `TypeError` or `ValueError`
+    when the value cannot be converted.
+
+    Supported conversions:
+
+    * `str` to `int`, `float`, `bool`, `Enum`, `datetime` and `date` (ISO 8601).
+    * `list` to `tuple`, `set` and `frozenset`.
+    * `dict` to any `PolyModel`.
+
+    Returns:
+        Union[Converter, None]: The converter or None if there isn't any for the annotation.
+    """
+    from ..main import PolyModel
+
+    origin = get_origin(annotation)
+
+    if origin_is_union(origin):
+        converters = [
+            converter
+            for converter in (build_converter(arg) for arg in get_args(annotation))
+            if converter is not None
+        ]
+        if not converters:
+            return None
+        return converters[0] if len(converters) == 1 else first_of(converters)
+
+    if origin in (tuple, set, frozenset):
+        return convert_from(list, origin)
+
+    if not isinstance(annotation, type):
+        return None
+
+    if annotation in (tuple, set, frozenset):
+        return convert_from(list, annotation)
+    if annotation is bool:
+        return convert_from(str, str_to_bool)
+    if annotation in (int, float):
+        return convert_from(str, annotation)
+    if issubclass(annotation, Enum):
+        return convert_from(str, str_to_enum(annotation))
+    if issubclass(annotation, datetime):
+        return convert_from(str, str_to_datetime)
+    if issubclass(annotation, date):
+        return convert_from(str, date.fromisoformat)
+    if issubclass(annotation, PolyModel):
+        return convert_from(dict, lambda value: annotation(**value))
+    return None
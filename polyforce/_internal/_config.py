@@ -1,19 +1,53 @@
-from typing_extensions import Any, Dict, Self, Type, Union, cast
+from typing_extensions import Any, Dict, Self, Tuple, Type, Union, cast
 
+from ..backends import Backend, get_backend
 from ..config import Config
+from ..policy import Policy
+from ..reporting import MODES
 
 
 class ConfigWrapper:
-    __slots__ = ("config", "ignore", "ignored_types")
+    __slots__ = (
+        "config",
+        "ignore",
+        "ignored_types",
+        "coerce",
+        "slots",
+        "validate_assignment",
+        "frozen",
+        "policies",
+        "boundary_only",
+        "backend",
+        "mode",
+        "overhead_budget",
+    )
     config: Config
     ignore: bool
     ignored_types: Any
+    coerce: bool
+    slots: bool
+    validate_assignment: bool
+    frozen: bool
+    policies: Dict[str, Any]
+    boundary_only: bool
+    backend: Backend
+    mode: str
+    overhead_budget: Union[float, None]
 
     def __init__(
         self,
         config: Union[Config, Dict[str, Any], Type[Any], None],
         ignore: bool = False,
         ignored_types: Union[Any, None] = None,
+        coerce: bool = False,
+        slots: bool = False,
+        validate_assignment: bool = False,
+        frozen: bool = False,
+        policies: Union[Dict[str, Any], None] = None,
+        boundary_only: bool = False,
+        backend: Union[str, Backend, None] = None,
+        mode: str = "raise",
+        overhead_budget: Union[float, None] = None,
         **kwargs: Any,
     ):
         self.config = cast(Config, config)
@@ -23,9 +57,60 @@ class ConfigWrapper:
                 ignored_types, (tuple, list)
             ), "`ignored_types` must be a tuple or a list"
         self.ignored_types = ignored_types or ()
+        self.coerce = coerce
+        self.slots = slots
+        self.validate_assignment = validate_assignment
+        self.frozen = frozen
+        self.policies = dict(policies) if policies is not None else {}
+        self.boundary_only = boundary_only
+        self.backend = get_backend(backend)
+        if mode not in MODES:
+            raise ValueError(f"'{mode}' is not a valid mode, use one of {list(MODES)}.")
+        self.mode = mode
+        if overhead_budget is not None and not overhead_budget > 0:
+            raise ValueError("The overhead budget must be greater than 0.")
+        self.overhead_budget = overhead_budget
+
+    def plan_options(
+        self,
+    ) -> Tuple[
+        bool,
+        Tuple[Any, ...],
+        bool,
+        Tuple[Tuple[str, Any], ...],
+        bool,
+        Backend,
+        str,
+        Union[float, None],
+    ]:
+        """
+        The options changing the signatures, plans and wrappers compiled for the methods.
+        """
+        policies = tuple(
+            sorted(
+                ((name, Policy.from_value(value)) for name, value in self.policies.items()),
+                key=lambda item: item[0],
+            )
+        )
+        return (
+            self.ignore,
+            tuple(self.ignored_types),
+            self.coerce,
+            policies,
+            self.boundary_only,
+            self.backend,
+            self.mode,
+            self.overhead_budget,
+        )
 
     @classmethod
     def for_model(cls, bases: Any, attrs: Dict[str, Any]) -> Self:
+        # A subclass not declaring a config reuses the one of its only base.
+        if attrs.get("config") is None and len(bases) == 1:
+            wrapper = getattr(bases[0], "__polymodel_config__", None)
+            if wrapper is not None:
+                return cast(Self, wrapper)
+
         config_new = Config()
 
         for base in bases:
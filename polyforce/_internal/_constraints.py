@@ -0,0 +1,188 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from ._predicates import Check
+
+try:
+    import annotated_types
+except ImportError:  # pragma: no cover
+    annotated_types = None
+
+Bound = Tuple[Any, bool]
+CONSTRAINT_ERRORS = (TypeError, ValueError, AssertionError)
+
+
+class Constraints:
+    """
+    The compiled constraints of an `Annotated` annotation, checked once the
+    value matches the type.
+
+    Attributes:
+        check: The function returning if a value satisfies all the constraints.
+        terms: The check and the description of each constraint, used to describe
+            the constraint a value does not satisfy.
+    """
+
+    __slots__ = ("check", "terms")
+
+    def __init__(self, check: Check, terms: List[Tuple[Check, str]]) -> None:
+        self.check = check
+        self.terms = terms
+
+    def optional(self) -> "Constraints":
+        """
+        Returns the constraints of an `Optional` annotation, None being valid.
+        """
+        check = self.check
+        return Constraints(lambda value: value is None or check(value), self.terms)
+
+    def describe(self, value: Any) -> str:
+        """
+        Returns the description of the constraints not satisfied by a value.
+        """
+        return ", ".join(description for check, description in self.terms if not check(value))
+
+
+def flatten(metadata: Iterable[Any]) -> Iterable[Any]:
+    """
+    Flattens the grouped constraints, like `Interval` or `Len`, of `annotated_types`.
+    """
+    for item in metadata:
+        if annotated_types is not None and isinstance(item, annotated_types.GroupedMetadata):
+            yield from flatten(item)
+        else:
+            yield item
+
+
+def strictest(bounds: List[Bound], lower: bool) -> List[Bound]:
+    """
+    Fuses the lower (or upper) bounds into the strictest one, the exclusive bound
+    winning over an inclusive one with the same value. The bounds that cannot be
+    compared are kept.
+    """
+    if len(bounds) <= 1:
+        return bounds
+    try:
+        return [
+            max(bounds, key=lambda bound: (bound[0], bound[1]))
+            if lower
+            else min(bounds, key=lambda bound: (bound[0], not bound[1]))
+        ]
+    except TypeError:
+        return bounds
+
+
+def describe_callable(function: Any) -> str:
+    return getattr(function, "__qualname__", None) or repr(function)
+
+
+def compile_constraints(metadata: Iterable[Any]) -> Union[Constraints, None]:
+    """
+    Compiles the constraints of the metadata of an `Annotated` annotation into a
+    single function, generated once.
+
+    The `Gt`, `Ge`, `Lt` and `Le` bounds of `annotated_types` are fused into a single
+    comparison chain, for instance, `0 < value <= 10`, as are the `MinLen` and `MaxLen`
+    into `1 <= len(value) <= 10`. The `MultipleOf`, the `Predicate` and the plain
+    callables follow, a callable raising a `TypeError`, `ValueError` or `AssertionError`
+    failing the check.
+
+    Returns:
+        Union[Constraints, None]: The constraints or None when the metadata has none.
+    """
+    lower: List[Bound] = []
+    upper: List[Bound] = []
+    min_length: List[int] = []
+    max_length: List[int] = []
+    others: List[Tuple[str, Any, str]] = []
+
+    for item in flatten(metadata):
+        if annotated_types is not None and isinstance(item, annotated_types.BaseMetadata):
+            if isinstance(item, annotated_types.Gt):
+                lower.append((item.gt, True))
+            elif isinstance(item, annotated_types.Ge):
+                lower.append((item.ge, False))
+            elif isinstance(item, annotated_types.Lt):
+                upper.append((item.lt, True))
+            elif isinstance(item, annotated_types.Le):
+                upper.append((item.le, False))
+            elif isinstance(item, annotated_types.MinLen):
+                min_length.append(item.min_length)
+            elif isinstance(item, annotated_types.MaxLen):
+                max_length.append(item.max_length)
+            elif isinstance(item, annotated_types.MultipleOf):
+                others.append(
+                    ("value % {} == 0", item.multiple_of, f"multiple_of={item.multiple_of!r}")
+                )
+            elif isinstance(item, annotated_types.Predicate):
+                others.append(("{}(value)", item.func, describe_callable(item.func)))
+        elif callable(item) and not isinstance(item, type):
+            others.append(("{}(value)", item, describe_callable(item)))
+
+    namespace: Dict[str, Any] = {}
+    terms: List[Tuple[str, str]] = []
+
+    def bind(value: Any) -> str:
+        name = f"__constraint_{len(namespace)}__"
+        namespace[name] = value
+        return name
+
+    lower, upper = strictest(lower, lower=True), strictest(upper, lower=False)
+    if len(lower) <= 1 and len(upper) <= 1 and (lower or upper):
+        expression, descriptions = "value", []
+        if lower:
+            (bound, strict), *_ = lower
+            expression = f"{bind(bound)} {'<' if strict else '<='} {expression}"
+            descriptions.append(f"{'gt' if strict else 'ge'}={bound!r}")
+        if upper:
+            (bound, strict), *_ = upper
+            expression = f"{expression} {'<' if strict else '<='} {bind(bound)}"
+            descriptions.append(f"{'lt' if strict else 'le'}={bound!r}")
+        terms.append((expression, ", ".join(descriptions)))
+    else:
+        for bound, strict in lower:
+            operator, keyword = ("<", "gt") if strict else ("<=", "ge")
+            terms.append((f"{bind(bound)} {operator} value", f"{keyword}={bound!r}"))
+        for bound, strict in upper:
+            operator, keyword = ("<", "lt") if strict else ("<=", "le")
+            terms.append((f"value {operator} {bind(bound)}", f"{keyword}={bound!r}"))
+
+    if min_length or max_length:
+        expression, descriptions = "len(value)", []
+        if min_length:
+            expression = f"{max(min_length)} <= {expression}"
+            descriptions.append(f"min_length={max(min_length)}")
+        if max_length:
+            expression = f"{expression} <= {min(max_length)}"
+            descriptions.append(f"max_length={min(max_length)}")
+        terms.append((expression, ", ".join(descriptions)))
+
+    for template, value, description in others:
+        terms.append((template.format(bind(value)), description))
+
+    if not terms:
+        return None
+
+    checks = [
+        (generate_check(expression, namespace), description) for expression, description in terms
+    ]
+    if len(checks) == 1:
+        return Constraints(checks[0][0], checks)
+
+    expression = " and ".join(f"({expression})" for expression, _ in terms)
+    return Constraints(generate_check(expression, namespace), checks)
+
+
+def generate_check(expression: str, namespace: Dict[str, Any]) -> Callable[[Any], bool]:
+    """
+    Generates the function checking a value with the expression.
+    """
+    source = (
+        "def check(value):\n"
+        "    try:\n"
+        f"        return bool({expression})\n"
+        "    except __constraint_errors__:\n"
+        "        return False\n"
+    )
+    scope = {**namespace, "__constraint_errors__": CONSTRAINT_ERRORS}
+    exec(source, scope)
+    return scope["check"]  # type: ignore[no-any-return]
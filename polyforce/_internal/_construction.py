@@ -1,33 +1,40 @@
 import inspect
 from abc import ABCMeta
+from functools import wraps
 from inspect import Parameter, Signature
 from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
-    Callable,
+    ChainMap,
     ClassVar,
     Dict,
     List,
+    Mapping,
+    MutableMapping,
     Set,
     Tuple,
     Type,
     Union,
-    _SpecialForm,
     cast,
 )
 
 from typing_extensions import dataclass_transform
 
-from polyforce.exceptions import MissingAnnotation, ReturnSignatureMissing, ValidationError
+from polyforce.exceptions import MissingAnnotation, ReturnSignatureMissing
 
-from ..constants import INIT_FUNCTION, SPECIAL_CHECK
+from ..constants import CLASS_SPECIAL_WORDS, INIT_FUNCTION
 from ..core._polyforce_core import PolyforceUndefined
-from ..decorator import polycheck
 from ..fields import Field, PolyField
+from ..governor import Governor, governed_function, governed_method
+from ..policy import DEFAULT_POLICY, Policy, sampled
+from ._attributes import apply_validate_assignment
+from ._boundary import at_boundary, at_static_boundary
 from ._config import ConfigWrapper
-from ._errors import ErrorDetail
-from ._serializer import json_serializable
+from ._frozen import HASH_SLOT, apply_frozen, generate_frozen_slots, initialising
+from ._manifest import is_verified
+from ._plan import CallPlan
+from ._typing import get_class_namespace, get_module_namespace, is_class_var
 
 if TYPE_CHECKING:
     from ..main import PolyModel
@@ -45,7 +52,8 @@ class PolyMetaclass(ABCMeta):
     """
 
     __filtered_functions__: Set[str]
-    __signature__: ClassVar[Dict[str, Signature]] = {}
+    __signature__: ClassVar[Mapping[str, Signature]] = {}
+    __polymodel_plans__: ClassVar[Mapping[str, CallPlan]] = {}
 
     def __new__(
         cls: Type["PolyMetaclass"],
@@ -75,7 +83,15 @@ class PolyMetaclass(ABCMeta):
             attrs["config"] = config_wrapper.config
             attrs["__class_vars__"] = base_class_vars
 
+            if config_wrapper.slots and "__slots__" not in attrs:
+                attrs["__slots__"] = generate_slots(bases, attrs)
+            if config_wrapper.frozen:
+                attrs["__slots__"] = generate_frozen_slots(bases, attrs)
+
             model = cast("Type[PolyModel]", super().__new__(cls, name, bases, attrs))
+            model.__polymodel_slots__ = collect_slots(model)
+            model.__polymodel_frozen__ = config_wrapper.frozen
+            model.__polymodel_config__ = config_wrapper
             parents = [parent for parent in bases if isinstance(parent, PolyMetaclass)]
             if not parents:
                 return model
@@ -83,13 +99,34 @@ class PolyMetaclass(ABCMeta):
             model.__polymodel_custom_init__ = not getattr(
                 model.__init__, "__polymodel_base_init__", False
             )
-            # Making sure the PolyFields are only from this class object.
-            model.poly_fields = {}
-            model.__signature__ = {}
+            # The PolyFields, signatures and plans of the class are layered on top
+            # of the ones of the bases, which are shared instead of copied.
+            model.poly_fields = layered_map(model, "poly_fields")
+            model.__signature__ = layered_map(model, "__signature__")
+            model.__polymodel_plans__ = layered_map(model, "__polymodel_plans__")
             complete_poly_class(model, bases, config_wrapper)
             return model
         return cast("Type[PolyModel]", super().__new__(cls, name, bases, attrs))
 
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """
+        Creates an instance of the class.
+
+        The instances of a frozen class can only be assigned while
+        their `__init__` is running.
+        """
+        if not cls.__polymodel_frozen__:
+            return super().__call__(*args, **kwargs)
+
+        instance = cast(Any, cls).__new__(cls, *args, **kwargs)
+        if isinstance(instance, cast(type, cls)):
+            token = initialising.set(instance)
+            try:
+                instance.__init__(*args, **kwargs)
+            finally:
+                initialising.reset(token)
+        return instance
+
     @staticmethod
     def _collect_data_from_bases(bases: Tuple[Type]) -> Set[str]:
         """
@@ -112,134 +149,112 @@ class PolyMetaclass(ABCMeta):
                 class_vars.update(base.__class_vars__)
         return class_vars
 
-    def __getattribute__(self, name: str) -> Any:
-        """
-        Get an attribute with static type checking.
-
-        Args:
-            name (str): The name of the attribute to access.
-
-        Returns:
-            Any: The value of the attribute.
-
-        Raises:
-            AttributeError: If the attribute does not exist.
 
-        Example:
-        ```
-        obj = MyObject(42)
-        value = obj.value  # Accessing the 'value' attribute
-        ```
-        """
-        try:
-            func = super().__getattribute__(name)
-            __signature__: Dict[str, Any] = super().__getattribute__("__signature__")
-            signature: Union[Signature, None] = __signature__.get(name, None)
-
-            if signature is not None and name not in SPECIAL_CHECK:
-                return self._add_static_type_checking(func, signature)
-            else:
-                return func
-        except (KeyError, AttributeError):
-            return object.__getattribute__(self, name)
-
-    def _extract_type_hint(self, type_hint: Union[Type, tuple]) -> Any:
-        """
-        Extracts the base type from a type hint, considering typing extensions.
+def layered_map(cls: Type, name: str) -> ChainMap:
+    """
+    Creates the map of the class layered on top of the maps declared by the
+    classes of the MRO, only the first layer being written.
 
-        This function checks if the given type hint is a generic type hint and extracts
-        the base type. If not, it returns the original type hint.
+    The maps of the bases are shared, meaning the entries inherited are neither
+    copied nor generated again, and are overridden by the entries of the class.
+    """
+    maps: List[MutableMapping[str, Any]] = [{}]
+    for base in cls.__mro__[1:]:
+        layered = base.__dict__.get(name)
+        if isinstance(layered, ChainMap):
+            maps.append(layered.maps[0])
+    return ChainMap(*maps)
 
-        Args:
-            type_hint (Union[Type, tuple]): The type hint to extract the base type from.
 
-        Returns:
-            Union[Type, tuple]: The base type of the type hint or the original type hint.
+def construct_instance(cls: Type["PolyModel"], kwargs: Dict[str, Any]) -> Any:
+    """
+    Creates an instance of a class with arguments already validated,
+    calling the original `__init__` without the type checking.
+    """
+    init = unwrap_checked(cls.__init__)
+    instance = cast(Any, cls).__new__(cls)
+    token = initialising.set(instance)
+    try:
+        init(instance, **kwargs)
+    finally:
+        initialising.reset(token)
+    return instance
 
-        Example:
-        ```
-        from typing import List, Union
 
-        # Extract the base type from a List hint
-        base_type = extract_type_hint(List[int])  # Returns int
+def generate_slots(bases: Tuple[Type], attrs: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Generates the `__slots__` of a class from the parameters of the `__init__`
+    and the declared attributes (annotations) of the class.
 
-        # If the hint is not a generic type, it returns the original hint
-        original_hint = extract_type_hint(Union[int, str])  # Returns Union[int, str]
-        ```
-        """
+    The names already slotted by the bases and the ones with a value in the
+    class are excluded.
 
-        origin = getattr(type_hint, "__origin__", type_hint)
-        if isinstance(origin, _SpecialForm):
-            origin = type_hint.__args__  # type: ignore
-        return origin
+    Args:
+        bases (Tuple[Type]): The base classes.
+        attrs (Dict[str, Any]): The class attributes.
 
-    def _add_static_type_checking(
-        self: Type["PolyModel"], func: Any, signature: Signature
-    ) -> Callable:
-        """
-        Add static type checking to a method or function.
+    Returns:
+        Tuple[str, ...]: The names of the slots.
+    """
+    inherited: Set[str] = {name for base in bases for name in collect_slots(base)}
+    names: List[str] = []
+
+    init = attrs.get(INIT_FUNCTION)
+    if inspect.isfunction(init):
+        parameters = islice(inspect.signature(init).parameters.values(), 1, None)
+        names.extend(
+            param.name
+            for param in parameters
+            if param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+        )
+
+    for name, annotation in attrs.get("__annotations__", {}).items():
+        if not is_class_var(annotation):
+            names.append(name)
+
+    return tuple(
+        dict.fromkeys(name for name in names if name not in inherited and name not in attrs)
+    )
 
-        Args:
-            func (Any): The method or function to add type checking to.
-            signature (Signature): The method's signature for type checking.
 
-        Returns:
-            Callable: A wrapped function with type checking.
+def collect_slots(cls: Type) -> Tuple[str, ...]:
+    """
+    Collects the names of all the slots of a class, including the ones of the bases.
+    """
+    names: List[str] = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ("__dict__", "__weakref__", HASH_SLOT))
+    return tuple(dict.fromkeys(names))
 
-        Example:
-        ```
-        def my_method(self, value: int) -> str:
-            return str(value)
 
-        obj = MyObject(42)
-        obj.__signature__['my_method'] = inspect.signature(my_method)
+def collect_fields(cls: Type["PolyModel"]) -> Tuple[str, ...]:
+    """
+    Collects the names of the fields of a class, used to compare and hash the instances.
 
-        # Accessing 'my_method' will now perform type checking
-        result = obj.my_method(42)  # This is valid
-        result = obj.my_method("42")  # This will raise a TypeError
-        ```
-        """
+    The fields are the parameters of the `__init__`, followed by the attributes
+    declared in the class and its bases and the slots.
+    """
+    names: List[str] = []
 
-        def polycheck(*args: Any, **kwargs: Any) -> Any:
-            bound = signature.bind(*args, **kwargs)
-            bound.apply_defaults()
-
-            for name, value in bound.arguments.items():
-                if name in self.poly_fields[func.__name__]:
-                    field: PolyField = self.poly_fields[func.__name__][name]
-                    expected_type = field.annotation
-
-                    if expected_type in (_SpecialForm, Any):
-                        continue
-
-                    expected_args = self._extract_type_hint(expected_type)
-
-                    if isinstance(expected_args, tuple):
-                        if any(value == Any for value in expected_args):
-                            continue
-
-                    if not isinstance(value, expected_args):
-                        expected_value = (
-                            tuple(value.__name__ for value in expected_args)
-                            if isinstance(expected_args, tuple)
-                            else expected_args.__name__
-                        )
-                        error_message: str = (
-                            f"Expected '{expected_value}' for attribute '{name}', "
-                            f"but received type '{type(value).__name__}'."
-                        )
-                        error: ErrorDetail = ErrorDetail(
-                            source=self.__name__,
-                            value=json_serializable(value),
-                            input=name,
-                            expected=expected_value,
-                            message=error_message,
-                        )
-                        raise ValidationError.from_exception_data([error])
+    signature = cls.__signature__.get(INIT_FUNCTION)
+    if signature is not None:
+        names.extend(
+            param.name
+            for param in signature.parameters.values()
+            if param.name not in CLASS_SPECIAL_WORDS
+            and param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+        )
 
-            return func(*args, **kwargs)
+    for base in reversed(cls.__mro__):
+        for name, annotation in base.__dict__.get("__annotations__", {}).items():
+            if not is_class_var(annotation) and not name.startswith("__"):
+                names.append(name)
 
-        return polycheck
+    names.extend(cls.__polymodel_slots__)
+    return tuple(dict.fromkeys(names))
 
 
 def complete_poly_class(cls: Type["PolyModel"], bases: Tuple[Type], config: ConfigWrapper) -> bool:
@@ -255,6 +270,10 @@ def complete_poly_class(cls: Type["PolyModel"], bases: Tuple[Type], config: Conf
 
     This function completes the PolyModel class construction and applies fields and configurations.
     """
+    # The inherited methods are only checked again when the options of the plans differ.
+    inherit_methods(cls, config)
+    check_policies(cls, config)
+
     methods: List[str] = [
         attr
         for attr in cls.__dict__.keys()
@@ -263,10 +282,6 @@ def complete_poly_class(cls: Type["PolyModel"], bases: Tuple[Type], config: Conf
         and inspect.isroutine(getattr(cls, attr))
     ]
 
-    for base in bases:
-        if hasattr(base, "__signature__"):
-            cls.__signature__.update(base.__signature__)
-
     if INIT_FUNCTION in cls.__dict__ or (
         INIT_FUNCTION not in cls.__dict__ and INIT_FUNCTION not in cls.__signature__
     ):
@@ -279,33 +294,273 @@ def complete_poly_class(cls: Type["PolyModel"], bases: Tuple[Type], config: Conf
 
     cls.__signature__.update(signatures)
 
-    # Special decorator for the __init__ since it is not manipulated by the
-    # __getattribute__ functionality
-    if INIT_FUNCTION in cls.__dict__ or (
-        INIT_FUNCTION not in cls.__dict__ and INIT_FUNCTION not in cls.__signature__
-    ):
-        decorate_function(cls, config)
-
-    # Generate the PolyFields
-    for value, signature in cls.__signature__.items():
+    # Generate the PolyFields of the methods declared in the class,
+    # the inherited ones are shared with the bases.
+    for value, signature in signatures.items():
         for param in signature.parameters.values():
             # Generate the PolyField for each function.
             generate_polyfields(cls, value, param)
+
+        if value not in cls.poly_fields.maps[0] and value in cls.poly_fields:
+            # Overriding a method with parameters with one without.
+            cls.poly_fields[value] = {}
+
+    # Compile the plans used for the type checking of the methods.
+    localns = get_class_namespace(cls)
+    policies: Dict[str, Policy] = {}
+    for method, signature in signatures.items():
+        function = get_function(cls, method)
+        policies[method] = method_policy = get_policy(function, method, config)
+        unknown = method_policy.trusted.difference(signature.parameters)
+        if unknown:
+            raise ValueError(
+                f"The trusted {sorted(unknown)} are not parameters of "
+                f"'{cls.__name__}.{method}'."
+            )
+        cls.__polymodel_plans__[method] = config.backend.build_plan(
+            source=INIT_FUNCTION if method == INIT_FUNCTION else cls.__name__,
+            signature=signature,
+            poly_fields=cls.poly_fields.get(method, {}),
+            coerce=config.coerce,
+            globalns=get_module_namespace(function),
+            localns=localns,
+            trusted=method_policy.trusted,
+            returns=method_policy.checks_return,
+            warn=config.mode == "warn",
+        )
+
+    # Apply the type checking to the methods declared in the class,
+    # the inherited ones are already checked by the bases. The __init__
+    # of the PolyModel itself is never checked.
+    for method in methods:
+        if method != INIT_FUNCTION or INIT_FUNCTION in cls.__dict__:
+            decorate_method(
+                cls,
+                method,
+                cls.__polymodel_plans__[method],
+                policies[method],
+                boundary_only=config.boundary_only,
+                overhead_budget=config.overhead_budget,
+            )
+
+    cls.__polymodel_fields__ = collect_fields(cls)
+
+    if config.validate_assignment:
+        apply_validate_assignment(cls, config)
+    if config.frozen:
+        apply_frozen(cls)
     return True
 
 
-def decorate_function(cls: Type["PolyModel"], config: ConfigWrapper) -> None:
+def get_method_owner(cls: Type["PolyModel"], method: str) -> Any:
+    """
+    Returns the base where the plan of an inherited method was compiled.
+    """
+    for base in cls.__mro__[1:]:
+        plans = base.__dict__.get("__polymodel_plans__")
+        if isinstance(plans, ChainMap) and method in plans.maps[0]:
+            return base
+    return None
+
+
+def unwrap_checked(func_type: Any) -> Any:
+    """
+    Returns the original function of a method checked by a PolyModel,
+    keeping it as a classmethod or staticmethod.
+    """
+    if isinstance(func_type, (classmethod, staticmethod)):
+        return type(func_type)(unwrap_checked(func_type.__func__))
+    return getattr(func_type, "__polymodel_wrapped__", func_type)
+
+
+def inherit_methods(cls: Type["PolyModel"], config: ConfigWrapper) -> List[str]:
     """
-    Decorates the __init__ function to make sure it can apply
-    the validations upon instantiation.
+    Places in the class the original function of the inherited methods checked by a base
+    with different plan options (`ignore`, `ignored_types`, `coerce`, `policies`,
+    `boundary_only`, `backend`, `mode` or `overhead_budget`), to be checked again with the options of the class.
 
-    The `__init__` is not called inside the `__getattribute__` and therefore
-    the polycheck decorator is applied.
+    The remaining inherited methods keep the plans (and checks) of their bases.
+
+    Returns:
+        List[str]: The inherited methods to check again.
+    """
+    options = config.plan_options()
+    inherited: List[str] = []
+
+    for method in list(cls.__signature__):
+        if method in cls.__dict__:
+            continue
+
+        owner = get_method_owner(cls, method)
+        if owner is None or owner.__polymodel_config__.plan_options() == options:
+            continue
+        if method == INIT_FUNCTION and INIT_FUNCTION not in owner.__dict__:
+            # The __init__ of the PolyModel is not checked.
+            continue
+
+        setattr(cls, method, unwrap_checked(inspect.getattr_static(cls, method)))
+        inherited.append(method)
+    return inherited
+
+
+def check_policies(cls: Type["PolyModel"], config: ConfigWrapper) -> None:
+    """
+    Makes sure the `policies` of the Config only name methods of the class,
+    a typo leaving a method checked otherwise.
+    """
+    for method in config.policies:
+        if not inspect.isroutine(getattr(cls, method, None)):
+            raise ValueError(f"'{method}' of the policies is not a method of '{cls.__name__}'.")
+
+
+def get_policy(function: Any, method: str, config: ConfigWrapper) -> Policy:
+    """
+    Returns the checking policy of a method, marked by the `policy` decorator
+    or declared in the `policies` of the Config.
+    """
+    marker = getattr(function, "__polymodel_policy__", None)
+    if marker is not None:
+        return cast(Policy, marker)
+
+    value = config.policies.get(method)
+    if value is None:
+        return DEFAULT_POLICY
+    return Policy.from_value(value)
+
+
+def decorate_method(
+    cls: Type["PolyModel"],
+    method: str,
+    plan: CallPlan,
+    policy: Policy = DEFAULT_POLICY,
+    boundary_only: bool = False,
+    overhead_budget: Union[float, None] = None,
+) -> None:
     """
-    signature: Signature = cls.__signature__["__init__"]
-    decorator = polycheck(signature=signature, **config.config)
-    init_func = decorator(cls.__init__)
-    cls.__init__ = init_func  # type: ignore[method-assign]
+    Replaces a method of the class with a function applying the static type checking
+    of the plan before calling the original.
+
+    Classmethods and staticmethods are kept as such. The `self` or `cls` are not part of
+    the signature used by the plan and therefore passed directly to the function.
+
+    The policy of the method decides the wrapper used, which is chosen once, here.
+
+    Args:
+        cls (Type[PolyModel]): The PolyModel class.
+        method (str): The name of the method.
+        plan (CallPlan): The compiled plan of the method.
+        policy (Policy): The checking policy of the method.
+        boundary_only (bool): If True, the calls made by the checked methods of the same
+            instance (or class) are not checked.
+        overhead_budget (Union[float, None]): If given, the rate of the calls checked is
+            adapted by a governor keeping the time of the checks under the budget.
+    """
+    func_type = cls.__dict__[method]
+    func = func_type.__func__ if isinstance(func_type, (classmethod, staticmethod)) else func_type
+
+    # The defaults of the `Field` parameters are materialized by the calls not checked too.
+    fill_defaults = plan.fill_defaults if plan.defaults else None
+
+    if not inspect.isfunction(func) or (policy.mode == "off" and fill_defaults is None):
+        return None
+
+    validate: Any = plan.validate
+    if policy.mode == "sampled":
+        validate = sampled(plan.validate, policy.sample, fill_defaults)
+    elif not policy.checks_arguments:
+        validate = fill_defaults
+
+    wrapper: Any
+    governor: Union[Governor, None] = None
+    if overhead_budget is not None and policy.mode != "off":
+        governor = Governor(
+            f"{cls.__module__}.{cls.__qualname__}.{method}",
+            budget=overhead_budget,
+            every=policy.sample if policy.mode == "sampled" else 1,
+        )
+        governed = governed_function if isinstance(func_type, staticmethod) else governed_method
+        wrapper = governed(
+            func,
+            governor,
+            plan.validate if policy.checks_arguments else fill_defaults,
+            plan.validate_return if policy.checks_return else None,
+            fill_defaults,
+        )
+    elif policy.checks_return and inspect.iscoroutinefunction(func):
+        # The return value of a coroutine function is the one of its coroutine.
+        validate_return = plan.validate_return
+
+        if isinstance(func_type, staticmethod):
+
+            @wraps(func)
+            async def static_polycheck(*args: Any, **kwargs: Any) -> Any:
+                if validate is not None:
+                    args, kwargs = validate(args, kwargs)
+                return validate_return(await func(*args, **kwargs))
+
+            wrapper = static_polycheck
+        else:
+
+            @wraps(func)
+            async def polycheck(__polymodel_self__: Any, *args: Any, **kwargs: Any) -> Any:
+                if validate is not None:
+                    args, kwargs = validate(args, kwargs)
+                return validate_return(await func(__polymodel_self__, *args, **kwargs))
+
+            wrapper = polycheck
+
+    elif policy.checks_return:
+        validate_return = plan.validate_return
+
+        if isinstance(func_type, staticmethod):
+
+            @wraps(func)
+            def static_polycheck(*args: Any, **kwargs: Any) -> Any:
+                if validate is not None:
+                    args, kwargs = validate(args, kwargs)
+                return validate_return(func(*args, **kwargs))
+
+            wrapper = static_polycheck
+        else:
+
+            @wraps(func)
+            def polycheck(__polymodel_self__: Any, *args: Any, **kwargs: Any) -> Any:
+                if validate is not None:
+                    args, kwargs = validate(args, kwargs)
+                return validate_return(func(__polymodel_self__, *args, **kwargs))
+
+            wrapper = polycheck
+
+    elif isinstance(func_type, staticmethod):
+
+        @wraps(func)
+        def static_polycheck(*args: Any, **kwargs: Any) -> Any:
+            args, kwargs = validate(args, kwargs)
+            return func(*args, **kwargs)
+
+        wrapper = static_polycheck
+    else:
+
+        @wraps(func)
+        def polycheck(__polymodel_self__: Any, *args: Any, **kwargs: Any) -> Any:
+            args, kwargs = validate(args, kwargs)
+            return func(__polymodel_self__, *args, **kwargs)
+
+        wrapper = polycheck
+
+    if boundary_only:
+        if isinstance(func_type, staticmethod):
+            wrapper = at_static_boundary(wrapper, func, cls, fill_defaults)
+        else:
+            wrapper = at_boundary(wrapper, func, fill_defaults)
+
+    wrapper.__polymodel_wrapped__ = func
+    if governor is not None:
+        wrapper.__polymodel_governor__ = governor
+    if isinstance(func_type, (classmethod, staticmethod)):
+        wrapper = type(func_type)(wrapper)
+    setattr(cls, method, wrapper)
+    return None
 
 
 def ignore_signature(signature: Signature) -> Signature:
@@ -329,7 +584,7 @@ def ignore_signature(signature: Signature) -> Signature:
 
 def generate_polyfields(
     cls: Type["PolyModel"], method: str, parameter: Parameter
-) -> Dict[str, Dict[str, PolyField]]:
+) -> ChainMap[str, Dict[str, PolyField]]:
     """
     For all the fields found in the signature, it will generate
     PolyField type variable.
@@ -349,19 +604,30 @@ def generate_polyfields(
         field = PolyField(**data)
     else:
         field = parameter.default
-        field.annotation = parameter.annotation
+        field.annotation, field.metadata = field._extract_annotation(parameter.annotation)
         field.name = parameter.name
         field._validate_default_with_annotation()
 
     field_data = {parameter.name: field}
 
-    if method not in cls.poly_fields:
-        cls.poly_fields[method] = {}
+    # Only the fields of the class are written, never the ones of the bases.
+    fields = cls.poly_fields.maps[0]
+    if method not in fields:
+        fields[method] = {}
 
-    cls.poly_fields[method].update(field_data)
+    fields[method].update(field_data)
     return cls.poly_fields
 
 
+def get_function(cls: Type["PolyModel"], value: str) -> Any:
+    """
+    Returns the function declared for a given method, unwrapping
+    classmethods and staticmethods.
+    """
+    func_type = inspect.getattr_static(cls, value)
+    return func_type.__func__ if isinstance(func_type, (classmethod, staticmethod)) else func_type
+
+
 def generate_model_signature(
     cls: Type["PolyModel"], value: str, config: ConfigWrapper
 ) -> Signature:
@@ -379,15 +645,18 @@ def generate_model_signature(
     This function generates a signature for each method of the given class.
     """
     func_type = inspect.getattr_static(cls, value)
-    func = func_type.__func__ if isinstance(func_type, (classmethod, staticmethod)) else func_type
+    func = get_function(cls, value)
 
     signature = Signature.from_callable(func)
     if config.ignore:
         return ignore_signature(signature)
 
+    # The modules of the manifest were checked statically.
+    checked = not is_verified(cls.__module__)
+
     params = signature.parameters.values()
     merged_params: Dict[str, Parameter] = {}
-    if signature.return_annotation == inspect.Signature.empty:
+    if checked and signature.return_annotation == inspect.Signature.empty:
         raise ReturnSignatureMissing(func=value)
 
     # classmethod and staticmethod do not use the "self".
@@ -395,7 +664,7 @@ def generate_model_signature(
         params = list(islice(params, 1, None))  # type: ignore[assignment]
 
     for param in params:  # Skip self argument
-        if param.annotation == Signature.empty:
+        if checked and param.annotation == Signature.empty:
             raise MissingAnnotation(name=param.name)
 
         if param.annotation == Any:
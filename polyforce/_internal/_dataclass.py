@@ -0,0 +1,151 @@
+import dataclasses
+from functools import wraps
+from inspect import Parameter, Signature, signature
+from itertools import islice
+from typing import Any, Callable, Dict, List
+
+from ..fields import PolyField
+from ._plan import CallPlan
+
+SELF = "__polycheck_self__"
+INIT = "__polycheck_init__"
+SOURCE = "__polycheck_source__"
+MISSING = "__polycheck_missing__"
+CALL_MISSING = "__polycheck_call_missing__"
+
+
+class Missing:
+    """
+    The default of the required parameters, for the checks to run before the
+    `TypeError` of a missing argument is raised, as for the functions.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+missing = Missing()
+
+
+def call_missing(init: Callable[..., Any], instance: Any, /, **kwargs: Any) -> None:
+    """
+    Calls the original `__init__` without the arguments missing, raising its `TypeError`.
+    """
+    init(instance, **{name: value for name, value in kwargs.items() if value is not missing})
+
+
+def get_signature(cls: Any) -> Signature:
+    """
+    Returns the signature of the `__init__` of a dataclass, the fields with
+    a `default_factory` having a PolyField with the factory as default and
+    the `InitVar` annotated with the type of the variable.
+    """
+    factories = {
+        field.name: field.default_factory
+        for field in dataclasses.fields(cls)
+        if field.default_factory is not dataclasses.MISSING
+    }
+    parameters: List[Parameter] = []
+
+    for param in signature(cls).parameters.values():
+        if isinstance(param.annotation, dataclasses.InitVar):
+            param = param.replace(annotation=param.annotation.type)
+        if param.name in factories:
+            param = param.replace(default=PolyField(factory=factories[param.name]))
+        parameters.append(param)
+    return Signature(parameters, return_annotation=None)
+
+
+def compile_init(plan: CallPlan, init: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Generates the `__init__` of a dataclass validating the arguments with the
+    checks of the plan and calling the `__init__` generated by the dataclass,
+    which assigns the fields, calls the `default_factory` and the `__post_init__`.
+
+    The generated function has the same parameters as the original and the checks
+    are inlined, one per parameter with a check, the defaults and the values
+    matching the annotations not paying more than an identity or a type check.
+
+    Args:
+        plan (CallPlan): The compiled plan of the dataclass.
+        init (Callable[..., Any]): The `__init__` generated by the dataclass.
+
+    Returns:
+        Callable[..., Any]: The validating `__init__`.
+    """
+    compiled = plan.fields if plan.fields is not None else plan.compile()
+    fields = {field.name: field for field in compiled}
+    namespace: Dict[str, Any] = {
+        INIT: init,
+        SOURCE: plan.source,
+        MISSING: missing,
+        CALL_MISSING: call_missing,
+    }
+    parameters: List[str] = [SELF]
+    arguments: List[str] = [SELF]
+    keywords: List[str] = []
+    required: List[str] = []
+    body: List[str] = []
+
+    for index, param in enumerate(islice(signature(init).parameters.values(), 1, None)):
+        name = param.name
+        keywords.append(f"{name}={name}")
+        if param.kind == Parameter.KEYWORD_ONLY:
+            if "*" not in parameters:
+                parameters.append("*")
+            arguments.append(f"{name}={name}")
+        else:
+            arguments.append(name)
+
+        if param.default is Parameter.empty:
+            default = MISSING
+            required.append(f"{name} is {MISSING}")
+        else:
+            # The defaults, including the marker of a default_factory, are never checked.
+            default = f"__polycheck_default_{index}__"
+            namespace[default] = param.default
+        parameters.append(f"{name}={default}")
+
+        field = fields.get(name)
+        if field is None:
+            continue
+
+        check, validate = f"__polycheck_check_{index}__", f"__polycheck_validate_{index}__"
+        namespace[check] = field.check
+        namespace[validate] = field.warn if plan.warn else field.validate
+        body.append(f"    if {name} is not {default} and not {check}({name}):")
+        body.append(f"        {name} = {validate}({SOURCE}, {name})")
+
+    if required:
+        body.append(f"    if {' or '.join(required)}:")
+        body.append(f"        return {CALL_MISSING}({INIT}, {SELF}, {', '.join(keywords)})")
+    body.append(f"    {INIT}({', '.join(arguments)})")
+    source = f"def __init__({', '.join(parameters)}):\n" + "\n".join(body)
+
+    exec(source, namespace)
+    return wraps(init)(namespace["__init__"])
+
+
+def apply_dataclass_init(cls: Any, plan: CallPlan) -> Any:
+    """
+    Replaces the `__init__` of a dataclass with one validating the arguments.
+
+    When the annotations reference names not defined yet, the `__init__` is
+    generated on the first instance created.
+    """
+    init = cls.__init__
+
+    if plan.fields is not None:
+        cls.__init__ = compile_init(plan, init)
+        return cls
+
+    @wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        compiled = compile_init(plan, init)
+        cls.__init__ = compiled
+        compiled(self, *args, **kwargs)
+
+    cls.__init__ = __init__
+    return cls
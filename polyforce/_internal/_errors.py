@@ -1,6 +1,6 @@
 from typing import Any, Tuple, Union
 
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class ErrorDetail(TypedDict):
@@ -18,3 +18,5 @@ class ErrorDetail(TypedDict):
     """The expected input that caused the error."""
     message: str
     """Human readable error message."""
+    row: NotRequired[int]
+    """The index of the row, when validating a batch of values."""
@@ -0,0 +1,105 @@
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Type
+
+from ._serializer import get_values
+
+if TYPE_CHECKING:
+    from ..main import PolyModel
+
+HASH_SLOT = "__polymodel_hash__"
+
+initialising: ContextVar[Any] = ContextVar("initialising", default=None)
+"""
+The instance whose `__init__` is running, the only one a frozen model allows to be assigned.
+"""
+
+
+def generate_frozen_slots(bases: Tuple[Type], attrs: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Generates the `__slots__` of a frozen class, adding the slot caching the hash
+    of the instances.
+
+    Classes not declaring `__slots__` keep the `__dict__` (and `__weakref__`) of the
+    instances, unless already provided by the bases.
+    """
+    slots = attrs.get("__slots__")
+    if slots is None:
+        slots = ()
+        if not any(base.__dictoffset__ for base in bases):
+            slots += ("__dict__",)
+        if not any(base.__weakrefoffset__ for base in bases):
+            slots += ("__weakref__",)
+    elif isinstance(slots, str):
+        slots = (slots,)
+
+    if any(hasattr(base, HASH_SLOT) for base in bases):
+        return tuple(slots)
+    return (*slots, HASH_SLOT)
+
+
+def get_state_slots(cls: Type[Any]) -> Tuple[str, ...]:
+    """
+    Returns the slots of a class and its bases holding the state of the instances,
+    the hash cached being left out.
+    """
+    names: Dict[str, None] = {}
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__", HASH_SLOT):
+                names[name] = None
+    return tuple(names)
+
+
+def apply_frozen(cls: Type["PolyModel"]) -> None:
+    """
+    Generates the `__eq__` and `__hash__` of a frozen class from the values of its fields,
+    unless declared by the class.
+
+    The hash is computed once per instance and cached in a slot.
+
+    The `__getstate__` and `__setstate__` used by `copy` and `pickle` restore the attributes
+    without going through the frozen `__setattr__`, the hash being computed again.
+    """
+    values = get_values(cls.__polymodel_fields__)
+    slots = get_state_slots(cls)
+
+    def __eq__(self: Any, other: Any) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values(self) == values(other)
+
+    def __hash__(self: Any) -> int:
+        try:
+            return getattr(self, HASH_SLOT)  # type: ignore[no-any-return]
+        except AttributeError:
+            value = hash((self.__class__, values(self)))
+            object.__setattr__(self, HASH_SLOT, value)
+            return value
+
+    def __getstate__(self: Any) -> Dict[str, Any]:
+        state = dict(getattr(self, "__dict__", {}))
+        for name in slots:
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                continue
+        return state
+
+    def __setstate__(self: Any, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    if "__eq__" not in cls.__dict__:
+        __eq__.__qualname__ = f"{cls.__qualname__}.__eq__"
+        cls.__eq__ = __eq__  # type: ignore[method-assign]
+    if cls.__dict__.get("__hash__") is None:
+        __hash__.__qualname__ = f"{cls.__qualname__}.__hash__"
+        cls.__hash__ = __hash__  # type: ignore[method-assign]
+    if "__getstate__" not in cls.__dict__ and "__setstate__" not in cls.__dict__:
+        __getstate__.__qualname__ = f"{cls.__qualname__}.__getstate__"
+        __setstate__.__qualname__ = f"{cls.__qualname__}.__setstate__"
+        cls.__getstate__ = __getstate__  # type: ignore[method-assign]
+        cls.__setstate__ = __setstate__
@@ -0,0 +1,69 @@
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import orjson
+
+MANIFEST_VERSION = 1
+MANIFEST_ENV = "POLYFORCE_MANIFEST"
+
+modules: Dict[str, Any] = {}
+"""
+The modules of the loaded manifests, checked by `python -m polyforce check`.
+"""
+
+
+def source_stamp(path: str) -> Tuple[int, int]:
+    """
+    The size and modification time of a source, identifying the version checked.
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """
+    Loads a manifest written by `python -m polyforce check --manifest`, skipping the
+    checks of the signatures of its modules as long as their sources are not changed.
+
+    The manifest given by the `POLYFORCE_MANIFEST` environment variable is loaded
+    when polyforce is imported.
+
+    Raises:
+        ValueError: When the manifest was written by another version of polyforce.
+    """
+    with open(path, "rb") as file:
+        manifest: Dict[str, Any] = orjson.loads(file.read())
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"The manifest '{path}' is not supported, check the modules again.")
+
+    modules.update(manifest["modules"])
+    is_verified.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=None)
+def is_verified(module: str) -> bool:
+    """
+    Returns if the signatures of a module were checked statically, the module
+    being the one of the manifest and its source not changed since.
+    """
+    entry = modules.get(module)
+    if entry is None:
+        return False
+
+    loaded = getattr(sys.modules.get(module), "__file__", None)
+    try:
+        return (
+            loaded is not None
+            and os.path.abspath(loaded) == entry["path"]
+            and list(source_stamp(entry["path"])) == entry["stamp"]
+        )
+    except OSError:
+        return False
+
+
+if os.environ.get(MANIFEST_ENV):
+    load_manifest(os.environ[MANIFEST_ENV])
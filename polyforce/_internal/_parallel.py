@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Union
+
+Parallel = Union[int, Executor, None]
+"""
+The number of worker processes or an executor to run the validation in.
+"""
+
+
+@contextmanager
+def get_executor(parallel: Union[int, Executor]) -> Iterator[Executor]:
+    """
+    Returns the executor given or a process pool with the given number of
+    workers, shut down once done.
+    """
+    if isinstance(parallel, Executor):
+        yield parallel
+        return
+
+    with ProcessPoolExecutor(max_workers=parallel) as executor:
+        yield executor
+
+
+def get_workers(parallel: Union[int, Executor]) -> int:
+    """
+    Returns the number of workers of the parallel option, when known.
+    """
+    if isinstance(parallel, int):
+        return parallel
+    return os.cpu_count() or 1
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Splits an iterable into lists of the given size, the last one possibly smaller.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,620 @@
+from inspect import Parameter, Signature
+from typing import Any, Dict, FrozenSet, Set, Tuple, Union
+
+from ..exceptions import ValidationError
+from ..fields import PolyField
+from ..reporting import report
+from ._coercion import Converter, build_converter
+from ._constraints import Constraints, compile_constraints
+from ._errors import ErrorDetail
+from ._predicates import Check, Predicate, compile_predicate
+from ._representation import display_as_type, origin_is_union
+from ._serializer import json_serializable
+from ._typing import get_args, get_origin, is_forward_ref, resolve_annotation
+
+POSITIONAL_KINDS = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+KEYWORD_KINDS = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+VARIADIC_KINDS = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+# Above this number of values, the types of the values are checked instead of the values.
+DISTINCT_TYPES_THRESHOLD = 8
+
+
+class FieldPlan:
+    """
+    The compiled validation of a single parameter.
+
+    The constraints of an `Annotated` annotation, when any, are checked
+    after the type, in the same check.
+    """
+
+    __slots__ = (
+        "name",
+        "field",
+        "predicate",
+        "check",
+        "expected",
+        "converter",
+        "constraints",
+        "type_check",
+    )
+
+    def __init__(
+        self,
+        field: PolyField,
+        predicate: Predicate,
+        converter: Union[Converter, None] = None,
+        constraints: Union[Constraints, None] = None,
+    ) -> None:
+        self.name: str = field.name
+        self.field = field
+        self.expected = predicate.expected
+        self.converter = converter
+        self.constraints = constraints
+        self.type_check: Check = predicate.check
+
+        if constraints is not None:
+            type_check, satisfies = predicate.check, constraints.check
+            predicate = Predicate(
+                lambda value: type_check(value) and satisfies(value), predicate.expected
+            )
+        self.predicate = predicate
+        self.check: Check = predicate.check
+
+    def validate(self, source: str, value: Any) -> Any:
+        """
+        Validates a value, converting it when a converter is available.
+
+        Returns:
+            Any: The value or the converted value.
+
+        Raises:
+            ValidationError: When the value does not match the annotation.
+        """
+        if self.check(value):
+            return value
+
+        if self.converter is not None:
+            try:
+                converted = self.converter(value)
+            except (TypeError, ValueError):
+                ...
+            else:
+                if self.check(converted):
+                    return converted
+
+        raise self.error(source, value)
+
+    def warn(self, source: str, value: Any) -> Any:
+        """
+        Validates a value, reporting it instead of raising when not valid.
+
+        Returns:
+            Any: The value or the converted value.
+        """
+        if self.converter is not None:
+            try:
+                return self.validate(source, value)
+            except ValidationError:
+                ...
+        report(source, self.name, self.invalid_type(value))
+        return value
+
+    def invalid_type(self, value: Any) -> type:
+        """
+        Returns the type of a value not valid, reported with `mode="warn"`.
+        """
+        return type(value)
+
+    def message(self, attribute: str, value: Any) -> str:
+        """
+        Describes why a value is not valid, its type or the constraints not satisfied.
+        """
+        if self.constraints is not None and self.type_check(value):
+            return (
+                f"The value of attribute '{attribute}' does not satisfy "
+                f"'{self.constraints.describe(value)}'."
+            )
+        return (
+            f"Expected '{self.expected}' for attribute '{attribute}', "
+            f"but received type '{type(value).__name__}'."
+        )
+
+    def error(self, source: str, value: Any) -> ValidationError:
+        """
+        Builds the ValidationError for a value not matching the parameter.
+        """
+        error = ErrorDetail(
+            source=source,
+            value=json_serializable(value),
+            input=self.name,
+            expected=self.expected,
+            message=self.message(self.name, value),
+        )
+        return ValidationError.from_exception_data([error])
+
+
+class VariadicFieldPlan(FieldPlan):
+    """
+    The compiled validation of a `*args` or `**kwargs` parameter, checking
+    each of the values against the annotation, which applies to the items.
+
+    The values are checked one by one, stopping at the first not valid. When
+    the annotation is a plain `isinstance` check, the many values are checked
+    by type instead, each distinct type only once.
+    """
+
+    __slots__ = ("item", "keyword")
+
+    def __init__(self, item: FieldPlan, keyword: bool = False) -> None:
+        super().__init__(item.field, compile_variadic(item.predicate, keyword), item.converter)
+        self.item = item
+        self.keyword = keyword
+
+    def validate(self, source: str, values: Any) -> Any:
+        """
+        Validates the values, converting them when a converter is available.
+
+        Returns:
+            Any: The values, or new values when any was converted.
+
+        Raises:
+            ValidationError: For the first value not matching the annotation.
+        """
+        item = self.item
+        items = values.items() if self.keyword else enumerate(values)
+        validated = {}
+
+        for key, value in items:
+            if item.check(value):
+                validated[key] = value
+                continue
+            if item.converter is not None:
+                try:
+                    converted = item.converter(value)
+                except (TypeError, ValueError):
+                    ...
+                else:
+                    if item.check(converted):
+                        validated[key] = converted
+                        continue
+            raise self.item_error(source, key, value)
+
+        return validated if self.keyword else tuple(validated.values())
+
+    def invalid_type(self, values: Any) -> type:
+        item = self.item
+        for value in values.values() if self.keyword else values:
+            if not item.check(value):
+                return type(value)
+        return type(values)
+
+    def item_error(self, source: str, key: Any, value: Any) -> ValidationError:
+        """
+        Builds the ValidationError of a value, named by its position or keyword,
+        for instance, `args[1]`.
+        """
+        error = ErrorDetail(
+            source=source,
+            value=json_serializable(value),
+            input=self.name,
+            expected=self.expected,
+            message=self.item.message(f"{self.name}[{key!r}]", value),
+        )
+        return ValidationError.from_exception_data([error])
+
+
+def compile_variadic(predicate: Predicate, keyword: bool = False) -> Predicate:
+    """
+    Compiles the predicate of the values of a `*args` (a tuple) or a `**kwargs` (a dict).
+    """
+    check = predicate.check
+    classes = predicate.classes
+
+    if classes is None:
+        if keyword:
+            return Predicate(lambda values: all(map(check, values.values())), predicate.expected)
+        return Predicate(lambda values: all(map(check, values)), predicate.expected)
+
+    def check_values(values: Any) -> bool:
+        if keyword:
+            values = values.values()
+        if len(values) <= DISTINCT_TYPES_THRESHOLD:
+            return all(map(check, values))
+        # Values of the same type have the same result.
+        return all(issubclass(kind, classes) for kind in set(map(type, values)))
+
+    return Predicate(check_values, predicate.expected)
+
+
+def resolve_field(
+    field: PolyField,
+    globalns: Union[Dict[str, Any], None] = None,
+    localns: Union[Dict[str, Any], None] = None,
+) -> None:
+    """
+    Resolves the annotation of a field declared as a string or
+    as a forward reference.
+    """
+    annotation = resolve_annotation(field.annotation, globalns, localns)
+    field.annotation, metadata = field._extract_annotation(annotation)
+    field.metadata.extend(metadata)
+    field._validate_default_with_annotation()
+
+
+def compile_field(
+    field: PolyField,
+    ignored_types: Tuple[Any, ...] = (),
+    coerce: bool = False,
+    globalns: Union[Dict[str, Any], None] = None,
+    localns: Union[Dict[str, Any], None] = None,
+) -> Union[FieldPlan, None]:
+    """
+    Compiles the validation of a field.
+
+    Returns:
+        Union[FieldPlan, None]: The compiled field or None when any value is accepted.
+
+    Raises:
+        NameError: When the annotation references a name not defined (yet).
+    """
+    if is_forward_ref(field.annotation):
+        resolve_field(field, globalns, localns)
+
+    predicate = compile_predicate(field.annotation, ignored_types)
+    constraints = compile_constraints(field.metadata) if field.metadata else None
+    if (
+        constraints is not None
+        and origin_is_union(get_origin(field.annotation))
+        and type(None) in get_args(field.annotation)
+    ):
+        # The constraints of an `Optional` annotation apply to the other types.
+        constraints = constraints.optional()
+    if predicate is None:
+        if constraints is None:
+            return None
+        predicate = Predicate(lambda value: True, display_as_type(field.annotation))
+    converter = build_converter(field.annotation) if coerce else None
+    return FieldPlan(field, predicate, converter, constraints)
+
+
+class CallPlan:
+    """
+    The plan used to validate the calls of a given function.
+
+    The plan is built once per function, compiling the checks (and converters,
+    when `coerce` is enabled) of every parameter upfront, leaving only the
+    checks themselves to run on every call.
+
+    String annotations and forward references are resolved with the given namespaces
+    and cached in the plan. When a name is not defined yet, for instance, a class
+    declared later in the module, the compilation is deferred to the first call.
+
+    With `warn`, the values not valid are reported (see `polyforce.reporting`)
+    instead of raising a `ValidationError`.
+    """
+
+    __slots__ = (
+        "source",
+        "signature",
+        "poly_fields",
+        "fields",
+        "positional",
+        "keywords",
+        "var_positional",
+        "var_keyword",
+        "variadic",
+        "positional_only",
+        "ignore",
+        "ignored_types",
+        "coerce",
+        "globalns",
+        "localns",
+        "trusted",
+        "returns",
+        "return_field",
+        "defaults",
+        "factory_checks",
+        "checked_factories",
+        "warn",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        signature: Signature,
+        poly_fields: Dict[str, PolyField],
+        ignore: bool = False,
+        ignored_types: Tuple[Any, ...] = (),
+        coerce: bool = False,
+        globalns: Union[Dict[str, Any], None] = None,
+        localns: Union[Dict[str, Any], None] = None,
+        trusted: FrozenSet[str] = frozenset(),
+        returns: bool = False,
+        warn: bool = False,
+    ) -> None:
+        parameters = signature.parameters.values()
+
+        self.source = source
+        self.signature = signature
+        self.poly_fields = poly_fields
+        self.ignore = ignore
+        self.ignored_types = ignored_types
+        self.coerce = coerce
+        self.globalns = globalns
+        self.localns = localns
+        self.positional = tuple(
+            param.name for param in parameters if param.kind in POSITIONAL_KINDS
+        )
+        self.keywords = frozenset(
+            param.name for param in parameters if param.kind in KEYWORD_KINDS
+        )
+        self.var_positional: Union[str, None] = None
+        self.var_keyword: Union[str, None] = None
+        for param in parameters:
+            if param.kind == Parameter.VAR_POSITIONAL:
+                self.var_positional = param.name
+            elif param.kind == Parameter.VAR_KEYWORD:
+                self.var_keyword = param.name
+        self.variadic = self.var_positional is not None or self.var_keyword is not None
+        # The defaults of the positional-only parameters, passed along the `Field` ones
+        # materialized, these parameters not taking keywords.
+        self.positional_only = tuple(
+            param.default for param in parameters if param.kind == Parameter.POSITIONAL_ONLY
+        )
+        self.trusted = trusted
+        self.returns = returns
+        self.warn = warn
+        self.fields: Union[Tuple[FieldPlan, ...], None] = None
+        self.return_field: Union[FieldPlan, None] = None
+
+        # The parameters declaring a `Field` with a default or a factory, with their
+        # position, materialized when the arguments are missing.
+        self.defaults = tuple(
+            (
+                param.name,
+                self.positional.index(param.name) if param.name in self.positional else None,
+                param.default,
+            )
+            for param in parameters
+            if isinstance(param.default, PolyField) and not param.default.is_required()
+        )
+        self.factory_checks: Dict[str, FieldPlan] = {}
+        self.checked_factories: Set[str] = set()
+
+        try:
+            self.compile()
+        except NameError:
+            # The names are not defined yet, compiled on the first call.
+            ...
+
+    def replace(self, **changes: Any) -> "CallPlan":
+        """
+        Returns a new plan with the same signature and fields, compiled
+        with the given changes, for instance, `coerce=True`.
+        """
+        options: Dict[str, Any] = {
+            "source": self.source,
+            "signature": self.signature,
+            "poly_fields": self.poly_fields,
+            "ignore": self.ignore,
+            "ignored_types": self.ignored_types,
+            "coerce": self.coerce,
+            "globalns": self.globalns,
+            "localns": self.localns,
+            "trusted": self.trusted,
+            "returns": self.returns,
+            "warn": self.warn,
+        }
+        options.update(changes)
+        return type(self)(**options)
+
+    def compile(self) -> Tuple[FieldPlan, ...]:
+        """
+        Compiles the checks of all the fields.
+
+        Raises:
+            NameError: When an annotation references a name not defined (yet).
+        """
+        fields = []
+        for field in self.poly_fields.values():
+            if field.name in self.trusted:
+                continue
+            compiled = compile_field(
+                field, self.ignored_types, self.coerce, self.globalns, self.localns
+            )
+            if compiled is None:
+                continue
+            kind = self.signature.parameters[field.name].kind
+            if kind in VARIADIC_KINDS:
+                compiled = VariadicFieldPlan(compiled, keyword=kind == Parameter.VAR_KEYWORD)
+            fields.append(compiled)
+
+        if self.returns:
+            self.return_field = self.compile_return()
+        factories = {name for name, _, field in self.defaults if field.factory is not None}
+        self.factory_checks = {field.name: field for field in fields if field.name in factories}
+        self.fields = tuple(fields)
+        return self.fields
+
+    def compile_return(self) -> Union[FieldPlan, None]:
+        """
+        Compiles the check of the return value, never converted.
+        """
+        annotation = self.signature.return_annotation
+        if annotation is None:
+            annotation = type(None)
+        field = PolyField(annotation=annotation, name="return")
+        return compile_field(field, self.ignored_types, False, self.globalns, self.localns)
+
+    def validate_return(self, value: Any) -> Any:
+        """
+        Validates the value returned by a call.
+
+        Raises:
+            ValidationError: When the value does not match the return annotation.
+        """
+        if self.fields is None:
+            self.compile()
+        field = self.return_field
+        if field is None or field.check(value):
+            return value
+        if self.warn:
+            report(self.source, field.name, type(value))
+            return value
+        raise field.error(self.source, value)
+
+    def validate(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Validates the arguments of a call.
+
+        Returns:
+            Tuple: The arguments to call the function with. These are the
+                ones given unless any value was coerced or any `Field`
+                default was materialized.
+        """
+        if not self.ignore:
+            args, kwargs = self.validate_call(args, kwargs)
+        if self.defaults:
+            return self.fill_defaults(args, kwargs)
+        return args, kwargs
+
+    def fill_defaults(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Materializes the defaults of the `Field` parameters for the arguments
+        missing, and only for these, passing them as keywords, or as positional
+        arguments for the positional-only parameters.
+
+        The plain defaults were validated when the field was declared. The values
+        built by a factory are validated, once per factory when the check only
+        depends on the type of the value, on every call otherwise. With `mode="warn"`,
+        the values not valid are reported instead.
+        """
+        filled = None
+        positional: Dict[int, Any] = {}
+        count = len(args)
+
+        for name, index, field in self.defaults:
+            if name in kwargs or (index is not None and index < count):
+                continue
+
+            if field.factory is None:
+                value = field.get_default()
+            else:
+                value = field.factory()
+                check = self.factory_checks.get(name)
+                if check is not None and not self.ignore and name not in self.checked_factories:
+                    if self.warn:
+                        value = check.warn(self.source, value)
+                    else:
+                        value = check.validate(self.source, value)
+                    # With `mode="warn"`, a factory failing is reported on every call.
+                    if check.predicate.classes is not None and check.check(value):
+                        self.checked_factories.add(name)
+
+            if index is not None and index < len(self.positional_only):
+                positional[index] = value
+                continue
+            if filled is None:
+                filled = dict(kwargs)
+            filled[name] = value
+
+        if positional:
+            # The positional-only parameters before the last one filled are missing as
+            # well, passed their default.
+            args += tuple(
+                positional[index] if index in positional else self.positional_only[index]
+                for index in range(count, max(positional) + 1)
+            )
+        if filled is None:
+            return args, kwargs
+        return args, filled
+
+    def validate_call(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Validates the arguments given to a call.
+        """
+        fields = self.fields if self.fields is not None else self.compile()
+        if not fields:
+            return args, kwargs
+
+        if self.variadic:
+            return self.validate_variadic(fields, args, kwargs)
+
+        arguments = dict(zip(self.positional, args))
+        arguments.update(kwargs)
+        if self.validate_arguments(fields, arguments):
+            positional = tuple(arguments[name] for name in self.positional[: len(args)])
+            return positional + args[len(positional) :], {key: arguments[key] for key in kwargs}
+        return args, kwargs
+
+    def validate_variadic(
+        self, fields: Tuple[FieldPlan, ...], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Validates the arguments of a call of a function with `*args` or `**kwargs`.
+
+        The arguments are bound the way Python does: the extra positional arguments
+        to the `*args` and the keywords not naming a parameter, including the
+        positional-only ones, to the `**kwargs`.
+        """
+        count = len(self.positional)
+        arguments = dict(zip(self.positional, args))
+        if self.var_positional is not None:
+            arguments[self.var_positional] = args[count:]
+
+        extra: Dict[str, Any] = {}
+        for key, value in kwargs.items():
+            if key in self.keywords or self.var_keyword is None:
+                arguments[key] = value
+            else:
+                extra[key] = value
+        if self.var_keyword is not None:
+            arguments[self.var_keyword] = extra
+
+        if not self.validate_arguments(fields, arguments):
+            return args, kwargs
+
+        positional = tuple(arguments[name] for name in self.positional[: len(args)])
+        if self.var_positional is not None:
+            positional += arguments[self.var_positional]
+        else:
+            positional += args[count:]
+        if self.var_keyword is not None:
+            extra = arguments[self.var_keyword]
+        return positional, {key: extra[key] if key in extra else arguments[key] for key in kwargs}
+
+    def validate_arguments(self, fields: Tuple[FieldPlan, ...], arguments: Dict[str, Any]) -> bool:
+        """
+        Validates the arguments mapped by parameter name, replacing
+        the values coerced.
+
+        Returns:
+            bool: If any of the arguments was coerced.
+        """
+        coerced = False
+
+        for field in fields:
+            name = field.name
+            if name not in arguments:
+                continue
+
+            value = arguments[name]
+            if isinstance(value, PolyField) and value.default is not None and value.default:
+                value = value.default
+
+            if field.check(value):
+                continue
+
+            if self.warn:
+                arguments[name] = field.warn(self.source, value)
+            else:
+                arguments[name] = field.validate(self.source, value)
+            coerced = True
+        return coerced
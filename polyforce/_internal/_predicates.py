@@ -0,0 +1,273 @@
+import collections.abc
+import inspect
+import typing
+from inspect import Parameter
+from typing import Any, Callable, ForwardRef, Tuple, TypeVar, Union
+
+import typing_extensions
+from typing_extensions import LiteralString, get_args, get_origin, is_typeddict
+
+from ._representation import display_as_type, origin_is_union
+from ._typing import LITERAL_TYPES
+
+NoneType = type(None)
+ANNOTATED_TYPES = frozenset({typing_extensions.Annotated, getattr(typing, "Annotated", None)})
+Check = Callable[[Any], bool]
+
+
+class Predicate:
+    """
+    The compiled check of an annotation.
+
+    Attributes:
+        check: The function returning if a value matches the annotation.
+        expected: The value displayed in the errors as the expected type.
+        classes: The classes checked when the check is a plain `isinstance`, None otherwise.
+            Values of the same type are guaranteed to have the same result.
+    """
+
+    __slots__ = ("check", "expected", "classes")
+
+    def __init__(
+        self, check: Check, expected: Any, classes: Union[Tuple[type, ...], None] = None
+    ) -> None:
+        self.check = check
+        self.expected = expected
+        self.classes = classes
+
+    @classmethod
+    def from_classes(cls, classes: Tuple[type, ...], expected: Any = None) -> "Predicate":
+        if expected is None:
+            names = tuple(value.__name__ for value in classes)
+            expected = names[0] if len(names) == 1 else names
+
+        def check(value: Any) -> bool:
+            return isinstance(value, classes)
+
+        return cls(check, expected, classes)
+
+
+def is_type_alias(annotation: Any) -> bool:
+    """
+    Checks if the annotation is a `type` alias (Python 3.12+).
+    """
+    return type(annotation).__name__ == "TypeAliasType" and hasattr(annotation, "__value__")
+
+
+def is_unchecked_class(annotation: type) -> bool:
+    """
+    Protocols not decorated with `runtime_checkable` cannot be used with `isinstance`.
+    """
+    return getattr(annotation, "_is_protocol", False) and not getattr(
+        annotation, "_is_runtime_protocol", False
+    )
+
+
+def compile_predicate(
+    annotation: Any, ignored_types: Tuple[Any, ...] = ()
+) -> Union[Predicate, None]:
+    """
+    Compiles an annotation into a predicate.
+
+    The annotation is inspected only once and the returned predicate performs the
+    cheapest check possible for the type, for instance, a frozenset membership for a
+    `Literal` or a single `isinstance` for a Union of classes.
+
+    Generic containers, like `List[int]`, are only checked against their origin.
+
+    Args:
+        annotation (Any): The annotation to compile.
+        ignored_types (Tuple[Any, ...]): Types treated as `Any`.
+
+    Returns:
+        Union[Predicate, None]: The predicate or None if any value is accepted.
+    """
+    if (
+        annotation is None
+        or annotation is Any
+        or annotation is Parameter.empty
+        or isinstance(annotation, (str, ForwardRef))
+    ):
+        return None
+
+    try:
+        if annotation in ignored_types:
+            return None
+    except TypeError:  # pragma: no cover
+        ...
+
+    if annotation is NoneType:
+        return Predicate.from_classes((NoneType,))
+    if annotation is LiteralString:
+        return Predicate.from_classes((str,), expected="LiteralString")
+    if is_type_alias(annotation):
+        return compile_predicate(annotation.__value__, ignored_types)
+    if isinstance(annotation, TypeVar):
+        return compile_typevar(annotation, ignored_types)
+    if hasattr(annotation, "__supertype__"):
+        # NewType
+        return compile_predicate(annotation.__supertype__, ignored_types)
+    if is_typeddict(annotation):
+        return compile_typeddict(annotation)
+
+    origin = get_origin(annotation)
+
+    if origin is None:
+        if isinstance(annotation, type):
+            if is_unchecked_class(annotation):
+                return None
+            return Predicate.from_classes((annotation,))
+        # Special forms like Self, NoReturn or ClassVar.
+        return None
+
+    if origin in ANNOTATED_TYPES:
+        return compile_predicate(get_args(annotation)[0], ignored_types)
+    if origin_is_union(origin):
+        return compile_union(annotation, ignored_types)
+    if origin in LITERAL_TYPES:
+        return compile_literal(annotation)
+    if origin is type:
+        return compile_type(annotation)
+    if origin is collections.abc.Callable:
+        return compile_callable(annotation)
+    if is_type_alias(origin):
+        return compile_predicate(origin.__value__, ignored_types)
+    if isinstance(origin, type):
+        if is_unchecked_class(origin):
+            return None
+        return Predicate.from_classes((origin,))
+    return None
+
+
+def compile_typevar(annotation: Any, ignored_types: Tuple[Any, ...]) -> Union[Predicate, None]:
+    """
+    A TypeVar is checked against its bound or its constraints.
+    """
+    if annotation.__bound__ is not None:
+        return compile_predicate(annotation.__bound__, ignored_types)
+    if annotation.__constraints__:
+        return compile_union(Union[annotation.__constraints__], ignored_types)
+    return None
+
+
+def compile_union(annotation: Any, ignored_types: Tuple[Any, ...]) -> Union[Predicate, None]:
+    """
+    Unions of classes are checked with a single `isinstance`. Otherwise, each
+    member is checked in order with `None` checked first.
+    """
+    args = get_args(annotation)
+    predicates = []
+    for arg in args:
+        predicate = compile_predicate(arg, ignored_types)
+        if predicate is None:
+            return None
+        predicates.append(predicate)
+
+    expected = tuple(
+        name
+        for predicate in predicates
+        for name in (
+            predicate.expected if isinstance(predicate.expected, tuple) else (predicate.expected,)
+        )
+    )
+
+    if all(predicate.classes is not None for predicate in predicates):
+        classes = tuple(cls for predicate in predicates for cls in predicate.classes)
+        return Predicate.from_classes(classes, expected=expected)
+
+    optional = NoneType in args
+    checks = tuple(predicate.check for predicate in predicates if predicate.classes != (NoneType,))
+
+    def check(value: Any) -> bool:
+        if value is None:
+            return optional
+        for member in checks:
+            if member(value):
+                return True
+        return False
+
+    return Predicate(check, expected)
+
+
+def compile_literal(annotation: Any) -> Predicate:
+    """
+    Literals are checked with a frozenset membership of the type and value,
+    making sure `1` does not match `Literal[True]`.
+    """
+    values = frozenset((type(value), value) for value in get_args(annotation))
+
+    def check(value: Any) -> bool:
+        try:
+            return (type(value), value) in values
+        except TypeError:
+            # Unhashable values are never literals.
+            return False
+
+    return Predicate(check, display_as_type(annotation))
+
+
+def compile_type(annotation: Any) -> Predicate:
+    """
+    `Type[X]` accepts X or any subclass of it.
+    """
+    (arg,) = get_args(annotation) or (Any,)
+    bound = compile_predicate(arg)
+
+    if bound is None or bound.classes is None:
+
+        def check(value: Any) -> bool:
+            return isinstance(value, type)
+
+    else:
+        classes = bound.classes
+
+        def check(value: Any) -> bool:
+            return isinstance(value, type) and issubclass(value, classes)
+
+    return Predicate(check, display_as_type(annotation))
+
+
+def compile_callable(annotation: Any) -> Predicate:
+    """
+    Callables are checked for the number of positional arguments they
+    can be called with, when declared.
+    """
+    args = get_args(annotation)
+    arguments = args[0] if args else Ellipsis
+
+    if arguments is Ellipsis:
+        return Predicate(callable, display_as_type(annotation))
+
+    dummies = (None,) * len(arguments)
+
+    def check(value: Any) -> bool:
+        if not callable(value):
+            return False
+        try:
+            signature = inspect.signature(value)
+        except (TypeError, ValueError):
+            # Builtins without a signature are accepted.
+            return True
+        try:
+            signature.bind(*dummies)
+        except TypeError:
+            return False
+        return True
+
+    return Predicate(check, display_as_type(annotation))
+
+
+def compile_typeddict(annotation: Any) -> Predicate:
+    """
+    TypedDicts are checked for the required and allowed keys.
+    """
+    required = frozenset(annotation.__required_keys__)
+    allowed = required | frozenset(annotation.__optional_keys__)
+
+    def check(value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        keys = value.keys()
+        return keys >= required and keys <= allowed
+
+    return Predicate(check, annotation.__name__)
@@ -0,0 +1,296 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from inspect import Parameter
+from typing import Any, Callable, Dict, ForwardRef, List, Set, Tuple, TypeVar, cast
+
+from typing_extensions import get_args, get_origin
+
+from ..exceptions import ValidationError
+from ..reporting import report
+from ._errors import ErrorDetail
+from ._plan import CallPlan, FieldPlan, VariadicFieldPlan
+from ._predicates import ANNOTATED_TYPES, NoneType, compile_predicate, is_type_alias
+from ._representation import display_as_type, origin_is_union
+from ._serializer import json_serializable
+from ._typing import LITERAL_TYPES
+
+try:
+    import pydantic_core
+    from pydantic_core import CoreSchema, SchemaValidator, core_schema
+except ImportError:  # pragma: no cover
+    pydantic_core = None
+
+CONTAINERS = (list, set, frozenset, dict, tuple)
+SCALARS: Dict[Any, Callable[[], "CoreSchema"]] = {}
+if pydantic_core is not None:
+    SCALARS = {
+        bool: core_schema.bool_schema,
+        int: core_schema.int_schema,
+        float: core_schema.float_schema,
+        str: core_schema.str_schema,
+        bytes: core_schema.bytes_schema,
+        datetime: core_schema.datetime_schema,
+        date: core_schema.date_schema,
+        time: core_schema.time_schema,
+        timedelta: core_schema.timedelta_schema,
+        Decimal: core_schema.decimal_schema,
+    }
+
+
+def build_field_schema(field: FieldPlan, ignored_types: Tuple[Any, ...] = ()) -> "CoreSchema":
+    """
+    Builds the schema of a parameter, the annotation of a `*args` or a `**kwargs`
+    applying to each of its values. The constraints of an `Annotated` annotation
+    are checked after the schema.
+    """
+    item = field.item if isinstance(field, VariadicFieldPlan) else field
+    schema = build_schema(field.field.annotation, ignored_types)
+    if item.constraints is not None:
+        satisfies = item.constraints.check
+
+        def validate(value: Any) -> Any:
+            if satisfies(value):
+                return value
+            raise ValueError("The value does not satisfy the constraints.")
+
+        schema = core_schema.no_info_after_validator_function(validate, schema)
+
+    if not isinstance(field, VariadicFieldPlan):
+        return schema
+    if field.keyword:
+        return core_schema.dict_schema(core_schema.str_schema(), schema)
+    return core_schema.tuple_schema([schema], variadic_item_index=0)
+
+
+UNION_TAG = "__polyforce_union__"
+"""
+The prefix of the labels of the choices of the unions, which pydantic-core adds to
+the `loc` of the errors and are left out of the paths of the errors of polyforce.
+"""
+
+
+def union_schema(choices: List["CoreSchema"]) -> "CoreSchema":
+    return core_schema.union_schema(
+        [(choice, f"{UNION_TAG}{index}") for index, choice in enumerate(choices)]
+    )
+
+
+def is_union_tag(item: Any) -> bool:
+    return isinstance(item, str) and item.startswith(UNION_TAG)
+
+
+def build_schema(annotation: Any, ignored_types: Tuple[Any, ...] = ()) -> "CoreSchema":
+    """
+    Builds the pydantic-core schema of an annotation.
+
+    The scalars, unions, literals and the standard containers are validated by
+    pydantic-core, including the items of the containers. Any other annotation is
+    checked with the predicate of polyforce.
+    """
+    if (
+        annotation is None
+        or annotation is Any
+        or annotation is Parameter.empty
+        or isinstance(annotation, (str, ForwardRef))
+    ):
+        return core_schema.any_schema()
+
+    try:
+        if annotation in ignored_types:
+            return core_schema.any_schema()
+        scalar = SCALARS.get(annotation)
+    except TypeError:  # pragma: no cover
+        scalar = None
+
+    if scalar is not None:
+        return scalar()
+    if annotation is NoneType:
+        return core_schema.none_schema()
+    if is_type_alias(annotation):
+        return build_schema(annotation.__value__, ignored_types)
+    if hasattr(annotation, "__supertype__"):
+        # NewType
+        return build_schema(annotation.__supertype__, ignored_types)
+    if isinstance(annotation, TypeVar):
+        if annotation.__bound__ is not None:
+            return build_schema(annotation.__bound__, ignored_types)
+        if annotation.__constraints__:
+            return union_schema(
+                [build_schema(arg, ignored_types) for arg in annotation.__constraints__]
+            )
+        return core_schema.any_schema()
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is None and annotation in CONTAINERS:
+        # The bare containers, like `list`.
+        origin = annotation
+
+    if origin in ANNOTATED_TYPES:
+        return build_schema(args[0], ignored_types)
+    if origin_is_union(origin):
+        choices = [arg for arg in args if arg is not NoneType]
+        schema = (
+            build_schema(choices[0], ignored_types)
+            if len(choices) == 1
+            else union_schema([build_schema(arg, ignored_types) for arg in choices])
+        )
+        return core_schema.nullable_schema(schema) if len(choices) < len(args) else schema
+    if origin in LITERAL_TYPES:
+        return core_schema.literal_schema(list(args))
+    if origin is list:
+        return core_schema.list_schema(build_schema(args[0], ignored_types) if args else None)
+    if origin is set:
+        return core_schema.set_schema(build_schema(args[0], ignored_types) if args else None)
+    if origin is frozenset:
+        return core_schema.frozenset_schema(build_schema(args[0], ignored_types) if args else None)
+    if origin is dict:
+        keys, values = args if args else (Any, Any)
+        return core_schema.dict_schema(
+            build_schema(keys, ignored_types), build_schema(values, ignored_types)
+        )
+    if origin is tuple:
+        if not args:
+            return core_schema.tuple_schema([core_schema.any_schema()], variadic_item_index=0)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return core_schema.tuple_schema(
+                [build_schema(args[0], ignored_types)], variadic_item_index=0
+            )
+        if args == ((),):
+            return core_schema.tuple_schema([])
+        return core_schema.tuple_schema([build_schema(arg, ignored_types) for arg in args])
+
+    predicate = compile_predicate(annotation, ignored_types)
+    if predicate is None:
+        return core_schema.any_schema()
+    if predicate.classes is not None and len(predicate.classes) == 1:
+        return core_schema.is_instance_schema(predicate.classes[0])
+
+    check = predicate.check
+
+    def validate(value: Any) -> Any:
+        if check(value):
+            return value
+        raise ValueError(f"Expected '{predicate.expected}'.")
+
+    return core_schema.no_info_plain_validator_function(validate)
+
+
+class PydanticCorePlan(CallPlan):
+    """
+    The plan of a function validating the arguments with a `SchemaValidator`
+    of pydantic-core, compiled once from the annotations of the parameters.
+
+    The arguments are validated strictly and passed untouched to the function.
+    When coercing, only the arguments not valid are validated again, in lax mode,
+    the values converted by pydantic-core replacing them, meaning the valid
+    containers are never replaced by copies. The errors keep the format of polyforce.
+    """
+
+    __slots__ = ("validator", "lax_validator", "by_name")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.validator: Any = None
+        self.lax_validator: Any = None
+        self.by_name: Dict[str, FieldPlan] = {}
+        super().__init__(*args, **kwargs)
+
+    def compile(self) -> Tuple[FieldPlan, ...]:
+        fields = super().compile()
+        self.by_name = {field.name: field for field in fields}
+        schemas = {
+            field.name: core_schema.typed_dict_field(
+                build_field_schema(field, self.ignored_types), required=False
+            )
+            for field in fields
+        }
+
+        def build_validator(strict: bool) -> Any:
+            return SchemaValidator(
+                core_schema.typed_dict_schema(
+                    schemas,
+                    extra_behavior="ignore",
+                    total=False,
+                    config=core_schema.CoreConfig(strict=strict),
+                )
+            )
+
+        self.validator = build_validator(strict=True)
+        self.lax_validator = build_validator(strict=False) if self.coerce else None
+        return fields
+
+    def validate_arguments(self, fields: Tuple[FieldPlan, ...], arguments: Dict[str, Any]) -> bool:
+        try:
+            self.validator.validate_python(arguments)
+            return False
+        except pydantic_core.ValidationError as error:
+            if self.lax_validator is None:
+                return self.fail(error, arguments)
+            failed = {cast(str, detail["loc"][0]) for detail in error.errors() if detail["loc"]}
+            if not failed:  # pragma: no cover
+                return self.fail(error, arguments)
+
+        try:
+            validated = self.lax_validator.validate_python(
+                {name: arguments[name] for name in failed}
+            )
+        except pydantic_core.ValidationError as error:
+            return self.fail(error, arguments)
+
+        arguments.update(validated)
+        return True
+
+    def fail(self, error: Any, arguments: Dict[str, Any]) -> bool:
+        """
+        Raises the errors of pydantic-core as a ValidationError or, with `mode="warn"`,
+        reports them.
+        """
+        if not self.warn:
+            raise self.error(error, arguments) from None
+        for detail in error.errors():
+            name, *_ = detail["loc"] or ("",)
+            report(self.source, cast(str, name), type(detail["input"]))
+        return False
+
+    def error(self, error: Any, arguments: Dict[str, Any]) -> ValidationError:
+        """
+        Converts the errors of pydantic-core into the errors of polyforce,
+        one per argument not valid.
+
+        The errors of the items of a container name the path of the item,
+        for instance, `tags[1]`, and the whole annotation as expected.
+        """
+        details: List[ErrorDetail] = []
+        names: Set[str] = set()
+
+        for detail in error.errors():
+            name, *path = detail["loc"] or ("",)
+            path = [item for item in path if not is_union_tag(item)]
+            field = self.by_name.get(cast(str, name))
+            if field is None or name in names:
+                continue
+            names.add(field.name)
+
+            if not path:
+                details.extend(field.error(self.source, arguments[field.name]).errors())
+                continue
+
+            if isinstance(field, VariadicFieldPlan):
+                details.extend(field.item_error(self.source, path[0], detail["input"]).errors())
+                continue
+
+            expected = display_as_type(field.field.annotation)
+            attribute = field.name + "".join(f"[{item!r}]" for item in path)
+            details.append(
+                ErrorDetail(
+                    source=self.source,
+                    value=json_serializable(arguments[field.name]),
+                    input=field.name,
+                    expected=expected,
+                    message=(
+                        f"Expected '{expected}' for attribute '{attribute}', "
+                        f"but received type '{type(detail['input']).__name__}'."
+                    ),
+                )
+            )
+        return ValidationError.from_exception_data(details)
@@ -152,6 +152,9 @@ def display_as_type(obj: Any) -> str:
         return "..."
     elif isinstance(obj, Representation):
         return repr(obj)
+    elif isinstance(obj, list):
+        # The parameters of a `Callable`.
+        return f"[{', '.join(map(display_as_type, obj))}]"
 
     if not isinstance(obj, (_TypingBase, WithArgsTypes, type)):
         obj = obj.__class__  # type: ignore
@@ -1,25 +1,225 @@
-from json import JSONEncoder
-from typing import Any, List
+import dataclasses
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Tuple, Type, Union
 
 import orjson
 
+from ..core._polyforce_core import PolyforceUndefined
 
-class SetEncoder(JSONEncoder):
+if TYPE_CHECKING:
+    from ..main import PolyModel
+
+Fields = Union[FrozenSet[str], None]
+SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class ErrorLimits:
     """
-    Encoders for Set and set types, making sure
-    the set are converted to lists upon encoding.
+    The limits of the values kept in the errors, for the errors of large values
+    to remain cheap to build.
+
+    Attributes:
+        max_depth: The nesting of the containers kept, the deeper ones being summarized.
+        max_items: The number of items kept of each container.
+        max_string: The number of characters kept of a string or a representation.
+        max_bytes: The number of bytes kept of a `bytes` or a `bytearray`.
+        type_only: Keeps only the type of the values.
     """
 
-    def default(self, obj: Any) -> List[Any]:
-        return list(obj)
+    __slots__ = ("max_depth", "max_items", "max_string", "max_bytes", "type_only")
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        max_items: int = 20,
+        max_string: int = 1000,
+        max_bytes: int = 100,
+        type_only: bool = False,
+    ) -> None:
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string = max_string
+        self.max_bytes = max_bytes
+        self.type_only = type_only
+
+    def replace(self, **changes: Any) -> "ErrorLimits":
+        options = {name: getattr(self, name) for name in self.__slots__}
+        options.update({name: value for name, value in changes.items() if value is not None})
+        return ErrorLimits(**options)
+
+
+error_limits = ErrorLimits()
+
+
+def summary(value: Any, size: Union[int, None] = None, preview: Any = None) -> Dict[str, Any]:
+    """
+    The value kept in an error when over the limits: its type, size and a preview.
+    """
+    data: Dict[str, Any] = {"type": type(value).__name__}
+    if size is not None:
+        data["size"] = size
+    if preview is not None:
+        data["preview"] = preview
+    return data
+
+
+def bounded(value: Any, limits: ErrorLimits, depth: int = 0) -> Any:
+    """
+    Converts a value to a json like format, walking at most the items
+    allowed by the limits, never the whole value.
+    """
+    original = value
+    if type(value) in SCALAR_TYPES and not isinstance(value, str):
+        return value
+
+    if isinstance(value, str):
+        if len(value) <= limits.max_string:
+            return value
+        return summary(value, len(value), value[: limits.max_string])
+
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) <= limits.max_bytes:
+            return repr(value)
+        return summary(value, len(value), repr(value[: limits.max_bytes]))
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    elif not isinstance(value, (dict, list, tuple, set, frozenset)):
+        try:
+            return bounded(orjson.loads(orjson.dumps(value)), limits, depth)
+        except TypeError:
+            attributes = getattr(value, "__dict__", None)
+            if not isinstance(attributes, dict):
+                return bounded(repr(value), limits, depth)
+            value = attributes
+
+    size = len(value)
+    if depth >= limits.max_depth:
+        return summary(original, size)
+
+    preview: Any
+    if isinstance(value, dict):
+        preview = {
+            key if isinstance(key, str) else str(key): bounded(item, limits, depth + 1)
+            for key, item in islice(value.items(), limits.max_items)
+        }
+    else:
+        preview = [bounded(item, limits, depth + 1) for item in islice(value, limits.max_items)]
+
+    if size <= limits.max_items:
+        return preview
+    return summary(original, size, preview)
 
 
 def json_serializable(obj: Any) -> Any:
     """
-    Serializes any object to a json like format.
+    Serializes any object to a json like format, bounded by the `error_limits`.
+    """
+    limits = error_limits
+    if limits.type_only:
+        return summary(obj)
+    return bounded(obj, limits)
+
+
+def get_values(fields: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Builds the function returning the values of the fields of an instance.
+
+    All the values are read by a single `attrgetter`, only falling back to a
+    slower lookup when a field was not set, returning `PolyforceUndefined` for it.
+    """
+    getter = attrgetter(*fields) if fields else None
+
+    def values(instance: Any) -> Tuple[Any, ...]:
+        if getter is None:
+            return ()
+        try:
+            result = getter(instance)
+        except AttributeError:
+            return tuple(getattr(instance, name, PolyforceUndefined) for name in fields)
+        return result if len(fields) > 1 else (result,)
+
+    return values
+
+
+def get_serialized_fields(
+    cls: Type["PolyModel"], include: Fields = None, exclude: Fields = None
+) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    """
+    Compiles, once per class and include/exclude, the fields serialized
+    and the function reading their values.
+
+    The compiled fields are kept by the class itself, in its `__polymodel_serializers__`,
+    meaning they are collected with it.
     """
-    if isinstance(obj, set):
-        obj = SetEncoder().encode(obj)
+    serializers = cls.__dict__.get("__polymodel_serializers__")
+    if serializers is None:
+        serializers = {}
+        cls.__polymodel_serializers__ = serializers
+    try:
+        return serializers[include, exclude]  # type: ignore[no-any-return]
+    except KeyError:
+        ...
+
+    fields = tuple(
+        name
+        for name in cls.__polymodel_fields__
+        if (include is None or name in include) and (exclude is None or name not in exclude)
+    )
+    serializers[include, exclude] = serialized = (fields, get_values(fields))
+    return serialized
+
+
+def model_data(instance: Any, include: Fields = None, exclude: Fields = None) -> Dict[str, Any]:
+    """
+    Returns the values of the fields of a model by name, skipping the ones not set.
+    Nested models are returned as they are.
+    """
+    fields, values = get_serialized_fields(instance.__class__, include, exclude)
+    return {
+        name: value
+        for name, value in zip(fields, values(instance))
+        if value is not PolyforceUndefined
+    }
+
 
-    serializer = orjson.dumps(obj, default=lambda o: o.__dict__)
-    return orjson.loads(serializer)
+def is_model(value: Any) -> bool:
+    return hasattr(type(value), "__polymodel_fields__")
+
+
+def to_builtins(value: Any) -> Any:
+    """
+    Converts the nested models, also the ones inside lists, tuples and
+    dictionaries, into dictionaries.
+    """
+    if type(value) in SCALAR_TYPES:
+        return value
+    if is_model(value):
+        return {name: to_builtins(item) for name, item in model_data(value).items()}
+    if isinstance(value, list):
+        return [to_builtins(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(to_builtins(item) for item in value)
+    if isinstance(value, dict):
+        return {key: to_builtins(item) for key, item in value.items()}
+    return value
+
+
+def serialize_model(obj: Any) -> Any:
+    """
+    The `default` of orjson for the types it does not support natively, the
+    nested models being serialized with their fields.
+    """
+    if is_model(obj):
+        return model_data(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def model_to_json(instance: Any, include: Fields = None, exclude: Fields = None) -> bytes:
+    """
+    Serializes a model into json, the nested values being walked natively by orjson.
+    """
+    return orjson.dumps(model_data(instance, include, exclude), default=serialize_model)
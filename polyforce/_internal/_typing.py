@@ -0,0 +1,87 @@
+import inspect
+import sys
+import typing
+from typing import Any, ClassVar, Dict, ForwardRef, Union
+
+import typing_extensions
+from typing_extensions import get_args, get_origin
+
+from ..constants import CLASS_SPECIAL_WORDS
+
+LITERAL_TYPES = frozenset({typing_extensions.Literal, typing.Literal})
+
+
+def is_forward_ref(annotation: Any) -> bool:
+    """
+    Checks if an annotation, or any of its arguments, is a string
+    or a forward reference that needs to be resolved.
+    """
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if get_origin(annotation) in LITERAL_TYPES:
+        return False
+    return any(is_forward_ref(arg) for arg in get_args(annotation))
+
+
+def is_class_var(annotation: Any) -> bool:
+    """
+    Checks if an annotation, including string annotations, is a ClassVar.
+    """
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
+
+
+def resolve_annotation(
+    annotation: Any,
+    globalns: Union[Dict[str, Any], None] = None,
+    localns: Union[Dict[str, Any], None] = None,
+) -> Any:
+    """
+    Resolves the string annotations and forward references of a given
+    annotation, including the ones nested in its arguments.
+
+    Args:
+        annotation (Any): The annotation to resolve.
+        globalns (Dict[str, Any]): The globals of the module where the annotation was declared.
+        localns (Dict[str, Any]): The namespace of the class where the annotation was declared.
+
+    Raises:
+        NameError: When any of the names is not defined (yet).
+    """
+    if isinstance(annotation, str):
+        annotation = ForwardRef(annotation)
+    return typing._eval_type(annotation, globalns, localns)
+
+
+def get_module_namespace(obj: Any) -> Dict[str, Any]:
+    """
+    Returns the globals where a function or a class was declared.
+    """
+    obj = inspect.unwrap(obj)
+    if inspect.isclass(obj):
+        module = sys.modules.get(obj.__module__, None)
+        return getattr(module, "__dict__", {})
+    return getattr(obj, "__globals__", {})
+
+
+def get_class_namespace(cls: Any) -> Dict[str, Any]:
+    """
+    Returns the namespace of a class, including the class itself in order
+    to resolve the references to the class being declared.
+    """
+    namespace: Dict[str, Any] = dict(vars(cls))
+    namespace.setdefault(cls.__name__, cls)
+    return namespace
+
+
+def get_owner_namespace(signature: inspect.Signature, args: Any) -> Union[Dict[str, Any], None]:
+    """
+    Returns the class namespace of the object or class a method was called
+    with, when the method receives `self` or `cls`.
+    """
+    parameters = iter(signature.parameters)
+    if not args or next(parameters, None) not in CLASS_SPECIAL_WORDS:
+        return None
+    owner = args[0] if inspect.isclass(args[0]) else type(args[0])
+    return get_class_namespace(owner)
@@ -0,0 +1,100 @@
+"""
+The engines compiling the plans validating the calls of the functions and methods.
+
+The backend is selected per `Config` (or `polycheck`), by name or instance:
+
+- `python`: The built-in engine (default).
+- `pydantic-core`: Validates the arguments with a `SchemaValidator` of pydantic-core,
+    including the items of the containers. Requires pydantic-core to be installed.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, Union
+
+from ._internal._plan import CallPlan
+
+
+class Backend(ABC):
+    """
+    The interface of a validation backend, building the plan of each
+    function or method from its signature and PolyFields.
+
+    The plans are CallPlans, meaning the backends only change how the
+    arguments are validated, keeping the API and the errors of polyforce.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def build_plan(self, **options: Any) -> CallPlan:
+        """
+        Builds the plan of a function.
+
+        Args:
+            **options (Any): The options of the CallPlan, the `source`, `signature`,
+                `poly_fields`, `coerce`...
+        """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+
+class PythonBackend(Backend):
+    """
+    The built-in backend, checking the values with the predicates of polyforce.
+    """
+
+    name = "python"
+
+    def build_plan(self, **options: Any) -> CallPlan:
+        return CallPlan(**options)
+
+
+class PydanticCoreBackend(Backend):
+    """
+    The backend validating the arguments with pydantic-core, when installed.
+    """
+
+    name = "pydantic-core"
+
+    def build_plan(self, **options: Any) -> CallPlan:
+        from ._internal._pydantic_core import PydanticCorePlan, pydantic_core
+
+        if pydantic_core is None:
+            raise ImportError(
+                "The 'pydantic-core' backend requires pydantic-core to be installed."
+            )
+        return PydanticCorePlan(**options)
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend) -> Backend:
+    """
+    Registers a backend, making it available by name in the Config.
+    """
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+def get_backend(backend: Union[str, Backend, None] = None) -> Backend:
+    """
+    Returns the backend of a name or the given one, the default one when None.
+
+    Raises:
+        ValueError: When no backend is registered under the name.
+    """
+    if backend is None:
+        return DEFAULT_BACKEND
+    if isinstance(backend, Backend):
+        return backend
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"'{backend}' is not a valid backend, use one of {sorted(BACKENDS)}."
+        ) from None
+
+
+DEFAULT_BACKEND = register_backend(PythonBackend())
+register_backend(PydanticCoreBackend())
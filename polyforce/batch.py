@@ -0,0 +1,303 @@
+from array import array
+from inspect import Parameter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableSequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._internal._construction import construct_instance
+from ._internal._errors import ErrorDetail
+from ._internal._parallel import Parallel, get_executor
+from ._internal._plan import FieldPlan
+from .constants import INIT_FUNCTION
+from .exceptions import ValidationError
+
+try:
+    import numpy  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if TYPE_CHECKING:
+    from .main import PolyModel
+
+M = TypeVar("M", bound="PolyModel")
+
+ARRAY_TYPECODES = {int: "q", float: "d"}
+
+
+def as_list(values: Iterable[Any]) -> List[Any]:
+    """
+    Converts a column into a list of python objects, including
+    arrays and NumPy arrays.
+    """
+    tolist = getattr(values, "tolist", None)
+    if tolist is not None:
+        return tolist()  # type: ignore[no-any-return]
+    return list(values)
+
+
+def validate_column(
+    source: str, field: FieldPlan, values: List[Any], errors: List[ErrorDetail], start: int = 0
+) -> None:
+    """
+    Validates all the values of a column, replacing the ones coerced.
+
+    When the check is a plain `isinstance`, only one value of each distinct
+    type is checked. The rows of the errors start at `start`.
+    """
+    check = field.check
+
+    if field.predicate.classes is not None:
+        valid = {
+            kind: check(value) for kind, value in dict(zip(map(type, values), values)).items()
+        }
+        if all(valid.values()):
+            return
+        rows: Iterable[int] = [
+            index for index, value in enumerate(values) if not valid[type(value)]
+        ]
+    else:
+        rows = [index for index, value in enumerate(values) if not check(value)]
+
+    for index in rows:
+        try:
+            values[index] = field.validate(source, values[index])
+        except ValidationError as error:
+            errors.extend(ErrorDetail(**detail, row=start + index) for detail in error.errors())
+
+
+def validate_columns(
+    model: Type["PolyModel"], data: Dict[str, List[Any]], start: int = 0
+) -> Tuple[Union[Dict[str, List[Any]], None], List[ErrorDetail]]:
+    """
+    Validates the columns with the plan of the `__init__` of the model.
+
+    Also used by the workers of the parallel validation, with a chunk of the rows.
+
+    Returns:
+        Tuple: The columns, when the values may have been coerced, and the errors.
+    """
+    plan = model.__polymodel_plans__[INIT_FUNCTION]
+    errors: List[ErrorDetail] = []
+    if plan.ignore:
+        return None, errors
+
+    fields = plan.fields if plan.fields is not None else plan.compile()
+    for field in fields:
+        if field.name in data:
+            validate_column(plan.source, field, data[field.name], errors, start)
+    return (data if plan.coerce else None), errors
+
+
+def to_column(values: List[Any]) -> MutableSequence[Any]:
+    """
+    Stores the columns of ints or floats into a NumPy array, when available,
+    or into an `array.array`. The remaining columns are kept as lists.
+    """
+    kinds = set(map(type, values))
+    if len(kinds) != 1:
+        return values
+
+    typecode = ARRAY_TYPECODES.get(kinds.pop())
+    if typecode is None:
+        return values
+
+    try:
+        if numpy is not None:
+            return numpy.array(values, dtype=typecode)  # type: ignore[no-any-return]
+        return array(typecode, values)
+    except OverflowError:
+        return values
+
+
+class ModelBatch(Generic[M]):
+    """
+    Many instances of a PolyModel stored column-wise.
+
+    The columns are validated once against the parameters of the `__init__` of the
+    model and each instance is only created when its row is accessed.
+
+    Example:
+    ```
+    from polyforce import PolyModel
+
+    class Movie(PolyModel):
+        def __init__(self, name: str, year: int) -> None:
+            self.name = name
+            self.year = year
+
+    movies = Movie.batch({"name": ["Avengers", "Thor"], "year": [2012, 2011]})
+    movies[1]  # Movie(name='Thor', year=2011)
+    movies["year"]  # array('q', [2012, 2011])
+    ```
+    """
+
+    __slots__ = ("model", "columns", "length", "scalars")
+
+    def __init__(
+        self,
+        model: Type[M],
+        columns: Mapping[str, Iterable[Any]],
+        parallel: Parallel = None,
+        chunk_size: int = 100_000,
+    ) -> None:
+        """
+        Validates the columns and creates the batch.
+
+        Args:
+            model (Type[PolyModel]): The model of the rows.
+            columns (Mapping[str, Iterable[Any]]): The values of each parameter of the `__init__`.
+            parallel (Parallel): The number of processes, or an executor, validating the
+                chunks of rows in parallel.
+            chunk_size (int): The number of rows of each chunk validated in parallel.
+
+        Raises:
+            TypeError: When the columns do not match the parameters of the `__init__`.
+            ValueError: When the columns have different lengths.
+            ValidationError: When any of the values does not match the annotations.
+        """
+        self.model = model
+        data = {name: as_list(values) for name, values in columns.items()}
+        lengths = {len(values) for values in data.values()}
+        if len(lengths) > 1:
+            raise ValueError("All the columns must have the same length.")
+        self.length: int = lengths.pop() if lengths else 0
+
+        self.check_columns(data)
+        self.validate(data, parallel, chunk_size)
+
+        self.columns: Dict[str, MutableSequence[Any]] = {
+            name: to_column(values) for name, values in data.items()
+        }
+        self.scalars: Set[str] = {
+            name
+            for name, column in self.columns.items()
+            if numpy is not None and isinstance(column, numpy.ndarray)
+        }
+
+    def check_columns(self, data: Dict[str, List[Any]]) -> None:
+        """
+        Makes sure the columns are the parameters of the `__init__` of the model.
+        """
+        parameters = self.model.__signature__[INIT_FUNCTION].parameters
+        if not any(param.kind == Parameter.VAR_KEYWORD for param in parameters.values()):
+            for name in data:
+                if name not in parameters:
+                    raise TypeError(f"'{name}' is not a parameter of '{self.model.__name__}'.")
+
+        for name, param in parameters.items():
+            if (
+                param.default is Parameter.empty
+                and param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+                and name not in data
+            ):
+                raise TypeError(f"Missing the column of the required parameter '{name}'.")
+
+    def validate(
+        self, data: Dict[str, List[Any]], parallel: Parallel = None, chunk_size: int = 100_000
+    ) -> None:
+        """
+        Validates the columns with the plan of the `__init__` of the model, splitting
+        the rows into chunks validated by different processes when `parallel` is given.
+
+        Raises:
+            ValidationError: With the errors of all the rows, identified by the `row`.
+        """
+        if parallel is None or self.length <= chunk_size:
+            _, errors = validate_columns(self.model, data)
+        else:
+            errors = self.validate_parallel(data, parallel, chunk_size)
+
+        if errors:
+            errors.sort(key=lambda error: error["row"])
+            raise ValidationError.from_exception_data(errors)
+
+    def validate_parallel(
+        self, data: Dict[str, List[Any]], parallel: Parallel, chunk_size: int
+    ) -> List[ErrorDetail]:
+        """
+        Validates the chunks of rows in the worker processes, merging the
+        values coerced and the errors.
+        """
+        errors: List[ErrorDetail] = []
+        with get_executor(parallel) as executor:
+            futures = [
+                (
+                    start,
+                    executor.submit(
+                        validate_columns,
+                        self.model,
+                        {
+                            name: values[start : start + chunk_size]
+                            for name, values in data.items()
+                        },
+                        start,
+                    ),
+                )
+                for start in range(0, self.length, chunk_size)
+            ]
+            for start, future in futures:
+                chunk, chunk_errors = future.result()
+                errors.extend(chunk_errors)
+                if chunk is not None:
+                    for name, values in chunk.items():
+                        data[name][start : start + len(values)] = values
+        return errors
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Returns the values of a row by parameter name.
+        """
+        index = range(self.length)[index]
+        values = {name: column[index] for name, column in self.columns.items()}
+        for name in self.scalars:
+            values[name] = values[name].item()
+        return values
+
+    @overload
+    def __getitem__(self, index: int) -> M:
+        ...
+
+    @overload
+    def __getitem__(self, index: str) -> MutableSequence[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, str]) -> Union[M, MutableSequence[Any]]:
+        """
+        Returns the instance of the row with the given index or
+        the column with the given name.
+
+        The `Field` defaults of the parameters without a column are materialized
+        for each row, a factory building a new value every time.
+        """
+        if isinstance(index, str):
+            return self.columns[index]
+
+        values = self.row(index)
+        plan = self.model.__polymodel_plans__[INIT_FUNCTION]
+        if plan.defaults:
+            _, values = plan.fill_defaults((), values)
+        return construct_instance(self.model, values)  # type: ignore[no-any-return]
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(self.length):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}[{self.model.__name__}](rows={self.length})"
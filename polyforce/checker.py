@@ -0,0 +1,379 @@
+"""
+Static checker of the annotations of the functions decorated with `polycheck`
+and the methods of the `PolyModel` subclasses.
+
+The sources are parsed with `ast`, never imported, in a process pool, and the
+missing annotations, raised as `MissingAnnotation` and `ReturnSignatureMissing`
+at runtime, are reported along with the annotations polyforce cannot check.
+
+The modules passing the checks can be written to a manifest which, once loaded,
+lets the runtime skip the checks of the signatures of these modules.
+
+```shell
+python -m polyforce check myapp --manifest polyforce.json
+```
+"""
+import ast
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple, Union
+
+import orjson
+
+from ._internal._manifest import MANIFEST_VERSION, load_manifest, source_stamp
+from ._internal._parallel import chunked, get_executor
+from .constants import CLASS_SPECIAL_WORDS, INIT_FUNCTION
+
+__all__ = ["Issue", "ModuleReport", "check_paths", "check_source", "load_manifest"]
+
+POLYMODEL = "PolyModel"
+POLYCHECK = "polycheck"
+ANNOTATION_NODES = (
+    ast.Name,
+    ast.Attribute,
+    ast.Subscript,
+    ast.Constant,
+    ast.BinOp,
+    ast.Tuple,
+    ast.List,
+)
+
+
+class Issue(NamedTuple):
+    """
+    An annotation missing or not supported.
+    """
+
+    path: str
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.message}"
+
+
+class ModuleReport(NamedTuple):
+    """
+    The result of the checks of a module.
+
+    Attributes:
+        module: The name of the module.
+        path: The path of the source.
+        issues: The annotations missing or not supported of the decorated functions
+            and of the classes declaring PolyModel as base.
+        classes: The classes of the module by name, with the names of their bases, used
+            to find the subclasses of the PolyModel subclasses declared in other modules.
+        stamp: The size and modification time of the source when checked.
+    """
+
+    module: str
+    path: str
+    issues: List[Issue]
+    classes: Dict[str, Tuple[List[str], List[Issue]]]
+    stamp: Tuple[int, int]
+
+
+def get_name(node: ast.expr) -> str:
+    """
+    Returns the name of a decorator or a base, the last part of a dotted name.
+    """
+    if isinstance(node, ast.Call):
+        return get_name(node.func)
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Subscript):
+        return get_name(node.value)
+    return ""
+
+
+def check_annotation(path: str, node: ast.expr, name: str) -> Union[Issue, None]:
+    """
+    Checks an annotation is an expression polyforce can evaluate, for instance,
+    a string annotation with a valid expression.
+    """
+    line = node.lineno
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        try:
+            node = ast.parse(node.value, mode="eval").body
+        except SyntaxError:
+            return Issue(path, line, f"The annotation of '{name}' is not a valid expression.")
+
+    if not isinstance(node, ANNOTATION_NODES):
+        return Issue(path, line, f"The annotation of '{name}' is not supported.")
+    return None
+
+
+def check_function(
+    path: str, function: Union[ast.FunctionDef, ast.AsyncFunctionDef], skip: int = 0
+) -> Iterator[Issue]:
+    """
+    Checks the annotations of a function, the way the runtime does.
+
+    Args:
+        path (str): The path of the source.
+        function (ast.FunctionDef): The function.
+        skip (int): The number of leading positional parameters not checked, the `self`
+            of the methods of a PolyModel.
+    """
+    arguments = function.args
+    positional = [*arguments.posonlyargs, *arguments.args]
+    parameters = [
+        *positional[skip:],
+        *([arguments.vararg] if arguments.vararg else []),
+        *arguments.kwonlyargs,
+        *([arguments.kwarg] if arguments.kwarg else []),
+    ]
+
+    if function.returns is None:
+        yield Issue(path, function.lineno, f"Missing return annotation in '{function.name}'.")
+    else:
+        issue = check_annotation(path, function.returns, "return")
+        if issue is not None:
+            yield issue
+
+    for parameter in parameters:
+        if parameter.annotation is None:
+            if skip or parameter.arg not in CLASS_SPECIAL_WORDS:
+                yield Issue(
+                    path,
+                    parameter.lineno,
+                    f"'{parameter.arg}' of '{function.name}' is not typed.",
+                )
+            continue
+        issue = check_annotation(path, parameter.annotation, parameter.arg)
+        if issue is not None:
+            yield issue
+
+
+def is_polycheck(function: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
+    return any(get_name(decorator) == POLYCHECK for decorator in function.decorator_list)
+
+
+def ignores_checks(node: ast.ClassDef) -> bool:
+    """
+    Returns if the class declares `config = Config(ignore=True)`, in which case
+    the annotations of its methods are not checked.
+    """
+    for statement in node.body:
+        if (
+            isinstance(statement, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "config"
+                for target in statement.targets
+            )
+            and isinstance(statement.value, ast.Call)
+        ):
+            return any(
+                keyword.arg == "ignore"
+                and isinstance(keyword.value, ast.Constant)
+                and keyword.value.value is True
+                for keyword in statement.value.keywords
+            )
+    return False
+
+
+def check_class(path: str, node: ast.ClassDef) -> List[Issue]:
+    """
+    Checks the methods of a class, as if it were a PolyModel: the `__init__` and the
+    methods not starting and ending with double underscores.
+    """
+    if ignores_checks(node):
+        return []
+
+    issues: List[Issue] = []
+    for statement in node.body:
+        if not isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        name = statement.name
+        if name != INIT_FUNCTION and (name.startswith("__") or name.endswith("__")):
+            continue
+
+        decorators = {get_name(decorator) for decorator in statement.decorator_list}
+        if "property" in decorators or POLYCHECK in decorators:
+            # The functions decorated with polycheck are checked as such.
+            continue
+        skip = 0 if "staticmethod" in decorators else 1
+        issues.extend(check_function(path, statement, skip=skip))
+    return issues
+
+
+def check_source(
+    source: Union[str, bytes], path: str = "<unknown>", module: str = ""
+) -> ModuleReport:
+    """
+    Checks the functions decorated with `polycheck` and the classes of a source.
+
+    Returns:
+        ModuleReport: The issues of the decorated functions and of the classes declaring
+            `PolyModel` as base. The issues of the other classes are kept in the classes
+            of the report, for their bases to be resolved across the modules.
+    """
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError as error:
+        issue = Issue(path, error.lineno or 0, f"Invalid syntax: {error.msg}.")
+        return ModuleReport(module, path, [issue], {}, (0, 0))
+
+    issues: List[Issue] = []
+    classes: Dict[str, Tuple[List[str], List[Issue]]] = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and is_polycheck(node):
+            issues.extend(check_function(path, node))
+        elif isinstance(node, ast.ClassDef):
+            bases = [get_name(base) for base in node.bases]
+            class_issues = check_class(path, node)
+            if POLYMODEL in bases:
+                issues.extend(class_issues)
+                class_issues = []
+            classes[node.name] = (bases, class_issues)
+
+    return ModuleReport(module, path, issues, classes, (0, 0))
+
+
+def get_module_name(path: str) -> str:
+    """
+    Returns the dotted name of the module of a source, walking up the packages.
+    """
+    directory, filename = os.path.split(os.path.abspath(path))
+    name = os.path.splitext(filename)[0]
+    parts = [] if name == "__init__" else [name]
+
+    while os.path.isfile(os.path.join(directory, "__init__.py")):
+        directory, package = os.path.split(directory)
+        parts.insert(0, package)
+    return ".".join(parts)
+
+
+def check_file(path: str) -> ModuleReport:
+    """
+    Checks a source file.
+    """
+    with open(path, "rb") as file:
+        source = file.read()
+    report = check_source(source, path, get_module_name(path))
+    return report._replace(stamp=source_stamp(path))
+
+
+def check_files(paths: List[str]) -> List[ModuleReport]:
+    """
+    Checks a chunk of source files in a worker process.
+    """
+    return [check_file(path) for path in paths]
+
+
+def find_sources(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Finds the python sources of the given files, directories and packages.
+    """
+    for path in paths:
+        if not os.path.exists(path):
+            path = find_package(path)
+        if os.path.isfile(path):
+            yield path
+            continue
+        for root, directories, filenames in os.walk(path):
+            directories[:] = sorted(
+                name for name in directories if not name.startswith(".") and name != "__pycache__"
+            )
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    yield os.path.join(root, filename)
+
+
+def find_package(name: str) -> str:
+    """
+    Returns the directory (or file) of an importable package or module, without importing it.
+    """
+    from importlib.machinery import PathFinder
+
+    spec: Any = None
+    search: Any = None
+    for part in name.split("."):
+        spec = PathFinder.find_spec(part, search)
+        if spec is None:
+            raise FileNotFoundError(f"No file, directory or package named '{name}'.")
+        search = spec.submodule_search_locations
+
+    if search:
+        return str(list(search)[0])
+    return str(spec.origin)
+
+
+def resolve_subclasses(reports: List[ModuleReport]) -> List[ModuleReport]:
+    """
+    Adds to the reports the issues of the classes inheriting from a PolyModel subclass
+    declared in another module, matching the bases by name.
+    """
+    bases: Dict[str, List[str]] = {}
+    for report in reports:
+        for name, (class_bases, _) in report.classes.items():
+            bases.setdefault(name, []).extend(class_bases)
+
+    models: Set[str] = {POLYMODEL}
+    changed = True
+    while changed:
+        changed = False
+        for name, class_bases in bases.items():
+            if name not in models and models.intersection(class_bases):
+                models.add(name)
+                changed = True
+
+    return [
+        report._replace(
+            issues=report.issues
+            + [
+                issue
+                for name, (_, class_issues) in report.classes.items()
+                if name in models
+                for issue in class_issues
+            ]
+        )
+        for report in reports
+    ]
+
+
+def check_paths(
+    paths: Iterable[str],
+    parallel: Union[int, Executor, None] = None,
+    chunk_size: int = 50,
+) -> List[ModuleReport]:
+    """
+    Checks the sources of the given files, directories or packages, in a process pool.
+
+    Args:
+        paths (Iterable[str]): The files, directories or importable packages.
+        parallel (Union[int, Executor, None]): The number of processes, or an executor,
+            checking the chunks of files. By default, one process per CPU.
+        chunk_size (int): The number of files checked by each task.
+
+    Returns:
+        List[ModuleReport]: The reports of the modules, in the order of the files.
+    """
+    chunks = list(chunked(find_sources(paths), chunk_size))
+    if len(chunks) <= 1:
+        reports = [report for chunk in chunks for report in check_files(chunk)]
+    else:
+        with get_executor(parallel or os.cpu_count() or 1) as executor:
+            reports = [report for result in executor.map(check_files, chunks) for report in result]
+    return resolve_subclasses(reports)
+
+
+def write_manifest(path: str, reports: Iterable[ModuleReport]) -> Dict[str, Any]:
+    """
+    Writes the manifest of the modules without issues, identified by the
+    size and modification time of their sources.
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "modules": {
+            report.module: {"path": os.path.abspath(report.path), "stamp": list(report.stamp)}
+            for report in reports
+            if not report.issues and report.module
+        },
+    }
+    with open(path, "wb") as file:
+        file.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    return manifest
@@ -1,4 +1,8 @@
-from typing_extensions import Any, TypedDict
+from typing_extensions import Any, Dict, TypedDict, Union
+
+from .backends import Backend
+from .policy import Policy, PolicyMode
+from .reporting import ValidationMode
 
 
 class Config(TypedDict, total=False):
@@ -10,3 +14,48 @@ class Config(TypedDict, total=False):
     """
     Ignores the types for static validation.
     """
+    coerce: bool
+    """
+    Converts the values not matching the annotation when possible,
+    for instance, a `str` into an `int`.
+    """
+    slots: bool
+    """
+    Generates the `__slots__` of the class from the parameters of the `__init__`
+    and the declared attributes, removing the `__dict__` of the instances.
+    """
+    validate_assignment: bool
+    """
+    Validates the values assigned to the typed attributes of the instances.
+    """
+    frozen: bool
+    """
+    Makes the instances immutable once created, comparing and hashing them
+    by the values of their fields.
+    """
+    policies: Dict[str, Union[PolicyMode, Policy]]
+    """
+    The checking policy of the methods by name, a mode (`full`, `sampled`, `args`,
+    `return` or `off`) or a `Policy`.
+    """
+    boundary_only: bool
+    """
+    Only checks the outermost call of the methods of an instance, the calls made
+    by its checked methods to the others are not checked again.
+    """
+    backend: Union[str, Backend]
+    """
+    The backend validating the arguments of the methods, `python` (default),
+    `pydantic-core` or any registered one.
+    """
+    mode: ValidationMode
+    """
+    What happens when a check fails, `raise` a ValidationError (default) or
+    `warn`, reporting the failure in the background without raising.
+    """
+    overhead_budget: Union[float, None]
+    """
+    The time of the checks allowed, as a fraction of the time of the methods, for
+    instance, 0.02 for 2%. The rate of the calls checked of each method is lowered
+    when over the budget and raised again when the budget allows it.
+    """
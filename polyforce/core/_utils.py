@@ -6,8 +6,7 @@ from .._internal._representation import WithArgsTypes
 
 
 def is_annotated(ann_type: Any) -> bool:
-    origin = get_origin(ann_type)
-    return origin is not None and lenient_issubclass(origin, Annotated)
+    return get_origin(ann_type) is Annotated
 
 
 def lenient_issubclass(cls: Any, class_or_tuple: Any) -> bool:  # pragma: no cover
@@ -1,14 +1,21 @@
 import inspect
-from itertools import islice
-from typing import Any, Dict, List, Union, _SpecialForm
+from dataclasses import is_dataclass
+from functools import wraps
+from typing import Any, Dict, Tuple, Union
 
 from polyforce.constants import CLASS_SPECIAL_WORDS
-from polyforce.exceptions import MissingAnnotation, ReturnSignatureMissing, ValidationError
+from polyforce.exceptions import MissingAnnotation, ReturnSignatureMissing
 from polyforce.fields import PolyField
 
-from ._internal._errors import ErrorDetail
-from ._internal._serializer import json_serializable
+from ._internal._boundary import at_boundary, at_static_boundary
+from ._internal._dataclass import apply_dataclass_init, get_signature
+from ._internal._manifest import is_verified
+from ._internal._plan import CallPlan
+from ._internal._typing import get_class_namespace, get_module_namespace, get_owner_namespace
+from .backends import Backend, get_backend
 from .core._polyforce_core import PolyforceUndefined
+from .governor import Governor, clock, measured
+from .reporting import MODES, ValidationMode
 
 
 class polycheck:
@@ -17,6 +24,11 @@ class polycheck:
         signature: Union[inspect.Signature, None] = None,
         ignore: bool = False,
         ignored_types: Any = None,
+        coerce: bool = False,
+        boundary_only: bool = False,
+        backend: Union[str, Backend, None] = None,
+        mode: ValidationMode = "raise",
+        overhead_budget: Union[float, None] = None,
     ) -> None:
         """
         Initialize the PolyCheck decorator.
@@ -25,14 +37,34 @@ class polycheck:
             signature (bool): A signature previously generated.
             ignore (bool): If True, type checking is bypassed.
             ignored_types (Union[type, Tuple[type, ...]]): Types to be ignored during type checking.
+            coerce (bool): If True, the values not matching the annotation are converted when possible.
+            boundary_only (bool): If True, the calls made by the checked functions of the same
+                module (or, for methods, the same instance) are not checked again.
+            backend (Union[str, Backend, None]): The backend validating the arguments,
+                `python` (default) or `pydantic-core`.
+            mode (ValidationMode): If `warn`, the failures are reported in the background
+                instead of raising a ValidationError.
+            overhead_budget (Union[float, None]): If given, the time of the checks allowed as a
+                fraction of the time of the function, the rate of the calls checked being adapted
+                by a governor.
         """
         self.ignore = ignore
         self.ignored_types = tuple(ignored_types) if ignored_types is not None else ()
-        self.args_spec = None
+        self.coerce = coerce
+        self.boundary_only = boundary_only
+        self.backend = get_backend(backend)
+        if mode not in MODES:
+            raise ValueError(f"'{mode}' is not a valid mode, use one of {list(MODES)}.")
+        self.mode = mode
+        if overhead_budget is not None and not overhead_budget > 0:
+            raise ValueError("The overhead budget must be greater than 0.")
+        self.overhead_budget = overhead_budget
+        self.governor: Union[Governor, None] = None
+        self.args_spec: Union[inspect.Signature, None] = None
         self.signature = signature
         self.fn_name: str = None
-        self.is_class_or_object: bool = False
-        self.class_or_object: Any = None
+        self.fn: Any = None
+        self.plan: Union[CallPlan, None] = None
         self.poly_fields: Dict[str, Dict[str, PolyField]] = {}
 
     def check_signature(self, func: Any) -> Any:
@@ -71,7 +103,7 @@ class polycheck:
                 field = PolyField(**data)
             else:
                 field = parameter.default
-                field.annotation = parameter.annotation
+                field.annotation, field.metadata = field._extract_annotation(parameter.annotation)
                 field.name = parameter.name
                 field._validate_default_with_annotation()
 
@@ -83,117 +115,121 @@ class polycheck:
             self.poly_fields[self.fn_name].update(field_data)
         return self.poly_fields
 
-    def _extract_params(self) -> Dict[str, PolyField]:
+    def build_plan(self, fn: Any, *args: Any) -> CallPlan:
         """
-        Extracts the params based on the type function.
+        Builds the plan used to validate every call of the function.
 
-        If a function is of type staticmethod, means there is no `self`
-        or `cls` and therefore uses the signature or argspec generated.
+        The signature and the annotations are only checked once, the first time
+        the function is called. String annotations and forward references are
+        resolved with the globals of the function and, for methods, the namespace
+        of the class.
 
-        If a function is of type classmethod or a simple function in general,
-        then validates if is a class or an object and extracts the values.
+        Args:
+            fn (Any): The function being decorated.
+            *args (Any): The positional arguments of the first call.
 
         Returns:
-            Dict[str, PolyField]: A dictionary of function parameters.
+            CallPlan: The compiled plan.
         """
-        if not self.is_class_or_object:
-            return self.poly_fields[self.fn_name]
-
-        params: Dict[str, PolyField] = {}
-
-        # Get the function type (staticmethod, classmethod, or regular method)
-        func_type = getattr(self.class_or_object, self.fn_name)
-
-        if not isinstance(func_type, staticmethod):
-            if self.signature:
-                # If a signature is provided, use it to get function parameters
-                func_params = list(self.signature.parameters.values())
-            else:
-                # If no signature, use the poly_fields dictionary (modify as per your actual data structure)
-                func_params = list(
-                    islice(self.poly_fields.get(self.fn_name, {}).values(), 1, None)  # type: ignore[arg-type]
-                )
-            params = {param.name: param for param in func_params}
-        return params
+        if not is_verified(getattr(fn, "__module__", "")):
+            self.check_signature(fn)
+        self.generate_polyfields()
+
+        if inspect.isclass(fn):
+            localns = get_class_namespace(fn)
+        elif self.signature and args:
+            localns = get_class_namespace(type(args[0]))
+        else:
+            localns = get_owner_namespace(self.args_spec, args)
+
+        self.plan = self.backend.build_plan(
+            source=self.fn_name,
+            signature=self.args_spec,
+            poly_fields=self.poly_fields.get(self.fn_name, {}),
+            ignore=self.ignore,
+            ignored_types=self.ignored_types,
+            coerce=self.coerce,
+            globalns=get_module_namespace(fn),
+            warn=self.mode == "warn",
+            localns=localns,
+        )
+        return self.plan
+
+    def get_plan(self) -> CallPlan:
+        """
+        Returns the plan of the decorated function, building it when
+        the function was not called yet.
+        """
+        if self.plan is None:
+            return self.build_plan(self.fn)
+        return self.plan
 
-    def check_types(self, *args: Any, **kwargs: Any) -> Any:
+    def check_types(self, *args: Any, **kwargs: Any) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
         """
         Validate the types of function parameters.
 
         Args:
             *args (Any): Positional arguments.
             **kwargs (Any): Keyword arguments.
+
+        Returns:
+            Tuple: The positional and keyword arguments to call the function with.
         """
-        extracted_params = self._extract_params()
-        merged_params: Dict[str, Any] = {}
-
-        # Extracts any default value
-        for key, param in extracted_params.items():
-            if (
-                isinstance(param.default, PolyField)
-                and param.default.default != PolyforceUndefined
-            ):
-                merged_params[key] = param.default.get_default()
-
-        params = dict(zip(self._extract_params(), args))
-        params.update(kwargs)
-        params.update(merged_params)
-
-        for name, value in params.items():
-            field: PolyField = self.poly_fields[self.fn_name][name]
-            type_hint = field.annotation
-
-            if isinstance(value, PolyField):
-                if value.default is not None and value.default:
-                    value = value.default
-
-            if (
-                isinstance(type_hint, _SpecialForm)
-                or type_hint is Any
-                or type_hint in self.ignored_types
-            ):
-                continue
-
-            actual_type = self.get_actual_type(type_hint=type_hint)
-
-            if isinstance(actual_type, tuple):
-                if any(value == Any for value in actual_type):
-                    continue
-
-            if not isinstance(value, actual_type) and not self.ignore:
-                expected_value = (
-                    tuple(value.__name__ for value in actual_type)
-                    if isinstance(actual_type, tuple)
-                    else actual_type.__name__
-                )
-                error_message = (
-                    f"Expected '{expected_value}' for attribute '{name}', "
-                    f"but received type '{type(value).__name__}'."
-                )
-                error = ErrorDetail(
-                    source=self.fn_name,
-                    value=json_serializable(value),
-                    input=name,
-                    expected=expected_value,
-                    message=error_message,
-                )
-                raise ValidationError.from_exception_data([error])
-
-    def get_actual_type(self, type_hint: Any) -> Any:
-        """
-        Determine the actual type hint for a given parameter based on its value.
+        return self.plan.validate(args, kwargs)
 
-        Args:
-            type_hint (Any): The type hint for the parameter.
-            value (Any): The parameter's value.
+    def fill_defaults(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Materializes the `Field` defaults of the arguments missing, for the
+        calls not checked. With a signature, the arguments exclude the object.
+        """
+        plan = self.get_plan()
+        if not plan.defaults:
+            return args, kwargs
+        return plan.fill_defaults(args, kwargs)
+
+    def call_governed(
+        self, fn: Any, governor: Governor, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Calls the function, only checking the calls chosen by the governor, which
+        measures the checks and the function of the calls checked, awaiting the
+        coroutine of a coroutine function.
+        """
+        head: Tuple[Any, ...] = ()
+        if self.signature:
+            head, args = args[:1], args[1:]
+
+        if governor.skip():
+            args, kwargs = self.fill_defaults(args, kwargs)
+            return fn(*head, *args, **kwargs)
+
+        start = clock()
+        args, kwargs = self.check_types(*args, **kwargs)
+        called = clock()
+        if inspect.iscoroutinefunction(fn):
+            return measured(fn(*head, *args, **kwargs), governor.record, called - start)
+        value = fn(*head, *args, **kwargs)
+        governor.record(called - start, clock() - called)
+        return value
+
+    def decorate_dataclass(self, cls: Any) -> Any:
+        """
+        Replaces the `__init__` of a dataclass with one generated from its fields,
+        validating the arguments before running the original. The `default_factory`
+        and `__post_init__` of the dataclass are kept.
 
-        Returns:
-            Any: The actual type hint.
+        The class itself is returned, meaning `isinstance` and the subclasses are
+        not affected.
         """
-        origin = getattr(type_hint, "__origin__", type_hint)
-        if isinstance(origin, _SpecialForm):
-            origin = type_hint.__args__
-        return origin
+        cls.__polycheck__ = self
+        if self.ignore:
+            return cls
+
+        if self.signature is None:
+            self.args_spec = get_signature(cls)
+        return apply_dataclass_init(cls, self.build_plan(cls))
 
     def __call__(self, fn: Any) -> Any:
         """
@@ -205,8 +241,21 @@ class polycheck:
         Returns:
             Any: The decorated function.
         """
-        self.args_spec = self.signature or inspect.signature(fn)  # type: ignore
+        if isinstance(fn, (classmethod, staticmethod)):
+            return type(fn)(self(fn.__func__))
+
+        self.args_spec = self.signature or inspect.signature(fn)
         self.fn_name = fn.__name__
+        self.fn = fn
+
+        if inspect.isclass(fn) and is_dataclass(fn):
+            return self.decorate_dataclass(fn)
+
+        governor = None
+        if self.overhead_budget is not None and not self.ignore:
+            governor = self.governor = Governor(
+                f"{fn.__module__}.{fn.__qualname__}", budget=self.overhead_budget
+            )
 
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             """
@@ -215,23 +264,28 @@ class polycheck:
 
             When a signature is usually provided, the first argument is the class itself and therefore excluded.
             """
-            arguments: List[Any] = []
+            if self.plan is None:
+                self.build_plan(fn, *args)
 
-            # For the signature being passed and
-            # to cover the decorator inside a class
-            if self.signature or len(args) == 1:
-                arguments = list(args)
-                arguments = arguments[1:]
+            if governor is not None:
+                return self.call_governed(fn, governor, args, kwargs)
 
-                # Is a class or an object
-                self.is_class_or_object = True
-                self.class_or_object = args[0]
+            # For the signature being passed, the first argument
+            # is the object itself and not part of the signature.
+            if self.signature:
+                arguments, kwargs = self.check_types(*args[1:], **kwargs)
+                return fn(args[0], *arguments, **kwargs)
 
-            self.check_signature(fn)
-            self.generate_polyfields()
-            self.check_types(*arguments, **kwargs) if self.signature else self.check_types(
-                *args, **kwargs
-            )
+            args, kwargs = self.check_types(*args, **kwargs)
             return fn(*args, **kwargs)
 
+        if not inspect.isclass(fn):
+            if not self.boundary_only:
+                wrapper = wraps(fn)(wrapper)
+            elif self.signature:
+                wrapper = at_boundary(wrapper, fn, self.fill_defaults)
+            else:
+                # The functions of a module share their globals.
+                wrapper = at_static_boundary(wrapper, fn, fn.__globals__, self.fill_defaults)
+        wrapper.__polycheck__ = self
         return wrapper
@@ -3,7 +3,9 @@ from typing import Any, List, Union, cast, final
 
 import orjson
 
+from ._internal import _serializer
 from ._internal._errors import ErrorDetail
+from ._internal._serializer import ErrorLimits
 
 
 class PolyException(Exception):
@@ -48,6 +50,22 @@ class MissingAnnotation(PolyException):
         super().__init__(detail=detail)
 
 
+class FrozenInstanceError(PolyException, AttributeError):
+    detail: Union[
+        str, None
+    ] = "'{name}' cannot be assigned, the instances of '{model}' are frozen."
+
+    def __init__(self, name: str, model: str) -> None:
+        detail = self.detail.format(name=name, model=model)
+        super().__init__(detail=detail)
+
+
+class PolyforceWarning(UserWarning):
+    """
+    The warning of the checks failing with `mode="warn"`.
+    """
+
+
 @final
 class ValidationError(ValueError):
     @staticmethod
@@ -70,3 +88,45 @@ class ValidationError(ValueError):
         Same as errors but in json format.
         """
         return orjson.loads(json.dumps(self.errors()))
+
+
+def set_error_limits(
+    max_depth: Union[int, None] = None,
+    max_items: Union[int, None] = None,
+    max_string: Union[int, None] = None,
+    max_bytes: Union[int, None] = None,
+    type_only: Union[bool, None] = None,
+) -> ErrorLimits:
+    """
+    Sets the limits of the values kept in the errors, for the whole process.
+
+    The values over the limits are kept as their type, size and a truncated
+    preview, for instance, `{"type": "bytes", "size": 52428800, "preview": "b'...'"}`.
+    The limits not given are kept.
+
+    Args:
+        max_depth (Union[int, None]): The nesting of the containers kept (default 3).
+        max_items (Union[int, None]): The number of items kept of each container (default 20).
+        max_string (Union[int, None]): The number of characters kept of a string (default 1000).
+        max_bytes (Union[int, None]): The number of bytes kept of a `bytes` (default 100).
+        type_only (Union[bool, None]): Keeps only the type of the values (default False).
+
+    Returns:
+        ErrorLimits: The previous limits, which can be restored with `restore_error_limits`.
+    """
+    previous = _serializer.error_limits
+    _serializer.error_limits = previous.replace(
+        max_depth=max_depth,
+        max_items=max_items,
+        max_string=max_string,
+        max_bytes=max_bytes,
+        type_only=type_only,
+    )
+    return previous
+
+
+def restore_error_limits(limits: ErrorLimits) -> None:
+    """
+    Restores the limits returned by `set_error_limits`.
+    """
+    _serializer.error_limits = limits
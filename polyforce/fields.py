@@ -1,8 +1,10 @@
 from typing import TYPE_CHECKING, Any, Callable, List, Tuple, Type, TypedDict, Union
 
-from typing_extensions import Annotated, Self, Unpack, _SpecialForm, get_args
+from typing_extensions import Annotated, Self, Unpack, get_args
 
 from ._internal import _representation
+from ._internal._predicates import compile_predicate
+from ._internal._typing import is_forward_ref
 from .core import _utils
 from .core._polyforce_core import PolyforceUndefined
 
@@ -55,7 +57,6 @@ class PolyField(_representation.Representation):
         "name",
         "description",
         "metadata",
-        "_attributes_set",
     )
 
     annotation: Union[Type[Any], None]
@@ -70,7 +71,6 @@ class PolyField(_representation.Representation):
         """
         This class should generally not be initialized directly; instead, use the `polyforce.fields.Field` function.
         """
-        self._attributes_set = {k: v for k, v in kwargs.items() if v is not PolyforceUndefined}
         kwargs = {  # type: ignore
             k: _DefaultValues.get(k) if v is PolyforceUndefined else v for k, v in kwargs.items()
         }
@@ -96,35 +96,6 @@ class PolyField(_representation.Representation):
         if self.default and self.default != PolyforceUndefined and self.annotation:
             self._validate_default_with_annotation()
 
-    def _extract_type_hint(self, type_hint: Union[Type, tuple]) -> Any:
-        """
-        Extracts the base type from a type hint, considering typing extensions.
-
-        This function checks if the given type hint is a generic type hint and extracts
-        the base type. If not, it returns the original type hint.
-
-        Args:
-            type_hint (Union[Type, tuple]): The type hint to extract the base type from.
-
-        Returns:
-            Union[Type, tuple]: The base type of the type hint or the original type hint.
-
-        Example:
-        ```
-        from typing import List, Union
-
-        # Extract the base type from a List hint
-        base_type = extract_type_hint(List[int])  # Returns int
-
-        # If the hint is not a generic type, it returns the original hint
-        original_hint = extract_type_hint(Union[int, str])  # Returns Union[int, str]
-        ```
-        """
-        origin = getattr(type_hint, "__origin__", type_hint)
-        if isinstance(origin, _SpecialForm):
-            origin = type_hint.__args__  # type: ignore
-        return origin
-
     def _validate_default_with_annotation(self) -> None:
         """
         Validates if the default is allowed for the type of annotation
@@ -133,12 +104,16 @@ class PolyField(_representation.Representation):
         if not self.default or self.default == PolyforceUndefined:
             return None
 
+        # Validated once the annotation is resolved.
+        if is_forward_ref(self.annotation):
+            return None
+
         default = self.get_default()
 
-        type_hint = self._extract_type_hint(self.annotation)
-        if not isinstance(default, type_hint):
+        predicate = compile_predicate(self.annotation)
+        if predicate is not None and not predicate.check(default):
             raise TypeError(
-                f"default '{type(default).__name__}' for field '{self.name}' is not valid for the field type annotation, it must be type '{self.annotation.__name__}'"
+                f"default '{type(default).__name__}' for field '{self.name}' is not valid for the field type annotation, it must be type '{_representation.display_as_type(self.annotation)}'"
             )
         self.default = default
 
@@ -201,8 +176,6 @@ class PolyField(_representation.Representation):
         yield "required", self.is_required()
 
         for s in self.__slots__:
-            if s == "_attributes_set":
-                continue
             if s == "annotation":
                 continue
             elif s == "metadata" and not self.metadata:
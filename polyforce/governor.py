@@ -0,0 +1,257 @@
+"""
+The governors capping the cost of the checks, enabled with the `overhead_budget`
+of the Config or `polycheck`.
+
+Each checked callable has its own governor, measuring the time spent in the checks
+and in the function itself with the same clock, `time.perf_counter_ns`, on the calls
+checked. Every `window` calls checked, the overhead is estimated and the governor
+checks fewer calls when it is over the budget, or more when the budget allows it.
+
+The time of a coroutine function is measured until its coroutine completes, the
+time awaited, for instance, for I/O, counting as the time of the function.
+
+```python
+from polyforce import Config, PolyModel
+from polyforce.governor import get_rates
+
+
+class Movie(PolyModel):
+    config = Config(overhead_budget=0.02)
+
+
+get_rates()  # {"app.models.Movie.rate": 0.25, ...}
+```
+"""
+from functools import wraps
+from inspect import iscoroutinefunction
+from math import ceil
+from time import perf_counter_ns
+from typing import Any, Callable, Coroutine, Dict, Tuple, Union
+from weakref import WeakSet
+
+clock = perf_counter_ns
+"""
+The clock of all the measures of the governors.
+"""
+
+WINDOW = 64
+MAX_EVERY = 10_000
+
+Validate = Callable[[Tuple[Any, ...], Dict[str, Any]], Tuple[Tuple[Any, ...], Dict[str, Any]]]
+
+governors: "WeakSet[Governor]" = WeakSet()
+
+
+class Governor:
+    """
+    Adapts the rate of the calls checked of a callable to keep the time spent in the
+    checks under a fraction, the budget, of the time spent in the callable.
+
+    One every `every` calls is checked. The calls not checked only count down, the
+    others measure the checks and the call.
+    """
+
+    __slots__ = (
+        "name",
+        "budget",
+        "every",
+        "max_every",
+        "window",
+        "countdown",
+        "samples",
+        "check_ns",
+        "body_ns",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        budget: float = 0.02,
+        every: int = 1,
+        max_every: int = MAX_EVERY,
+        window: int = WINDOW,
+    ) -> None:
+        """
+        Args:
+            name (str): The qualified name of the callable.
+            budget (float): The time of the checks allowed, as a fraction of the time
+                of the callable, for instance, 0.02 for 2%.
+            every (int): One every `every` calls is checked at first.
+            max_every (int): The lowest rate, one every `max_every` calls.
+            window (int): The number of calls checked between two adjustments.
+        """
+        if not budget > 0:
+            raise ValueError("The overhead budget must be greater than 0.")
+
+        self.name = name
+        self.budget = budget
+        self.every = every
+        self.max_every = max_every
+        self.window = window
+        self.countdown = 1
+        self.samples = 0
+        self.check_ns = 0
+        self.body_ns = 0
+        governors.add(self)
+
+    @property
+    def rate(self) -> float:
+        """
+        The fraction of the calls checked.
+        """
+        return 1 / self.every
+
+    def skip(self) -> bool:
+        """
+        Counts a call, returning if it is not checked.
+        """
+        self.countdown -= 1
+        if self.countdown > 0:
+            return True
+        self.countdown = self.every
+        return False
+
+    def record(self, check_ns: int, body_ns: int) -> None:
+        """
+        Records the time of the checks and of the callable of a call checked.
+        """
+        self.check_ns += check_ns
+        self.body_ns += body_ns
+        self.samples += 1
+        if self.samples >= self.window:
+            self.adjust()
+
+    def adjust(self) -> None:
+        """
+        Adjusts the rate from the overhead measured in the window, the checks running
+        once every `every` calls of the callable.
+
+        Over the budget, the rate drops straight to the one meeting it. The rate is
+        doubled when the overhead would still be in the budget.
+        """
+        overhead = self.check_ns / (max(self.body_ns, 1) * self.every)
+        if overhead > self.budget:
+            self.every = min(self.max_every, ceil(self.every * overhead / self.budget))
+        elif overhead * 2 <= self.budget and self.every > 1:
+            self.every //= 2
+        self.samples = self.check_ns = self.body_ns = 0
+
+    def __repr__(self) -> str:
+        return f"Governor(name={self.name!r}, budget={self.budget}, rate={self.rate})"
+
+
+def get_rates() -> Dict[str, float]:
+    """
+    Returns the current rate of the calls checked of each governed callable.
+    """
+    return {governor.name: governor.rate for governor in list(governors)}
+
+
+async def measured(
+    coroutine: Coroutine[Any, Any, Any],
+    record: Callable[[int, int], None],
+    check_ns: int,
+    validate_return: Union[Callable[[Any], Any], None] = None,
+) -> Any:
+    """
+    Awaits the coroutine of a call checked, recording the time of the checks
+    and of the coroutine.
+    """
+    called = clock()
+    value = await coroutine
+    if validate_return is None:
+        end = clock()
+        record(check_ns, end - called)
+        return value
+
+    returned = clock()
+    value = validate_return(value)
+    record(check_ns + clock() - returned, returned - called)
+    return value
+
+
+def governed_function(
+    func: Callable[..., Any],
+    governor: Governor,
+    validate: Union[Validate, None],
+    validate_return: Union[Callable[[Any], Any], None] = None,
+    otherwise: Union[Validate, None] = None,
+) -> Callable[..., Any]:
+    """
+    Returns a function only running the checks on the calls chosen by the governor,
+    the other calls only running `otherwise`, when given.
+
+    The arguments of a coroutine function are checked by the call, its coroutine
+    being measured, and its return value checked, once awaited.
+    """
+    skip, record = governor.skip, governor.record
+    coroutine = iscoroutinefunction(func)
+
+    @wraps(func)
+    def governed_polycheck(*args: Any, **kwargs: Any) -> Any:
+        if skip():
+            if otherwise is not None:
+                args, kwargs = otherwise(args, kwargs)
+            return func(*args, **kwargs)
+
+        start = clock()
+        if validate is not None:
+            args, kwargs = validate(args, kwargs)
+        called = clock()
+        if coroutine:
+            return measured(func(*args, **kwargs), record, called - start, validate_return)
+        value = func(*args, **kwargs)
+        if validate_return is None:
+            end = clock()
+            record(called - start, end - called)
+            return value
+
+        returned = clock()
+        value = validate_return(value)
+        record(called - start + clock() - returned, returned - called)
+        return value
+
+    return governed_polycheck
+
+
+def governed_method(
+    func: Callable[..., Any],
+    governor: Governor,
+    validate: Union[Validate, None],
+    validate_return: Union[Callable[[Any], Any], None] = None,
+    otherwise: Union[Validate, None] = None,
+) -> Callable[..., Any]:
+    """
+    The `governed_function` of a method, the `self` or `cls` not being checked.
+    """
+    skip, record = governor.skip, governor.record
+    coroutine = iscoroutinefunction(func)
+
+    @wraps(func)
+    def governed_polycheck(__polymodel_self__: Any, *args: Any, **kwargs: Any) -> Any:
+        if skip():
+            if otherwise is not None:
+                args, kwargs = otherwise(args, kwargs)
+            return func(__polymodel_self__, *args, **kwargs)
+
+        start = clock()
+        if validate is not None:
+            args, kwargs = validate(args, kwargs)
+        called = clock()
+        if coroutine:
+            return measured(
+                func(__polymodel_self__, *args, **kwargs), record, called - start, validate_return
+            )
+        value = func(__polymodel_self__, *args, **kwargs)
+        if validate_return is None:
+            end = clock()
+            record(called - start, end - called)
+            return value
+
+        returned = clock()
+        value = validate_return(value)
+        record(called - start + clock() - returned, returned - called)
+        return value
+
+    return governed_polycheck
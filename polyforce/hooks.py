@@ -0,0 +1,229 @@
+"""
+Import hook applying `polycheck` to the functions and methods of selected packages
+as their modules are loaded.
+"""
+import inspect
+import re
+import sys
+from dataclasses import is_dataclass
+from fnmatch import translate
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+from .constants import INIT_FUNCTION
+from .decorator import polycheck
+from .exceptions import MissingAnnotation, ReturnSignatureMissing
+
+
+def compile_patterns(patterns: Iterable[str]) -> "Union[re.Pattern[str], None]":
+    """
+    Compiles the `fnmatch` patterns into a single regular expression.
+    """
+    expressions = [translate(pattern) for pattern in patterns]
+    if not expressions:
+        return None
+    return re.compile("|".join(f"(?:{expression})" for expression in expressions))
+
+
+class PolycheckLoader(Loader):
+    """
+    Loads a module with the original loader and applies `polycheck` to it.
+    """
+
+    def __init__(self, loader: Any, finder: "PolycheckFinder") -> None:
+        self.loader = loader
+        self.finder = finder
+
+    def create_module(self, spec: ModuleSpec) -> Union[ModuleType, None]:
+        return self.loader.create_module(spec)  # type: ignore[no-any-return]
+
+    def exec_module(self, module: ModuleType) -> None:
+        self.loader.exec_module(module)
+        self.finder.apply(module)
+
+    def __getattr__(self, name: str) -> Any:
+        # For instance, the `get_source` used by the tracebacks.
+        return getattr(self.loader, name)
+
+
+class PolycheckFinder(MetaPathFinder):
+    """
+    Finds the modules of the selected packages with the other finders, replacing
+    their loader to apply `polycheck` once the modules are executed.
+
+    The functions and the methods declared in the modules are decorated, except:
+
+    - The functions not fully annotated, which `polycheck` would reject.
+    - The functions already decorated and the PolyModels, already checked.
+    - The special methods, other than `__init__`, as for the PolyModels.
+
+    The dataclasses get the validating `__init__` of `polycheck`.
+    """
+
+    def __init__(
+        self,
+        packages: Sequence[str],
+        include: Iterable[str] = ("*",),
+        exclude: Iterable[str] = (),
+        **options: Any,
+    ) -> None:
+        """
+        Args:
+            packages (Sequence[str]): The packages, or modules, to check.
+            include (Iterable[str]): The `fnmatch` patterns of the qualified names, like
+                `myapp.services.*`, of the functions and methods to check.
+            exclude (Iterable[str]): The patterns of the qualified names not to check.
+            **options (Any): The options of `polycheck`, for instance, `coerce`.
+        """
+        self.packages = tuple(packages)
+        self.include = compile_patterns(include)
+        self.exclude = compile_patterns(exclude)
+        self.options = options
+        self.decorated: Dict[str, List[str]] = {}
+
+    def is_selected(self, fullname: str) -> bool:
+        return any(
+            fullname == package or fullname.startswith(f"{package}.") for package in self.packages
+        )
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Union[Sequence[str], None],
+        target: Union[ModuleType, None] = None,
+    ) -> Union[ModuleSpec, None]:
+        if not self.is_selected(fullname):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = PolycheckLoader(spec.loader, self)
+                return spec
+        return None
+
+    def accepts(self, name: str) -> bool:
+        """
+        Returns if a function or method, by qualified name, is to be checked.
+        """
+        if self.include is None or not self.include.match(name):
+            return False
+        return self.exclude is None or not self.exclude.match(name)
+
+    def decorate(self, function: Any) -> Any:
+        """
+        Returns the function decorated with `polycheck`, or None when not fully annotated.
+        """
+        func = function.__func__ if isinstance(function, (classmethod, staticmethod)) else function
+        if not inspect.isfunction(func) or hasattr(func, "__polycheck__"):
+            return None
+
+        decorator = polycheck(**self.options)
+        try:
+            decorator.check_signature(func)
+        except (MissingAnnotation, ReturnSignatureMissing):
+            return None
+        return decorator(function)
+
+    def apply(self, module: ModuleType) -> List[str]:
+        """
+        Applies `polycheck` to the functions and methods declared in a module.
+
+        Returns:
+            List[str]: The qualified names of the functions and methods decorated.
+        """
+        name = module.__name__
+        decorated: List[str] = []
+
+        for attribute, value in list(vars(module).items()):
+            if getattr(value, "__module__", None) != name:
+                continue
+
+            if inspect.isfunction(value):
+                qualname = f"{name}.{value.__qualname__}"
+                if self.accepts(qualname):
+                    wrapper = self.decorate(value)
+                    if wrapper is not None:
+                        setattr(module, attribute, wrapper)
+                        decorated.append(qualname)
+
+            elif inspect.isclass(value) and not hasattr(value, "__polymodel_plans__"):
+                decorated.extend(self.apply_class(name, value))
+
+        self.decorated[name] = decorated
+        return decorated
+
+    def apply_class(self, module: str, cls: type) -> List[str]:
+        """
+        Applies `polycheck` to the methods declared in a class.
+        """
+        decorated: List[str] = []
+        dataclass = is_dataclass(cls)
+
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("__") and attribute.endswith("__"):
+                if attribute != INIT_FUNCTION or dataclass:
+                    continue
+
+            qualname = f"{module}.{cls.__qualname__}.{attribute}"
+            if not self.accepts(qualname):
+                continue
+
+            wrapper = self.decorate(value)
+            if wrapper is not None:
+                setattr(cls, attribute, wrapper)
+                decorated.append(qualname)
+
+        init = f"{module}.{cls.__qualname__}.{INIT_FUNCTION}"
+        if dataclass and self.accepts(init) and not hasattr(cls, "__polycheck__"):
+            polycheck(**self.options)(cls)
+            decorated.append(init)
+        return decorated
+
+    def uninstall(self) -> None:
+        """
+        Removes the hook, the modules already loaded remaining checked.
+        """
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+def install_import_hook(
+    packages: Union[str, Sequence[str]],
+    include: Iterable[str] = ("*",),
+    exclude: Iterable[str] = (),
+    **options: Any,
+) -> PolycheckFinder:
+    """
+    Installs an import hook applying `polycheck` to the functions and methods of the
+    given packages, as their modules are imported. The modules already imported are
+    not affected.
+
+    Example:
+    ```
+    from polyforce import install_import_hook
+
+    install_import_hook(["myapp.services"], exclude=["*._*", "myapp.services.legacy.*"])
+    ```
+
+    Args:
+        packages (Union[str, Sequence[str]]): The packages, or modules, to check.
+        include (Iterable[str]): The `fnmatch` patterns of the qualified names, like
+            `myapp.services.*`, of the functions and methods to check.
+        exclude (Iterable[str]): The patterns of the qualified names not to check.
+        **options (Any): The options of `polycheck`, for instance, `coerce`.
+
+    Returns:
+        PolycheckFinder: The hook, which can be uninstalled.
+    """
+    if isinstance(packages, str):
+        packages = [packages]
+
+    finder = PolycheckFinder(packages, include=include, exclude=exclude, **options)
+    sys.meta_path.insert(0, finder)
+    return finder
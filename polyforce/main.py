@@ -1,12 +1,33 @@
-from inspect import Signature
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    ChainMap,
+    ClassVar,
+    Dict,
+    Iterable,
+    Mapping,
+    Set,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import Self
 
 from ._internal import _construction, _representation
+from ._internal._frozen import initialising
+from ._internal._plan import CallPlan
+from ._internal._serializer import model_data, model_to_json, to_builtins
+from .batch import ModelBatch
 from .config import Config
-from .constants import SPECIAL_CHECK
+from .exceptions import FrozenInstanceError
 from .fields import PolyField
 
 if TYPE_CHECKING:
+    from inspect import Signature
+
+    from ._internal._config import ConfigWrapper
+    from ._internal._parallel import Parallel
     from ._internal._representation import ReprArgs
 
 _object_setattr = _construction.object_setattr
@@ -28,16 +49,28 @@ class PolyModel(metaclass=_construction.PolyMetaclass):
     ```
 
     Attributes:
-        __signature__ (ClassVar[Dict[str, Signature]]): Dictionary containing method signatures.
+        __signature__ (ClassVar[ChainMap[str, Signature]]): Dictionary containing method signatures.
     """
 
     if TYPE_CHECKING:
         config: ClassVar[Config]
-        poly_fields: ClassVar[Dict[str, Dict[str, PolyField]]]
+        poly_fields: ClassVar[ChainMap[str, Dict[str, PolyField]]]
+        __signature__: ClassVar[ChainMap[str, Signature]]
         __class_vars__: ClassVar[Set[str]]
         __polymodel_custom_init__: ClassVar[bool]
+        __polymodel_plans__: ClassVar[ChainMap[str, CallPlan]]
+        __polymodel_slots__: ClassVar[Tuple[str, ...]]
+        __polymodel_fields__: ClassVar[Tuple[str, ...]]
+        __polymodel_serializers__: ClassVar[Dict[Tuple[Any, Any], Tuple[Any, ...]]]
+        __polymodel_frozen__: ClassVar[bool]
+        __polymodel_config__: ClassVar[ConfigWrapper]
     else:
         poly_fields = {}
+        __polymodel_slots__ = ()
+        __polymodel_fields__ = ()
+        __polymodel_frozen__ = False
+
+    __slots__ = ()
 
     config = Config()
 
@@ -47,6 +80,9 @@ class PolyModel(metaclass=_construction.PolyMetaclass):
     __init__.__polymodel_base_init__ = True
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if self.__polymodel_frozen__ and initialising.get() is not self:
+            raise FrozenInstanceError(name=name, model=self.__class__.__name__)
+
         if name in self.__class_vars__:
             raise AttributeError(
                 f"{name!r} is a ClassVar of `{self.__class__.__name__}` and cannot be set on an instance. "
@@ -58,36 +94,78 @@ class PolyModel(metaclass=_construction.PolyMetaclass):
 
         _object_setattr(self, name, value)
 
-    def __getattribute__(self, name: str) -> Any:
+    def __delattr__(self, name: str) -> None:
+        if self.__polymodel_frozen__ and initialising.get() is not self:
+            raise FrozenInstanceError(name=name, model=self.__class__.__name__)
+        object.__delattr__(self, name)
+
+    @classmethod
+    def batch(
+        cls,
+        columns: Mapping[str, Iterable[Any]],
+        parallel: "Parallel" = None,
+        chunk_size: int = 100_000,
+    ) -> "ModelBatch[Self]":
         """
-        Get an attribute with static type checking.
+        Creates a batch of instances stored column-wise.
+
+        Each column is validated once and the instances are only created when
+        their rows are accessed.
 
         Args:
-            name (str): The name of the attribute to access.
+            columns (Mapping[str, Iterable[Any]]): The values of each parameter of the `__init__`.
+            parallel (Parallel): The number of processes, or an executor, validating the
+                chunks of rows in parallel.
+            chunk_size (int): The number of rows of each chunk validated in parallel.
+        """
+        return ModelBatch(cls, columns, parallel=parallel, chunk_size=chunk_size)
+
+    def to_dict(
+        self,
+        include: Union[AbstractSet[str], None] = None,
+        exclude: Union[AbstractSet[str], None] = None,
+    ) -> Dict[str, Any]:
+        """
+        Returns the fields of the model as a dictionary, the nested models
+        being converted as well.
+
+        The fields are the parameters of the `__init__` followed by the attributes
+        declared in the class. The ones not set are skipped.
+
+        Args:
+            include (Union[AbstractSet[str], None]): The only fields to include.
+            exclude (Union[AbstractSet[str], None]): The fields to exclude.
+        """
+        data = model_data(self, *_compile_fields(include, exclude))
+        return {name: to_builtins(value) for name, value in data.items()}
+
+    def to_json_bytes(
+        self,
+        include: Union[AbstractSet[str], None] = None,
+        exclude: Union[AbstractSet[str], None] = None,
+    ) -> bytes:
+        """
+        Serializes the fields of the model into json bytes using orjson.
 
-        Returns:
-            Any: The value of the attribute.
+        Args:
+            include (Union[AbstractSet[str], None]): The only fields to include.
+            exclude (Union[AbstractSet[str], None]): The fields to exclude.
+        """
+        return model_to_json(self, *_compile_fields(include, exclude))
 
-        Raises:
-            AttributeError: If the attribute does not exist.
+    def to_json(
+        self,
+        include: Union[AbstractSet[str], None] = None,
+        exclude: Union[AbstractSet[str], None] = None,
+    ) -> str:
+        """
+        Serializes the fields of the model into a json string.
 
-        Example:
-        ```
-        obj = MyObject(42)
-        value = obj.value  # Accessing the 'value' attribute
-        ```
+        Args:
+            include (Union[AbstractSet[str], None]): The only fields to include.
+            exclude (Union[AbstractSet[str], None]): The fields to exclude.
         """
-        try:
-            func = super().__getattribute__(name)
-            __signature__: Dict[str, Any] = super().__getattribute__("__signature__")
-            signature: Union[Signature, None] = __signature__.get(name, None)
-
-            if signature is not None and name not in SPECIAL_CHECK:
-                return self.__class__._add_static_type_checking(func, signature)
-            else:
-                return func
-        except (KeyError, AttributeError):
-            return super().__getattribute__(name)
+        return self.to_json_bytes(include, exclude).decode()
 
     __repr_name__ = _representation.Representation.__repr_name__
     __repr_str__ = _representation.Representation.__repr_str__
@@ -95,9 +173,13 @@ class PolyModel(metaclass=_construction.PolyMetaclass):
     __rich_repr__ = _representation.Representation.__rich_repr__
 
     def __repr_args__(self) -> "ReprArgs":
-        for k, v in self.__dict__.items():
-            field = self.__dict__.get(k)
-            if field:
+        for k in self.__polymodel_slots__:
+            v = getattr(self, k, None)
+            if v:
+                yield k, v
+
+        for k, v in getattr(self, "__dict__", {}).items():
+            if v:
                 yield k, v
 
     def __str__(self) -> str:
@@ -105,3 +187,15 @@ class PolyModel(metaclass=_construction.PolyMetaclass):
 
     def __repr__(self) -> str:
         return f'{self.__repr_name__()}({self.__repr_str__(", ")})'  # type: ignore
+
+
+def _compile_fields(
+    include: Union[AbstractSet[str], None], exclude: Union[AbstractSet[str], None]
+) -> Tuple[Union[frozenset, None], Union[frozenset, None]]:
+    """
+    Converts the include and exclude into the hashable keys of the compiled fields.
+    """
+    return (
+        None if include is None else frozenset(include),
+        None if exclude is None else frozenset(exclude),
+    )
@@ -0,0 +1,201 @@
+"""
+Module-wide enforcement of the annotations with `sys.monitoring` (PEP 669, Python 3.12+).
+
+The functions of the enforced modules are neither decorated nor wrapped. Instead, the
+`PY_START` event of their code objects is monitored and the arguments are checked,
+with the same compiled plans as `polycheck`, when the functions start.
+"""
+import importlib
+import inspect
+import pkgutil
+import sys
+from types import CodeType, ModuleType
+from typing import Any, Dict, Iterator, Union
+
+from ._internal._plan import CallPlan
+from .decorator import polycheck
+from .exceptions import MissingAnnotation, ReturnSignatureMissing
+
+TOOL_NAME = "polyforce"
+
+
+def get_functions(module: ModuleType) -> Iterator[Any]:
+    """
+    Returns the functions declared in a module, including the methods of its classes.
+    """
+    for value in vars(module).values():
+        if inspect.isfunction(value) and value.__module__ == module.__name__:
+            yield value
+        elif inspect.isclass(value) and value.__module__ == module.__name__:
+            if hasattr(value, "__polymodel_plans__"):
+                # The methods of a PolyModel are already checked.
+                continue
+            for attribute in vars(value).values():
+                if isinstance(attribute, (classmethod, staticmethod)):
+                    attribute = attribute.__func__
+                if inspect.isfunction(attribute):
+                    yield attribute
+
+
+def get_modules(target: Union[str, ModuleType]) -> Iterator[ModuleType]:
+    """
+    Returns a module or a package with all its modules, imported.
+    """
+    module = importlib.import_module(target) if isinstance(target, str) else target
+    yield module
+
+    path = getattr(module, "__path__", None)
+    if path is not None:
+        for info in pkgutil.walk_packages(path, prefix=f"{module.__name__}."):
+            yield importlib.import_module(info.name)
+
+
+class Enforcer:
+    """
+    Checks the arguments of the monitored functions when they start.
+
+    Each function can be monitored for a number of calls only, its event being
+    disabled (`sys.monitoring.DISABLE`) once sampled enough, or turned off at any time.
+    """
+
+    def __init__(self) -> None:
+        self.monitoring: Any = getattr(sys, "monitoring", None)
+        if self.monitoring is None:
+            raise RuntimeError("The enforcement with 'sys.monitoring' requires Python 3.12+.")
+
+        self.tool = self.get_tool_id()
+        self.plans: Dict[CodeType, CallPlan] = {}
+        self.samples: Dict[CodeType, int] = {}
+        self.active = True
+
+        self.monitoring.use_tool_id(self.tool, TOOL_NAME)
+        self.monitoring.register_callback(
+            self.tool, self.monitoring.events.PY_START, self.on_start
+        )
+
+    def get_tool_id(self) -> int:
+        """
+        Returns the first tool id not used, starting by the ones not reserved.
+        """
+        monitoring = self.monitoring
+        for tool in (3, 4, monitoring.OPTIMIZER_ID, monitoring.PROFILER_ID):
+            if monitoring.get_tool(tool) is None:
+                return int(tool)
+        raise RuntimeError("All the tool ids of 'sys.monitoring' are in use.")
+
+    def add(self, function: Any, sample: Union[int, None] = None) -> bool:
+        """
+        Monitors a function, the functions not fully annotated being skipped.
+
+        The code of a function decorated with `functools.wraps` is the one of the
+        wrapper, shared by all the functions it decorates, meaning the original
+        function (`__wrapped__`) is monitored instead. The functions decorated with
+        `polycheck` are already checked and skipped.
+
+        Args:
+            function (Any): The function.
+            sample (Union[int, None]): The number of calls checked before the function
+                is no longer monitored. All the calls when None.
+
+        Returns:
+            bool: If the function is monitored.
+        """
+        if hasattr(function, "__polycheck__"):
+            return False
+        function = inspect.unwrap(function)
+        code = function.__code__
+        if code in self.plans:
+            return True
+
+        decorator = polycheck()
+        decorator(function)
+        try:
+            plan = decorator.get_plan()
+        except (MissingAnnotation, ReturnSignatureMissing):
+            return False
+
+        self.plans[code] = plan
+        if sample is not None:
+            self.samples[code] = sample
+        self.monitoring.set_local_events(self.tool, code, self.monitoring.events.PY_START)
+        return True
+
+    def disable(self, function: Any) -> None:
+        """
+        Stops monitoring a function, for instance, a function found to be hot.
+        """
+        code = inspect.unwrap(function).__code__
+        self.monitoring.set_local_events(self.tool, code, 0)
+        self.plans.pop(code, None)
+        self.samples.pop(code, None)
+
+    def on_start(self, code: CodeType, offset: int) -> Any:
+        plan = self.plans.get(code)
+        if plan is None:
+            return self.monitoring.DISABLE
+
+        sample = self.samples.get(code)
+        if sample is not None:
+            if sample <= 0:
+                return self.monitoring.DISABLE
+            self.samples[code] = sample - 1
+
+        fields = plan.fields if plan.fields is not None else plan.compile()
+        if fields:
+            # The frame of the function starting, with the arguments as locals.
+            plan.validate_arguments(fields, sys._getframe(1).f_locals)
+
+        if sample == 1:
+            # Sampled enough, the event of the function is disabled.
+            return self.monitoring.DISABLE
+        return None
+
+    def stop(self) -> None:
+        """
+        Stops monitoring all the functions and frees the tool id.
+        """
+        self.monitoring.register_callback(self.tool, self.monitoring.events.PY_START, None)
+        self.monitoring.free_tool_id(self.tool)
+        self.active = False
+        self.plans.clear()
+        self.samples.clear()
+
+
+enforcer: Union[Enforcer, None] = None
+
+
+def enforce(target: Union[str, ModuleType], sample: Union[int, None] = None) -> Enforcer:
+    """
+    Checks the arguments of the annotated functions of a module, or of all the modules
+    of a package, without decorating them.
+
+    The functions and methods declared in the modules when enforced and fully annotated
+    are checked. The PolyModels, already checked, are skipped.
+
+    Example:
+    ```
+    import polyforce
+
+    enforcer = polyforce.enforce("myapp.services", sample=1000)
+    enforcer.disable(myapp.services.hot_function)
+    ```
+
+    Args:
+        target (Union[str, ModuleType]): The module or package, or its name.
+        sample (Union[int, None]): The number of calls of each function checked before
+            the function is no longer monitored. All the calls when None.
+
+    Returns:
+        Enforcer: The enforcer monitoring the functions.
+
+    Raises:
+        RuntimeError: With Python versions before 3.12.
+    """
+    global enforcer
+    if enforcer is None or not enforcer.active:
+        enforcer = Enforcer()
+
+    for module in get_modules(target):
+        for function in get_functions(module):
+            enforcer.add(function, sample=sample)
+    return enforcer
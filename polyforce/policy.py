@@ -0,0 +1,137 @@
+from itertools import count
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Tuple, TypeVar, Union
+
+from typing_extensions import Literal, get_args
+
+PolicyMode = Literal["full", "sampled", "args", "return", "off"]
+"""
+How the calls of a method are checked:
+
+- `full`: The arguments and the return value.
+- `sampled`: The arguments of one every `sample` calls.
+- `args`: The arguments (default).
+- `return`: The return value.
+- `off`: Nothing, the method is not wrapped.
+"""
+MODES: FrozenSet[str] = frozenset(get_args(PolicyMode))
+
+F = TypeVar("F")
+Validate = Callable[[Tuple[Any, ...], Dict[str, Any]], Tuple[Tuple[Any, ...], Dict[str, Any]]]
+
+
+class Policy:
+    """
+    The checking policy of a method of a PolyModel, baked into the plan
+    and the wrapper of the method when the class is created.
+
+    Example:
+    ```
+    from polyforce import Config, Policy, PolyModel
+
+    class Movie(PolyModel):
+        config = Config(policies={"rank": "off", "search": Policy("full", trusted=("query",))})
+    ```
+    """
+
+    __slots__ = ("mode", "trusted", "sample")
+
+    def __init__(self, mode: PolicyMode = "args", trusted: Iterable[str] = (), sample: int = 100):
+        """
+        Args:
+            mode (PolicyMode): How the calls are checked.
+            trusted (Iterable[str]): The parameters never checked.
+            sample (int): With the `sampled` mode, the arguments are checked once every
+                `sample` calls.
+        """
+        if mode not in MODES:
+            raise ValueError(f"'{mode}' is not a valid policy, use one of {sorted(MODES)}.")
+        if sample < 1:
+            raise ValueError("The 'sample' of a policy must be greater than 0.")
+
+        self.mode = mode
+        self.trusted: FrozenSet[str] = frozenset(trusted)
+        self.sample = sample
+
+    @property
+    def checks_arguments(self) -> bool:
+        return self.mode in ("full", "sampled", "args")
+
+    @property
+    def checks_return(self) -> bool:
+        return self.mode in ("full", "return")
+
+    @classmethod
+    def from_value(cls, value: Union[str, "Policy"]) -> "Policy":
+        """
+        Returns the policy of a value of the `policies` of the Config, a policy or a mode.
+        """
+        if isinstance(value, Policy):
+            return value
+        return cls(value)  # type: ignore[arg-type]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Policy):
+            return NotImplemented
+        return (self.mode, self.trusted, self.sample) == (other.mode, other.trusted, other.sample)
+
+    def __hash__(self) -> int:
+        return hash((self.mode, self.trusted, self.sample))
+
+    def __repr__(self) -> str:
+        return (
+            f"Policy(mode={self.mode!r}, trusted={sorted(self.trusted)!r}, sample={self.sample})"
+        )
+
+
+DEFAULT_POLICY = Policy()
+
+
+def policy(
+    mode: PolicyMode = "args", *, trusted: Iterable[str] = (), sample: int = 100
+) -> Callable[[F], F]:
+    """
+    Marks the checking policy of a method of a PolyModel, taking precedence
+    over the `policies` of the Config.
+
+    Example:
+    ```
+    from polyforce import PolyModel, policy
+
+    class Movie(PolyModel):
+        @policy("off")
+        def rank(self, score: float) -> float:
+            ...
+    ```
+
+    Args:
+        mode (PolicyMode): How the calls are checked.
+        trusted (Iterable[str]): The parameters never checked.
+        sample (int): With the `sampled` mode, the arguments are checked once every `sample` calls.
+    """
+    marker = Policy(mode, trusted=trusted, sample=sample)
+
+    def decorator(func: F) -> F:
+        target = func.__func__ if isinstance(func, (classmethod, staticmethod)) else func
+        target.__polymodel_policy__ = marker  # type: ignore[union-attr]
+        return func
+
+    return decorator
+
+
+def sampled(validate: Validate, every: int, otherwise: Union[Validate, None] = None) -> Validate:
+    """
+    Returns a validation only running once every given number of calls, the
+    other calls only running `otherwise`, when given.
+    """
+    counter = count()
+
+    def sampled_validate(
+        args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        if next(counter) % every:
+            if otherwise is not None:
+                return otherwise(args, kwargs)
+            return args, kwargs
+        return validate(args, kwargs)
+
+    return sampled_validate
@@ -0,0 +1,242 @@
+"""
+The reporting of the failures of the checks running with `mode="warn"`.
+
+The checks failing do not raise. Instead, a tiny record, the source, the parameter
+and the type of the value, is pushed onto a bounded queue, the records pushed when
+the queue is full being dropped and counted. A background thread aggregates the
+records, deduplicates them and emits them, with `logging` by default.
+
+```python
+from polyforce import Config, PolyModel
+from polyforce.reporting import Reporter, set_reporter, warn_failure
+
+set_reporter(Reporter(handler=warn_failure, interval=5.0))
+
+
+class Movie(PolyModel):
+    config = Config(mode="warn")
+```
+"""
+import atexit
+import logging
+import threading
+import warnings
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple, Set, Tuple, Union
+
+from typing_extensions import Literal
+
+from .exceptions import PolyforceWarning
+
+ValidationMode = Literal["raise", "warn"]
+"""
+What happens when a check fails:
+
+- `raise`: A `ValidationError` is raised (default).
+- `warn`: The failure is reported in the background and the call goes on.
+"""
+MODES = ("raise", "warn")
+
+logger = logging.getLogger("polyforce")
+
+Record = Tuple[str, str, type]
+
+
+class Failure(NamedTuple):
+    """
+    A check that failed.
+
+    Attributes:
+        source: The function or class checked.
+        input: The name of the parameter, or `return`.
+        type: The type of the value received.
+    """
+
+    source: str
+    input: str
+    type: type
+
+    def __str__(self) -> str:
+        return (
+            f"Invalid value of type '{self.type.__name__}' "
+            f"for attribute '{self.input}' of '{self.source}'."
+        )
+
+
+Handler = Callable[[Failure, int], Any]
+
+
+def log_failure(failure: Failure, count: int) -> None:
+    """
+    Logs a failure with the `polyforce` logger.
+    """
+    logger.warning("%s (%d times)", failure, count)
+
+
+def warn_failure(failure: Failure, count: int) -> None:
+    """
+    Emits a failure as a `PolyforceWarning`.
+    """
+    warnings.warn(f"{failure} ({count} times)", PolyforceWarning, stacklevel=2)
+
+
+class Reporter:
+    """
+    Collects the failures of the checks and emits them from a background thread.
+
+    Pushing a failure only appends a tuple to a `deque`, which is thread-safe, and
+    never blocks: when the queue is full, the failure is dropped and counted.
+    """
+
+    def __init__(
+        self,
+        handler: Handler = log_failure,
+        interval: float = 1.0,
+        maxsize: int = 10_000,
+        deduplicate: bool = True,
+    ) -> None:
+        """
+        Args:
+            handler (Handler): Called with each failure and the number of times it occurred
+                since the last flush, for instance, `log_failure` (default) or `warn_failure`.
+            interval (float): The seconds between two flushes of the background thread.
+            maxsize (int): The number of failures queued, the others being dropped.
+            deduplicate (bool): If True, the handler is only called the first time a failure
+                occurs, the following ones being counted only.
+        """
+        self.handler = handler
+        self.interval = interval
+        self.maxsize = maxsize
+        self.deduplicate = deduplicate
+        self.queue: Deque[Record] = deque()
+        self.counts: Dict[Failure, int] = {}
+        self.seen: Set[Failure] = set()
+        self.dropped = 0
+        self.reported_dropped = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread: Union[threading.Thread, None] = None
+
+    def push(self, record: Record) -> None:
+        """
+        Queues a failure, called by the checks.
+        """
+        if len(self.queue) >= self.maxsize:
+            self.dropped += 1
+            return
+        self.queue.append(record)
+        if self.thread is None:
+            self.start()
+
+    def flush(self) -> Dict[Failure, int]:
+        """
+        Aggregates the failures queued and emits them.
+
+        Returns:
+            Dict[Failure, int]: The failures emptied from the queue, with their count.
+        """
+        with self.lock:
+            counts: Dict[Failure, int] = {}
+            queue = self.queue
+            while True:
+                try:
+                    failure = Failure(*queue.popleft())
+                except IndexError:
+                    break
+                counts[failure] = counts.get(failure, 0) + 1
+
+            for failure, count in counts.items():
+                self.counts[failure] = self.counts.get(failure, 0) + count
+                if self.deduplicate and failure in self.seen:
+                    continue
+                self.seen.add(failure)
+                try:
+                    self.handler(failure, count)
+                except Exception:  # pragma: no cover
+                    logger.exception("The handler of the failures raised an exception.")
+
+            dropped = self.dropped
+            if dropped > self.reported_dropped:
+                logger.warning(
+                    "%d failures dropped, the queue of the reporter being full.",
+                    dropped - self.reported_dropped,
+                )
+                self.reported_dropped = dropped
+        return counts
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def start(self) -> None:
+        """
+        Starts the background thread, done on the first failure pushed.
+
+        The reporter of the process is stopped at exit, the handler being
+        registered once.
+        """
+        global exit_registered
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, name="polyforce-reporter", daemon=True)
+            self.thread.start()
+            if not exit_registered:
+                atexit.register(stop_reporter)
+                exit_registered = True
+
+    def stop(self) -> None:
+        """
+        Stops the background thread, emitting the failures queued.
+        """
+        self.stopped.set()
+        thread = self.thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.thread = None
+        self.flush()
+
+
+reporter: Union[Reporter, None] = None
+exit_registered = False
+
+
+def get_reporter() -> Reporter:
+    """
+    Returns the reporter of the process, created on the first failure.
+    """
+    global reporter
+    if reporter is None:
+        reporter = Reporter()
+    return reporter
+
+
+def set_reporter(new: Union[Reporter, None]) -> Union[Reporter, None]:
+    """
+    Replaces the reporter of the process, stopping the previous one. With None,
+    a default reporter is created on the next failure.
+
+    Returns:
+        Union[Reporter, None]: The previous reporter.
+    """
+    global reporter
+    previous, reporter = reporter, new
+    if previous is not None:
+        previous.stop()
+    return previous
+
+
+def stop_reporter() -> None:
+    """
+    Stops the reporter of the process, emitting the failures queued.
+    """
+    if reporter is not None:
+        reporter.stop()
+
+
+def report(source: str, name: str, kind: type) -> None:
+    """
+    Reports the failure of a check running with `mode="warn"`.
+    """
+    (reporter or get_reporter()).push((source, name, kind))
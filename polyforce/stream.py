@@ -0,0 +1,328 @@
+"""
+Validation of large NDJSON and CSV files, record by record.
+
+The files are read through `mmap`, meaning only the pages being parsed are
+loaded in memory, and every record is validated with the same compiled plan.
+"""
+import csv
+import inspect
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import lru_cache
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Tuple, Union
+
+import orjson
+
+from ._internal._construction import construct_instance
+from ._internal._errors import ErrorDetail
+from ._internal._parallel import Parallel, chunked, get_executor, get_workers
+from ._internal._plan import CallPlan
+from ._internal._serializer import json_serializable
+from .constants import INIT_FUNCTION
+from .decorator import polycheck
+from .exceptions import ValidationError
+
+ErrorSink = Callable[[ErrorDetail], Any]
+Path = Union[str, "os.PathLike[str]"]
+
+
+class RecordValidator:
+    """
+    Validates records against the `__init__` of a PolyModel, creating the
+    models, or against the signature of a function, returning the records.
+    """
+
+    __slots__ = ("target", "plan", "model")
+
+    def __init__(self, target: Any, coerce: bool = False) -> None:
+        """
+        Args:
+            target (Any): A PolyModel or a function, decorated with `polycheck` or not.
+            coerce (bool): If True, the values are converted when possible, regardless of
+                the configuration of the target.
+        """
+        self.target = target
+        self.model: Any = None
+
+        if inspect.isclass(target) and hasattr(target, "__polymodel_plans__"):
+            self.model = target
+            plan: CallPlan = target.__polymodel_plans__[INIT_FUNCTION]
+        else:
+            decorator = getattr(target, "__polycheck__", None)
+            if decorator is None:
+                decorator = polycheck()(target).__polycheck__
+            plan = decorator.get_plan()
+
+        if coerce and not plan.coerce:
+            plan = plan.replace(coerce=True)
+        if plan.warn:
+            # The records are validated to report their errors, never warned.
+            plan = plan.replace(warn=False)
+        self.plan = plan
+
+    def validate(self, record: Any) -> Any:
+        """
+        Validates a record.
+
+        Returns:
+            Any: The model created from the record or the record itself, with the
+                values converted when coercing.
+
+        Raises:
+            ValidationError: When any of the values does not match the annotations.
+            TypeError: When the record does not match the parameters.
+        """
+        if not isinstance(record, dict):
+            raise TypeError(
+                f"Expected a record as 'dict', but received type '{type(record).__name__}'."
+            )
+
+        _, kwargs = self.plan.validate((), record)
+        if self.model is not None:
+            return construct_instance(self.model, kwargs)
+
+        self.plan.signature.bind(**kwargs)
+        return kwargs
+
+
+def row_error(source: str, row: int, value: Any, error: Exception) -> ErrorDetail:
+    """
+    Builds the error of a record that could not be parsed or mapped to the parameters.
+    """
+    if isinstance(value, bytes):
+        value = value.decode(errors="replace").rstrip("\r\n")
+    return ErrorDetail(
+        source=source,
+        value=json_serializable(value),
+        input="",
+        expected="",
+        message=str(error),
+        row=row,
+    )
+
+
+def validate_record(
+    validator: RecordValidator,
+    row: int,
+    record: Any,
+    parse: Union[Callable[[Any], Any], None] = None,
+) -> Tuple[Any, Union[List[ErrorDetail], None]]:
+    """
+    Parses, when a parser is given, and validates a record.
+
+    Returns:
+        Tuple: The value validated and None or, when not valid, None and the errors of the row.
+    """
+    try:
+        value = validator.validate(record if parse is None else parse(record))
+    except ValidationError as error:
+        return None, [ErrorDetail(**detail, row=row) for detail in error.errors()]
+    except (TypeError, ValueError) as error:
+        return None, [row_error(validator.plan.source, row, record, error)]
+    return value, None
+
+
+@lru_cache(maxsize=None)
+def get_validator(target: Any, coerce: bool) -> RecordValidator:
+    """
+    The validators of the worker processes, built once per process.
+    """
+    return RecordValidator(target, coerce=coerce)
+
+
+def validate_chunk(
+    target: Any,
+    coerce: bool,
+    parse: Union[Callable[[Any], Any], None],
+    start: int,
+    records: List[Any],
+) -> List[Tuple[Any, Union[List[ErrorDetail], None]]]:
+    """
+    Validates a chunk of records in a worker process.
+    """
+    validator = get_validator(target, coerce)
+    return [
+        validate_record(validator, row, record, parse) for row, record in enumerate(records, start)
+    ]
+
+
+def report(details: List[ErrorDetail], errors: Union[ErrorSink, None]) -> None:
+    """
+    Sends the errors of a row to the sink or raises them when there is none.
+    """
+    if errors is None:
+        raise ValidationError.from_exception_data(details)
+    for detail in details:
+        errors(detail)
+
+
+def run_validation(
+    validator: RecordValidator,
+    records: Iterable[Any],
+    errors: Union[ErrorSink, None] = None,
+    parse: Union[Callable[[Any], Any], None] = None,
+    parallel: Parallel = None,
+    chunk_size: int = 10_000,
+) -> Iterator[Any]:
+    """
+    Validates the records, in the current process or in chunks sent to worker
+    processes, yielding the valid ones in order.
+    """
+    if parallel is not None:
+        yield from run_parallel(validator, records, errors, parse, parallel, chunk_size)
+        return
+
+    for row, record in enumerate(records):
+        value, details = validate_record(validator, row, record, parse)
+        if details is None:
+            yield value
+        else:
+            report(details, errors)
+
+
+def run_parallel(
+    validator: RecordValidator,
+    records: Iterable[Any],
+    errors: Union[ErrorSink, None],
+    parse: Union[Callable[[Any], Any], None],
+    parallel: Union[int, Executor],
+    chunk_size: int,
+) -> Iterator[Any]:
+    """
+    Sends the chunks of records to the worker processes, keeping at most two chunks
+    per worker in flight, meaning the memory used does not depend on the number of records.
+
+    The workers rebuild the validator of the target, which must be importable.
+    """
+    coerce = validator.plan.coerce
+    pending: Deque["Future[List[Tuple[Any, Union[List[ErrorDetail], None]]]]"] = deque()
+    in_flight = 2 * get_workers(parallel)
+
+    def results() -> Iterator[Any]:
+        for value, details in pending.popleft().result():
+            if details is None:
+                yield value
+            else:
+                report(details, errors)
+
+    with get_executor(parallel) as executor:
+        start = 0
+        for chunk in chunked(records, chunk_size):
+            pending.append(
+                executor.submit(validate_chunk, validator.target, coerce, parse, start, chunk)
+            )
+            start += len(chunk)
+            if len(pending) >= in_flight:
+                yield from results()
+
+        while pending:
+            yield from results()
+
+
+def validate_records(
+    records: Iterable[Any],
+    target: Any,
+    errors: Union[ErrorSink, None] = None,
+    coerce: bool = False,
+    parallel: Parallel = None,
+    chunk_size: int = 10_000,
+) -> Iterator[Any]:
+    """
+    Validates the records one by one, yielding the valid ones.
+
+    Args:
+        records (Iterable[Any]): The records, dictionaries of values by parameter name.
+        target (Any): A PolyModel or a function, decorated with `polycheck` or not.
+        errors (Union[ErrorSink, None]): Called with each error of the records not valid,
+            identified by the `row`. When not given, the first error is raised.
+        coerce (bool): If True, the values are converted when possible.
+        parallel (Parallel): The number of processes, or an executor, validating the
+            chunks of records in parallel.
+        chunk_size (int): The number of records of each chunk validated in parallel.
+
+    Yields:
+        Any: The models created or the records validated.
+    """
+    validator = RecordValidator(target, coerce=coerce)
+    return run_validation(validator, records, errors, parallel=parallel, chunk_size=chunk_size)
+
+
+def iter_lines(path: Path) -> Iterator[bytes]:
+    """
+    Reads the lines of a file through `mmap`, loading only the pages being read.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b"")
+
+
+def stream_ndjson(
+    path: Path,
+    target: Any,
+    errors: Union[ErrorSink, None] = None,
+    coerce: bool = False,
+    parallel: Parallel = None,
+    chunk_size: int = 10_000,
+) -> Iterator[Any]:
+    """
+    Validates a NDJSON file, one json object per line, record by record.
+    The empty lines are skipped.
+
+    Args:
+        path (Path): The path of the file.
+        target (Any): A PolyModel or a function, decorated with `polycheck` or not.
+        errors (Union[ErrorSink, None]): Called with each error of the records not valid,
+            including the lines not parsed. When not given, the first error is raised.
+        coerce (bool): If True, the values are converted when possible.
+        parallel (Parallel): The number of processes, or an executor, parsing and
+            validating the chunks of lines in parallel.
+        chunk_size (int): The number of lines of each chunk validated in parallel.
+
+    Yields:
+        Any: The models created or the records validated.
+    """
+    validator = RecordValidator(target, coerce=coerce)
+    lines = (line for line in iter_lines(path) if not line.isspace())
+    return run_validation(
+        validator, lines, errors, parse=orjson.loads, parallel=parallel, chunk_size=chunk_size
+    )
+
+
+def stream_csv(
+    path: Path,
+    target: Any,
+    errors: Union[ErrorSink, None] = None,
+    coerce: bool = True,
+    encoding: str = "utf-8",
+    parallel: Parallel = None,
+    chunk_size: int = 10_000,
+    **fmtparams: Any,
+) -> Iterator[Any]:
+    """
+    Validates a CSV file, with a header naming the parameters, record by record.
+
+    The values of a CSV are strings and therefore are converted by default.
+
+    Args:
+        path (Path): The path of the file.
+        target (Any): A PolyModel or a function, decorated with `polycheck` or not.
+        errors (Union[ErrorSink, None]): Called with each error of the records not valid.
+            When not given, the first error is raised.
+        coerce (bool): If True, the values are converted when possible.
+        encoding (str): The encoding of the file.
+        parallel (Parallel): The number of processes, or an executor, validating the
+            chunks of records in parallel.
+        chunk_size (int): The number of records of each chunk validated in parallel.
+        **fmtparams (Any): The formatting parameters of `csv.DictReader`.
+
+    Yields:
+        Any: The models created or the records validated.
+    """
+    validator = RecordValidator(target, coerce=coerce)
+    lines = (line.decode(encoding) for line in iter_lines(path))
+    records = csv.DictReader(lines, **fmtparams)
+    return run_validation(validator, records, errors, parallel=parallel, chunk_size=chunk_size)
@@ -0,0 +1,174 @@
+import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from polyforce.__main__ import main
+from polyforce._internal import _manifest
+from polyforce.checker import check_paths, check_source, load_manifest, write_manifest
+
+SOURCE = """
+from typing import Any
+
+from polyforce import Config, PolyModel, polycheck
+
+
+@polycheck()
+def add_movie(name: str, year) -> None:
+    ...
+
+
+@polycheck()
+def remove_movie(name: "List[") -> None:
+    ...
+
+
+def not_checked(name):
+    ...
+
+
+class Movie(PolyModel):
+    def __init__(self, name: str):
+        self.name = name
+
+    def rate(self, score: float) -> float:
+        return score
+
+    @staticmethod
+    def parse(value) -> Any:
+        ...
+
+    @property
+    def title(self):
+        return self.name
+
+
+class Ignored(PolyModel):
+    config = Config(ignore=True)
+
+    def __init__(self, name):
+        ...
+
+
+class Plain:
+    def __init__(self, name):
+        ...
+"""
+
+SUBCLASS = """
+from movies import Movie
+
+
+class Serie(Movie):
+    def rate(self, score) -> float:
+        return score
+"""
+
+VALID = """
+from polyforce import PolyModel
+
+
+class Actor(PolyModel):
+    def __init__(self, name) -> None:
+        self.name = name
+"""
+
+
+@pytest.fixture
+def package(tmp_path):
+    (tmp_path / "movies.py").write_text(SOURCE)
+    (tmp_path / "series.py").write_text(SUBCLASS)
+    return tmp_path
+
+
+def test_check_source():
+    report = check_source(SOURCE, "movies.py", "movies")
+
+    assert [str(issue) for issue in report.issues] == [
+        "movies.py:8: 'year' of 'add_movie' is not typed.",
+        "movies.py:13: The annotation of 'name' is not a valid expression.",
+        "movies.py:22: Missing return annotation in '__init__'.",
+        "movies.py:29: 'value' of 'parse' is not typed.",
+    ]
+    assert report.classes["Plain"] == (
+        [],
+        [
+            ("movies.py", 45, "Missing return annotation in '__init__'."),
+            ("movies.py", 45, "'name' of '__init__' is not typed."),
+        ],
+    )
+
+
+def test_check_paths_subclasses(package):
+    reports = check_paths([str(package)])
+
+    assert [report.module for report in reports] == ["movies", "series"]
+    assert [issue.message for issue in reports[1].issues] == ["'score' of 'rate' is not typed."]
+
+
+def test_check_paths_parallel(package):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reports = check_paths([str(package)], parallel=executor, chunk_size=1)
+
+    assert [len(report.issues) for report in reports] == [4, 1]
+
+
+def test_cli(package, capsys):
+    assert main(["check", str(package)]) == 1
+    assert "5 issues found in 2 files" in capsys.readouterr().out
+
+
+def test_syntax_error():
+    report = check_source("def movie(:\n", "movie.py")
+
+    assert report.issues[0].message.startswith("Invalid syntax")
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    (tmp_path / "checked_actors.py").write_text(VALID.replace("(self, name)", "(self, name: str)"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(_manifest, "modules", {})
+    _manifest.is_verified.cache_clear()
+    yield tmp_path / "manifest.json"
+    sys.modules.pop("checked_actors", None)
+    _manifest.is_verified.cache_clear()
+
+
+def test_manifest(manifest):
+    source = manifest.parent / "checked_actors.py"
+
+    assert main(["check", str(source), "--manifest", str(manifest)]) == 0
+
+    load_manifest(str(manifest))
+    actors = importlib.import_module("checked_actors")
+
+    assert _manifest.is_verified("checked_actors")
+    assert actors.Actor(name="Robert").name == "Robert"
+
+    # Changed after the check, the module is no longer verified.
+    source.write_text(VALID)
+    _manifest.is_verified.cache_clear()
+
+    assert not _manifest.is_verified("checked_actors")
+
+
+def test_manifest_skips_runtime_checks(manifest):
+    source = manifest.parent / "checked_actors.py"
+    source.write_text(VALID)
+    (report,) = check_paths([str(source)])
+
+    # Forcing the module into the manifest, its missing annotation is not raised.
+    write_manifest(str(manifest), [report._replace(issues=[])])
+    load_manifest(str(manifest))
+    actors = importlib.import_module("checked_actors")
+
+    assert actors.Actor(name="Robert").name == "Robert"
+
+
+def test_manifest_version(manifest):
+    manifest.write_text('{"version": 0, "modules": {}}')
+
+    with pytest.raises(ValueError):
+        load_manifest(str(manifest))
@@ -0,0 +1,61 @@
+import asyncio
+import inspect
+from typing import Any
+
+import pytest
+
+from polyforce import polycheck
+from polyforce.exceptions import ValidationError
+
+
+@polycheck(boundary_only=True)
+def add_movie(name: Any, year: Any) -> str:
+    return save_movie(name=name, year=year)
+
+
+@polycheck(boundary_only=True)
+def save_movie(name: str, year: int) -> str:
+    return f"{name} ({year})"
+
+
+@polycheck()
+def strict_add_movie(name: Any, year: Any) -> str:
+    return strict_save_movie(name=name, year=year)
+
+
+@polycheck()
+def strict_save_movie(name: str, year: int) -> str:
+    return f"{name} ({year})"
+
+
+def test_internal_calls_are_not_checked():
+    assert add_movie(name="Avengers", year="2012") == "Avengers (2012)"
+    assert save_movie.__name__ == "save_movie"
+
+    with pytest.raises(ValidationError):
+        save_movie(name="Avengers", year="2012")
+
+
+def test_without_boundary():
+    with pytest.raises(ValidationError):
+        strict_add_movie(name="Avengers", year="2012")
+
+
+@polycheck(boundary_only=True)
+async def fetch_movie(name: Any, year: Any) -> str:
+    await asyncio.sleep(0)
+    return await load_movie(name=name, year=year)
+
+
+@polycheck(boundary_only=True)
+async def load_movie(name: str, year: int) -> str:
+    await asyncio.sleep(0)
+    return f"{name} ({year})"
+
+
+def test_internal_awaited_calls_are_not_checked():
+    assert asyncio.run(fetch_movie(name="Avengers", year="2012")) == "Avengers (2012)"
+    assert inspect.iscoroutinefunction(load_movie)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(load_movie(name="Avengers", year="2012"))
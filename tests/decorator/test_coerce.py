@@ -0,0 +1,94 @@
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, Optional, Set, Tuple
+
+import pytest
+
+from polyforce import PolyModel, polycheck
+from polyforce.exceptions import ValidationError
+
+
+class Status(str, Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class Address(PolyModel):
+    def __init__(self, street: str, number: int) -> None:
+        self.street = street
+        self.number = number
+
+
+@polycheck(coerce=True)
+def parse(
+    number: int = 0,
+    ratio: float = 0.0,
+    active: bool = False,
+    status: Status = Status.ACTIVE,
+    created_at: Optional[datetime] = None,
+    birthday: Optional[date] = None,
+    tags: Tuple[str, ...] = (),
+    groups: Set[str] = None,
+    address: Address = None,
+) -> Any:
+    return locals()
+
+
+def test_coerce_scalars():
+    values = parse("10", ratio="1.5", active="yes", status="inactive")
+
+    assert values["number"] == 10
+    assert values["ratio"] == 1.5
+    assert values["active"] is True
+    assert values["status"] is Status.INACTIVE
+
+
+def test_coerce_dates():
+    values = parse(created_at="2023-10-01T10:00:00Z", birthday="2000-01-31")
+
+    assert values["created_at"] == datetime(2023, 10, 1, 10, tzinfo=timezone.utc)
+    assert values["birthday"] == date(2000, 1, 31)
+
+
+def test_coerce_collections():
+    values = parse(tags=["a", "b"], groups=["x", "x"])
+
+    assert values["tags"] == ("a", "b")
+    assert values["groups"] == {"x"}
+
+
+def test_coerce_model():
+    values = parse(address={"street": "Main", "number": 1})
+
+    assert isinstance(values["address"], Address)
+    assert values["address"].number == 1
+
+
+def test_values_matching_are_not_converted():
+    tags = ("a",)
+    values = parse(number=1, tags=tags)
+
+    assert values["tags"] is tags
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"number": "ten"}, {"active": "maybe"}, {"status": "unknown"}, {"number": 1.5}],
+    ids=["int", "bool", "enum", "float-not-converted"],
+)
+def test_coerce_raises_validation_error(kwargs):
+    with pytest.raises(ValidationError) as raised:
+        parse(**kwargs)
+
+    (name, value), *_ = kwargs.items()
+    assert raised.value.errors()[0]["input"] == name
+    assert raised.value.errors()[0]["value"] == value
+
+
+def test_no_coerce_by_default():
+    @polycheck()
+    def function(number: int) -> None:
+        ...
+
+    with pytest.raises(ValidationError):
+        function(number="1")
@@ -0,0 +1,221 @@
+from typing import Any, List, Optional
+
+import pytest
+from typing_extensions import Annotated
+
+from polyforce import Config, PolyModel, policy, polycheck
+from polyforce._internal._constraints import compile_constraints
+from polyforce.exceptions import ValidationError
+
+annotated_types = pytest.importorskip("annotated_types")
+Ge, Gt, Le, Lt = annotated_types.Ge, annotated_types.Gt, annotated_types.Le, annotated_types.Lt
+MinLen, MaxLen, Len = annotated_types.MinLen, annotated_types.MaxLen, annotated_types.Len
+Interval, MultipleOf = annotated_types.Interval, annotated_types.MultipleOf
+Predicate = annotated_types.Predicate
+
+
+def is_even(value: int) -> bool:
+    return value % 2 == 0
+
+
+def is_positive(value: int) -> bool:
+    assert value > 0
+    return True
+
+
+@polycheck()
+def paginate(
+    page: Annotated[int, Ge(1)],
+    size: Annotated[int, Interval(gt=0, le=100)] = 10,
+    tags: Annotated[List[str], Len(1, 3)] = None,
+    step: Annotated[int, MultipleOf(5), Predicate(is_even)] = 10,
+) -> Any:
+    return page, size, tags, step
+
+
+class Movie(PolyModel):
+    def __init__(self, name: Annotated[str, MinLen(1)], year: Annotated[int, Gt(1888)]) -> None:
+        self.name = name
+        self.year = year
+
+
+def test_constraints():
+    assert paginate(1) == (1, 10, None, 10)
+    assert paginate(2, 100, ["action"], 20) == (2, 100, ["action"], 20)
+
+
+@pytest.mark.parametrize(
+    "kwargs,name,description",
+    [
+        ({"page": 0}, "page", "ge=1"),
+        ({"page": 1, "size": 0}, "size", "gt=0, le=100"),
+        ({"page": 1, "size": 101}, "size", "gt=0, le=100"),
+        ({"page": 1, "tags": []}, "tags", "min_length=1, max_length=3"),
+        ({"page": 1, "tags": ["a", "b", "c", "d"]}, "tags", "min_length=1, max_length=3"),
+        ({"page": 1, "step": 15}, "step", "is_even"),
+        ({"page": 1, "step": 4}, "step", "multiple_of=5"),
+    ],
+)
+def test_constraints_raise_validation_error(kwargs, name, description):
+    with pytest.raises(ValidationError) as raised:
+        paginate(**kwargs)
+
+    assert raised.value.errors() == [
+        {
+            "source": "paginate",
+            "value": kwargs[name],
+            "input": name,
+            "expected": raised.value.errors()[0]["expected"],
+            "message": f"The value of attribute '{name}' does not satisfy '{description}'.",
+        }
+    ]
+
+
+def test_type_checked_before_constraints():
+    with pytest.raises(ValidationError) as raised:
+        paginate("1")
+
+    assert raised.value.errors()[0]["message"] == (
+        "Expected 'int' for attribute 'page', but received type 'str'."
+    )
+
+
+def test_plain_callables():
+    @polycheck()
+    def count(value: Annotated[int, is_positive, "not a constraint"]) -> int:
+        return value
+
+    assert count(1) == 1
+
+    with pytest.raises(ValidationError) as raised:
+        count(0)
+
+    assert raised.value.errors()[0]["message"] == (
+        "The value of attribute 'value' does not satisfy 'is_positive'."
+    )
+
+
+def test_constraints_with_any():
+    @polycheck()
+    def size(value: Annotated[Any, MinLen(1)]) -> int:
+        return len(value)
+
+    assert size("a") == 1
+
+    with pytest.raises(ValidationError):
+        size([])
+
+    with pytest.raises(ValidationError):
+        size(1)
+
+
+def test_coerce_constraints():
+    @polycheck(coerce=True)
+    def page(value: Annotated[int, Gt(0)]) -> int:
+        return value
+
+    assert page("1") == 1
+
+    with pytest.raises(ValidationError):
+        page("0")
+
+
+def test_model_constraints():
+    movie = Movie("Avengers", 2012)
+
+    with pytest.raises(ValidationError):
+        Movie("", 2012)
+
+    with pytest.raises(ValidationError):
+        Movie("Avengers", 1800)
+
+    assert movie.year == 2012
+
+
+def test_sampled_constraints():
+    class Rating(PolyModel):
+        @policy("sampled", sample=2)
+        def rate(self, score: Annotated[float, Ge(0), Le(10)]) -> float:
+            return score
+
+    rating = Rating()
+
+    with pytest.raises(ValidationError):
+        rating.rate(11.0)
+
+    # The constraints are skipped with the type checks.
+    assert rating.rate(11.0) == 11.0
+
+    with pytest.raises(ValidationError):
+        rating.rate(11.0)
+
+
+def test_pydantic_core_constraints():
+    pytest.importorskip("pydantic_core")
+
+    class Rating(PolyModel):
+        config = Config(backend="pydantic-core")
+
+        def rate(
+            self, score: Annotated[float, Ge(0), Le(10)], *tags: Annotated[str, MinLen(1)]
+        ) -> float:
+            return score
+
+    assert Rating().rate(5.0, "action") == 5.0
+
+    with pytest.raises(ValidationError) as raised:
+        Rating().rate(11.0)
+
+    assert raised.value.errors()[0]["message"] == (
+        "The value of attribute 'score' does not satisfy 'ge=0, le=10'."
+    )
+
+    with pytest.raises(ValidationError) as raised:
+        Rating().rate(1.0, "")
+
+    assert raised.value.errors()[0]["message"] == (
+        "The value of attribute 'tags[0]' does not satisfy 'min_length=1'."
+    )
+
+
+@pytest.mark.parametrize(
+    "metadata,valid,invalid,description",
+    [
+        ([Gt(0), Gt(5), Ge(5)], 6, 5, "gt=5"),
+        ([Lt(10), Le(10), Le(3)], 3, 4, "le=3"),
+        ([Ge(5), Gt(5)], 6, 5, "gt=5"),
+        ([MinLen(1), MinLen(2), MaxLen(4), MaxLen(3)], "ab", "abcd", "min_length=2, max_length=3"),
+    ],
+)
+def test_fused_bounds(metadata, valid, invalid, description):
+    constraints = compile_constraints(metadata)
+
+    assert len(constraints.terms) == 1
+    assert constraints.check(valid)
+    assert not constraints.check(invalid)
+    assert constraints.describe(invalid) == description
+
+
+def test_no_constraints():
+    assert compile_constraints(["doc", int]) is None
+
+
+@pytest.mark.parametrize("backend", ["python", "pydantic-core"])
+def test_optional_constraints(backend):
+    if backend == "pydantic-core":
+        pytest.importorskip("pydantic_core")
+
+    @polycheck(backend=backend)
+    def rate(score: Annotated[Optional[int], Gt(0)] = None) -> Optional[int]:
+        return score
+
+    assert rate() is None
+    assert rate(None) is None
+    assert rate(1) == 1
+
+    with pytest.raises(ValidationError) as raised:
+        rate(0)
+
+    assert raised.value.errors()[0]["message"] == (
+        "The value of attribute 'score' does not satisfy 'gt=0'."
+    )
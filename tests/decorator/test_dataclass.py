@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Any, Optional, Union
+import inspect
+from dataclasses import InitVar, dataclass, field
+from typing import Any, List, Optional, Union
 
 import pytest
 
@@ -79,3 +80,76 @@ def test_str_and_not_int_raise_error():
             "message": "Expected 'int' for attribute 'int_value', but received type 'str'.",
         }
     ]
+
+
+@polycheck(coerce=True)
+@dataclass
+class Movie:
+    name: str
+    year: int
+    tags: List[str] = field(default_factory=list)
+    rating: float = 0.0
+    slug: str = field(init=False)
+    scale: InitVar[int] = 1
+
+    def __post_init__(self, scale: int) -> None:
+        self.slug = self.name.lower()
+        self.rating = self.rating * scale
+
+
+@polycheck()
+@dataclass
+class Actor:
+    name: str
+    movie: "Optional[Later]" = None
+
+
+@dataclass
+class Later:
+    name: str
+
+
+def test_dataclass_is_kept():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert isinstance(movie, Movie)
+    assert Movie.__init__.__name__ == "__init__"
+    assert list(inspect.signature(Movie).parameters) == ["name", "year", "tags", "rating", "scale"]
+
+
+def test_dataclass_default_factory_and_post_init():
+    movie = Movie(name="Avengers", year=2012, rating=4.0, scale=2)
+    other = Movie("Thor", 2011)
+
+    assert movie.tags == []
+    assert movie.tags is not other.tags
+    assert movie.slug == "avengers"
+    assert movie.rating == 8.0
+
+
+def test_dataclass_coerce():
+    movie = Movie(name="Avengers", year="2012", scale="2")
+
+    assert movie.year == 2012
+
+    with pytest.raises(ValidationError) as raised:
+        Movie(name="Avengers", year="twenty")
+
+    assert raised.value.errors()[0]["source"] == "Movie"
+
+    with pytest.raises(ValidationError):
+        Movie(name="Avengers", year=2012, tags="action")
+
+
+def test_dataclass_missing_arguments():
+    with pytest.raises(TypeError) as raised:
+        Movie(name="Avengers")
+
+    assert "year" in str(raised.value)
+
+
+def test_dataclass_forward_references():
+    assert Actor(name="Robert", movie=Later(name="Iron Man")).movie.name == "Iron Man"
+
+    with pytest.raises(ValidationError):
+        Actor(name="Robert", movie="Iron Man")
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from polyforce import polycheck
+from polyforce.exceptions import ValidationError, restore_error_limits, set_error_limits
+
+
+@polycheck()
+def count(value: int) -> int:
+    return value
+
+
+@dataclass
+class Movie:
+    name: str
+    tags: Any
+
+
+def get_value(value: Any) -> Any:
+    with pytest.raises(ValidationError) as raised:
+        count(value)
+    return raised.value.errors()[0]["value"]
+
+
+@pytest.fixture
+def limits():
+    previous = set_error_limits()
+    yield set_error_limits
+    restore_error_limits(previous)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("1", "1"),
+        ({"a": 1}, {"a": 1}),
+        ((1, "2"), [1, "2"]),
+        ({1}, [1]),
+        ({1: "a"}, {"1": "a"}),
+        (b"abc", "b'abc'"),
+        (Movie("Avengers", ["action"]), {"name": "Avengers", "tags": ["action"]}),
+    ],
+)
+def test_small_values(value, expected):
+    assert get_value(value) == expected
+
+
+def test_large_bytes():
+    value = b"x" * 50_000_000
+
+    assert get_value(value) == {
+        "type": "bytes",
+        "size": 50_000_000,
+        "preview": repr(b"x" * 100),
+    }
+
+
+def test_large_string():
+    assert get_value("x" * 5000) == {"type": "str", "size": 5000, "preview": "x" * 1000}
+
+
+def test_large_containers():
+    assert get_value(list(range(1000))) == {
+        "type": "list",
+        "size": 1000,
+        "preview": list(range(20)),
+    }
+    assert get_value({str(key): key for key in range(25)})["preview"] == {
+        str(key): key for key in range(20)
+    }
+
+
+def test_nested_containers():
+    assert get_value([[[[1, 2]]]]) == [[[{"type": "list", "size": 2}]]]
+
+
+def test_limits(limits):
+    limits(max_depth=1, max_items=2, max_string=3)
+
+    assert get_value("abcd") == {"type": "str", "size": 4, "preview": "abc"}
+    assert get_value([1, 2, 3]) == {"type": "list", "size": 3, "preview": [1, 2]}
+    assert get_value([[1]]) == [{"type": "list", "size": 1}]
+
+
+def test_type_only(limits):
+    limits(type_only=True)
+
+    assert get_value({"a": 1}) == {"type": "dict"}
+    assert get_value(Movie("Avengers", [])) == {"type": "Movie"}
+
+
+def test_restore_limits(limits):
+    previous = limits(type_only=True)
+    restore_error_limits(previous)
+
+    assert get_value({"a": 1}) == {"a": 1}
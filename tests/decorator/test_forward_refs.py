@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+
+from polyforce import polycheck
+from polyforce._internal import _plan
+from polyforce._internal._typing import resolve_annotation
+from polyforce.exceptions import ValidationError
+
+
+@polycheck()
+def add_actor(actor: Actor, movie: Optional[Movie] = None) -> Actor:
+    return actor
+
+
+class Actor:
+    ...
+
+
+class Movie:
+    @polycheck()
+    def add_sequel(self, sequel: Movie) -> Movie:
+        return sequel
+
+
+def test_resolves_forward_references():
+    actor = Actor()
+
+    assert add_actor(actor, movie=Movie()) is actor
+
+
+def test_resolved_forward_references_raise_error():
+    with pytest.raises(ValidationError) as raised:
+        add_actor(actor="actor")
+
+    assert raised.value.errors()[0]["expected"] == "Actor"
+
+
+def test_resolves_method_class():
+    movie = Movie()
+    sequel = Movie()
+
+    assert movie.add_sequel(sequel) is sequel
+
+    with pytest.raises(ValidationError):
+        movie.add_sequel(sequel="sequel")
+
+
+def test_resolves_once(monkeypatch):
+    calls = []
+
+    def resolve(*args, **kwargs):
+        calls.append(args)
+        return resolve_annotation(*args, **kwargs)
+
+    monkeypatch.setattr(_plan, "resolve_annotation", resolve)
+
+    @polycheck()
+    def function(actor: Actor) -> None:
+        ...
+
+    for _ in range(3):
+        function(Actor())
+
+    assert len(calls) == 1
@@ -0,0 +1,149 @@
+import sys
+from enum import Enum
+from typing import Any, Callable, List, NewType, Optional, Type, TypeVar, Union
+
+import pytest
+from typing_extensions import Literal, TypedDict
+
+from polyforce import Field, PolyModel, polycheck
+from polyforce.exceptions import ValidationError
+
+UserId = NewType("UserId", int)
+Number = TypeVar("Number", int, float)
+Bounded = TypeVar("Bounded", bound=str)
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Movie(TypedDict):
+    name: str
+    year: int
+
+
+class PartialMovie(TypedDict, total=False):
+    name: str
+    year: int
+
+
+class Animal:
+    ...
+
+
+class Dog(Animal):
+    ...
+
+
+def build(annotation: Any) -> Callable[..., Any]:
+    @polycheck()
+    def function(value: annotation) -> Any:
+        return value
+
+    return function
+
+
+@pytest.mark.parametrize(
+    "annotation,valid,invalid",
+    [
+        (Literal["a", "b"], "a", "c"),
+        (Literal[1, 2], 1, True),
+        (Literal[True], True, 1),
+        (Literal["a"], "a", ["a"]),
+        (Color, Color.RED, "red"),
+        (Movie, {"name": "Avengers", "year": 2012}, {"name": "Avengers"}),
+        (Movie, {"name": "Avengers", "year": 2012}, {"name": "A", "year": 1, "extra": 1}),
+        (PartialMovie, {"name": "Avengers"}, {"title": "Avengers"}),
+        (UserId, 1, "1"),
+        (Type[Animal], Dog, Dog()),
+        (Type[Animal], Animal, int),
+        (Callable[[int, int], int], lambda a, b: a + b, lambda a: a),
+        (Callable[..., int], print, 1),
+        (Optional[List[int]], None, (1,)),
+        (Optional[List[int]], [1], "1"),
+        (Optional[Literal["a"]], None, "b"),
+        (Union[Literal["a"], int], 1, "b"),
+        (Number, 1.5, "1"),
+        (Bounded, "a", 1),
+    ],
+)
+def test_predicates(annotation, valid, invalid):
+    function = build(annotation)
+
+    assert function(value=valid) is valid
+
+    with pytest.raises(ValidationError):
+        function(value=invalid)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions require python 3.10+")
+def test_pep_604_union():
+    function = build(eval("int | None"))
+
+    assert function(value=None) is None
+    assert function(value=1) == 1
+
+    with pytest.raises(ValidationError) as raised:
+        function(value="1")
+
+    assert raised.value.errors()[0]["expected"] == ("int", "NoneType")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="type aliases require python 3.12+")
+def test_type_alias():
+    namespace: dict = {}
+    exec("type Ids = list[int] | None", namespace)
+    function = build(namespace["Ids"])
+
+    assert function(value=[1]) == [1]
+
+    with pytest.raises(ValidationError):
+        function(value="1")
+
+
+def test_literal_error_expected():
+    function = build(Literal["a", "b"])
+
+    with pytest.raises(ValidationError) as raised:
+        function(value="c")
+
+    assert raised.value.errors()[0]["expected"] == "Literal['a', 'b']"
+
+
+@pytest.mark.parametrize(
+    "annotation,expected",
+    [
+        (Callable[[int], int], "Callable[[int], int]"),
+        (Callable[[], None], "Callable[[], NoneType]"),
+        (Callable[..., int], "Callable[..., int]"),
+    ],
+)
+def test_callable_error_expected(annotation, expected):
+    function = build(annotation)
+
+    with pytest.raises(ValidationError) as raised:
+        function(value=1)
+
+    assert raised.value.errors()[0]["expected"] == expected
+
+
+def test_model_with_literals():
+    class Poster(PolyModel):
+        def __init__(self, color: Literal["red", "blue"] = Field(default="red")) -> None:
+            self.color = color
+
+    assert Poster().color == "red"
+
+    with pytest.raises(ValidationError):
+        Poster(color="green")
+
+
+def test_field_default_validated_with_predicate():
+    with pytest.raises(TypeError) as raised:
+
+        class Poster(PolyModel):
+            def __init__(self, color: Literal["red", "blue"] = Field(default="green")) -> None:
+                ...
+
+    assert "it must be type 'Literal['red', 'blue']'" in str(raised.value)
@@ -0,0 +1,113 @@
+from typing import List, Union
+
+import pytest
+
+from polyforce import PolyModel, polycheck
+from polyforce.exceptions import ValidationError
+
+
+@polycheck()
+def log(message: str, /, *values: int, **tags: str) -> tuple:
+    return message, values, tags
+
+
+@polycheck()
+def metrics(*values: Union[int, float]) -> int:
+    return len(values)
+
+
+@polycheck()
+def groups(*values: List[int]) -> int:
+    return len(values)
+
+
+class Logger(PolyModel):
+    def log(self, message: str, *values: int, **tags: str) -> tuple:
+        return message, values, tags
+
+
+def test_variadic():
+    assert log("message", 1, 2, level="info") == ("message", (1, 2), {"level": "info"})
+    assert log("message") == ("message", (), {})
+
+
+def test_positional_only_name_in_kwargs():
+    assert log("message", message="info") == ("message", (), {"message": "info"})
+
+
+@pytest.mark.parametrize(
+    "args,kwargs,value,attribute,expected",
+    [
+        ((1, "2", "3"), {}, "2", "values[1]", "int"),
+        ((1,), {"level": 1}, 1, "tags['level']", "str"),
+        ((1.0,), {}, 1.0, "values[0]", "int"),
+    ],
+)
+def test_variadic_raises_validation_error(args, kwargs, value, attribute, expected):
+    with pytest.raises(ValidationError) as raised:
+        log("message", *args, **kwargs)
+
+    name = attribute.split("[")[0]
+    assert raised.value.errors() == [
+        {
+            "source": "log",
+            "value": value,
+            "input": name,
+            "expected": expected,
+            "message": (
+                f"Expected '{expected}' for attribute '{attribute}', "
+                f"but received type '{type(value).__name__}'."
+            ),
+        }
+    ]
+
+
+def test_many_values():
+    values = list(range(500)) + [1.5] * 500
+
+    assert metrics(*values) == 1000
+
+    with pytest.raises(ValidationError) as raised:
+        metrics(*values, "1")
+
+    assert "values[1000]" in raised.value.errors()[0]["message"]
+
+
+def test_many_values_with_subclasses():
+    with pytest.raises(ValidationError):
+        log("message", *range(100), "100")
+
+    assert metrics(*[True] * 100) == 100
+
+
+def test_generic_values():
+    assert groups([1], [2], []) == 3
+
+    with pytest.raises(ValidationError):
+        groups([1], (2,))
+
+
+def test_coerce_variadic():
+    @polycheck(coerce=True)
+    def total(*values: int, **weights: float) -> tuple:
+        return values, weights
+
+    assert total("1", 2, a="1.5") == ((1, 2), {"a": 1.5})
+    assert total(*["1"] * 20) == ((1,) * 20, {})
+
+    with pytest.raises(ValidationError):
+        total("one")
+
+
+def test_model_variadic():
+    logger = Logger()
+
+    assert logger.log("message", 1, level="info") == ("message", (1,), {"level": "info"})
+
+    with pytest.raises(ValidationError) as raised:
+        logger.log("message", 1, "2")
+
+    assert raised.value.errors()[0]["input"] == "values"
+
+    with pytest.raises(ValidationError):
+        logger.log("message", level=1)
@@ -0,0 +1,153 @@
+from typing import List
+
+import pytest
+from typing_extensions import Annotated
+
+from polyforce import Config, Field, PolyModel, policy, polycheck
+from polyforce.exceptions import ValidationError
+
+
+class Factory:
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.values[min(self.calls, len(self.values)) - 1]
+
+
+def test_factory_only_for_missing_arguments():
+    tags = Factory(["action"])
+
+    class Movie(PolyModel):
+        def __init__(self, name: str, tags: List[str] = Field(factory=tags)) -> None:
+            self.name = name
+            self.tags = tags
+
+    assert tags.calls == 0
+
+    movie = Movie("Avengers", ["drama"])
+    assert movie.tags == ["drama"]
+    assert tags.calls == 0
+
+    movie = Movie("Avengers")
+    assert movie.tags == ["action"]
+    assert tags.calls == 1
+
+    Movie(name="Avengers", tags=[])
+    assert tags.calls == 1
+
+
+def test_factory_called_for_each_call():
+    @polycheck()
+    def add(value: int, values: List[int] = Field(factory=list)) -> List[int]:
+        values.append(value)
+        return values
+
+    assert add(1) == [1]
+    assert add(2) == [2]
+    assert add(3, [1]) == [1, 3]
+
+
+def test_default_materialized():
+    @polycheck()
+    def greet(name: str = Field(default="polyforce"), *, prefix: str = Field(default="Hi")) -> str:
+        return f"{prefix} {name}"
+
+    assert greet() == "Hi polyforce"
+    assert greet("there") == "Hi there"
+    assert greet(prefix="Hello") == "Hello polyforce"
+
+
+def test_positional_only_materialized():
+    @polycheck()
+    def add(
+        value: int, values: List[int] = Field(factory=list), step: int = 1, /, *, end: int = 0
+    ) -> List[int]:
+        values.append(value * step + end)
+        return values
+
+    assert add(1) == [1]
+    assert add(2, [1]) == [1, 2]
+    assert add(2, [1], 3) == [1, 6]
+    assert add(1, end=1) == [2]
+
+    class Movie(PolyModel):
+        def __init__(self, name: str = Field(default="Avengers"), /) -> None:
+            self.name = name
+
+    assert Movie().name == "Avengers"
+    assert Movie("Thor").name == "Thor"
+
+
+def test_factory_result_validated():
+    @polycheck()
+    def count(value: int = Field(factory=lambda: "1")) -> int:
+        return value
+
+    with pytest.raises(ValidationError) as raised:
+        count()
+
+    assert raised.value.errors()[0]["input"] == "value"
+    assert count(1) == 1
+
+
+def test_factory_result_validated_once():
+    year = Factory(2012, "2013")
+
+    @polycheck()
+    def release(year: int = Field(factory=year)) -> int:
+        return year
+
+    assert release() == 2012
+    # The check only depends on the type, it is not repeated for the same factory.
+    assert release() == "2013"
+
+
+def test_factory_with_constraints_validated_every_call():
+    size = Factory(1, 0)
+
+    @polycheck()
+    def paginate(size: Annotated[int, lambda value: value > 0] = Field(factory=size)) -> int:
+        return size
+
+    assert paginate() == 1
+
+    with pytest.raises(ValidationError):
+        paginate()
+
+
+def test_defaults_without_checks():
+    tags = Factory(["action"])
+
+    class Movie(PolyModel):
+        config = Config(boundary_only=True)
+
+        @policy("off")
+        def get_tags(self, tags: List[str] = Field(factory=tags)) -> List[str]:
+            return tags
+
+        @policy("sampled", sample=2)
+        def get_name(self, name: str = Field(default="Avengers")) -> str:
+            return name
+
+        def get_genre(self, genre: str = Field(default="action")) -> str:
+            return genre
+
+        def describe(self) -> str:
+            return self.get_genre()
+
+    movie = Movie()
+
+    assert movie.get_tags() == ["action"]
+    assert [movie.get_name() for _ in range(3)] == ["Avengers"] * 3
+    assert movie.describe() == "action"
+
+
+def test_ignore_keeps_factory_unchecked():
+    @polycheck(ignore=True)
+    def count(value: int = Field(factory=lambda: "1")) -> int:
+        return value
+
+    assert count() == "1"
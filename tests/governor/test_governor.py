@@ -0,0 +1,205 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from polyforce import Config, Field, Policy, PolyModel, polycheck
+from polyforce.exceptions import ValidationError
+from polyforce.governor import WINDOW, Governor, get_rates
+
+
+def record(governor: Governor, check_ns: int, body_ns: int) -> None:
+    for _ in range(WINDOW):
+        governor.record(check_ns, body_ns)
+
+
+def test_lowers_and_raises_the_rate():
+    governor = Governor("movies.rate", budget=0.02)
+
+    record(governor, 10, 100)
+    assert governor.every == 5
+    assert governor.rate == 0.2
+
+    record(governor, 1, 100)
+    assert governor.every == 2
+
+    record(governor, 1, 100)
+    assert governor.every == 1
+
+    record(governor, 1, 100)
+    assert governor.every == 1
+
+
+def test_keeps_the_rate_in_budget():
+    governor = Governor("movies.rate", budget=0.02, every=4)
+
+    record(governor, 6, 100)
+    assert governor.every == 4
+
+
+def test_lowest_rate():
+    governor = Governor("movies.rate", budget=0.02, max_every=100)
+
+    record(governor, 100, 0)
+    assert governor.every == 100
+
+
+def test_skip():
+    governor = Governor("movies.rate", every=3)
+
+    assert [governor.skip() for _ in range(7)] == [False, True, True, False, True, True, False]
+
+
+def test_rates():
+    governor = Governor("movies.search", every=4)
+
+    assert get_rates()["movies.search"] == 0.25
+    assert repr(governor) == "Governor(name='movies.search', budget=0.02, rate=0.25)"
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: Governor("movies.rate", budget=0),
+        lambda: polycheck(overhead_budget=-1),
+    ],
+)
+def test_invalid_budget(factory):
+    with pytest.raises(ValueError):
+        factory()
+
+
+def test_invalid_budget_config():
+    with pytest.raises(ValueError):
+
+        class Movie(PolyModel):
+            config = Config(overhead_budget=0)
+
+
+class Movie(PolyModel):
+    config = Config(overhead_budget=0.02, policies={"score": Policy("full")})
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def rate(self, ratings: List[int]) -> int:
+        return len(ratings)
+
+    def score(self, ratings: List[int]) -> int:
+        return sum(ratings) or "none"
+
+    @staticmethod
+    def total(ratings: List[int]) -> int:
+        return sum(sum(range(1000)) for _ in ratings)
+
+
+def test_model_lowers_the_rate():
+    movie = Movie(name="Avengers")
+    ratings = list(range(1000))
+
+    with pytest.raises(ValidationError):
+        movie.rate(ratings="10")
+
+    for _ in range(WINDOW * 10):
+        assert movie.rate(ratings) == 1000
+
+    governor = Movie.__dict__["rate"].__polymodel_governor__
+    assert governor.every > 1
+    assert get_rates()[f"{__name__}.Movie.rate"] == governor.rate
+
+    # The calls not checked are not validated.
+    skipped = governor.countdown - 1
+    for _ in range(skipped):
+        assert movie.rate("10") == 2
+    with pytest.raises(ValidationError):
+        movie.rate("10")
+
+
+def test_model_keeps_the_rate():
+    for _ in range(WINDOW * 2):
+        Movie.total([1] * 100)
+
+    assert Movie.__dict__["total"].__func__.__polymodel_governor__.every == 1
+
+
+def test_model_checks_the_return():
+    movie = Movie(name="Avengers")
+
+    with pytest.raises(ValidationError):
+        movie.score([])
+
+
+def test_not_governed_without_budget():
+    class Serie(PolyModel):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    assert not hasattr(Serie.__dict__["__init__"], "__polymodel_governor__")
+
+
+def test_polycheck_governed():
+    @polycheck(overhead_budget=0.02)
+    def count(ratings: List[int], limit: int = Field(factory=lambda: 10)) -> int:
+        return min(len(ratings), limit)
+
+    ratings = list(range(1000))
+    with pytest.raises(ValidationError):
+        count("10")
+
+    for _ in range(WINDOW * 10):
+        assert count(ratings) == 10
+
+    governor = count.__polycheck__.governor
+    assert governor.every > 1
+    assert get_rates()[f"{__name__}.{count.__qualname__}"] == governor.rate
+
+    # The calls not checked still fill the defaults.
+    for _ in range(governor.countdown - 1):
+        assert count("10") == 2
+    with pytest.raises(ValidationError):
+        count("10")
+
+
+def test_polycheck_method_governed():
+    class Serie:
+        @polycheck(overhead_budget=0.02)
+        def count(self, ratings: List[int]) -> int:
+            return len(ratings)
+
+    serie = Serie()
+    for _ in range(WINDOW * 10):
+        assert serie.count(list(range(1000))) == 1000
+
+    assert Serie.count.__polycheck__.governor.every > 1
+
+
+def test_coroutine_function_governed():
+    @polycheck(overhead_budget=0.02)
+    async def fetch(ratings: List[int]) -> int:
+        await asyncio.sleep(0.001)
+        return len(ratings)
+
+    class Serie(PolyModel):
+        config = Config(overhead_budget=0.02, policies={"fetch": "full"})
+
+        async def fetch(self, ratings: List[int]) -> int:
+            await asyncio.sleep(0.001)
+            return len(ratings)
+
+    serie = Serie()
+
+    async def main() -> None:
+        for _ in range(WINDOW * 2):
+            assert await fetch([1]) == 1
+            assert await serie.fetch([1]) == 1
+
+        for _ in range(10):
+            with pytest.raises(ValidationError):
+                await fetch("10")
+            with pytest.raises(ValidationError):
+                await serie.fetch("10")
+
+    asyncio.run(main())
+
+    assert fetch.__polycheck__.governor.every == 1
+    assert Serie.__dict__["fetch"].__polymodel_governor__.every == 1
@@ -0,0 +1,2 @@
+def add_movie(name: str, year: int) -> str:
+    return f"{name} ({year})"
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+
+def add_movie(name: str, year: int) -> str:
+    return f"{name} ({year})"
+
+
+def count(tags: List[str]) -> int:
+    return len(tags)
+
+
+def untyped(name):
+    return name
+
+
+def _private(value: int) -> int:
+    return value
+
+
+class Catalog:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def search(self, query: str, limit: int = 10) -> Any:
+        return query, limit
+
+    @staticmethod
+    def parse(value: int) -> int:
+        return value
+
+    @classmethod
+    def create(cls, name: str) -> "Catalog":
+        return cls(name)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Catalog) and other.name == self.name
+
+
+@dataclass
+class Movie:
+    name: str
+    year: int = 2000
@@ -0,0 +1,140 @@
+import importlib
+import sys
+
+import pytest
+
+import polyforce
+from polyforce.exceptions import ValidationError
+
+PACKAGE = "tests.hooks.app"
+
+
+@pytest.fixture
+def hook():
+    hooks = []
+
+    def install(*args, **kwargs):
+        finder = polyforce.install_import_hook(*args, **kwargs)
+        hooks.append(finder)
+        return finder
+
+    yield install
+
+    for finder in hooks:
+        finder.uninstall()
+    for name in list(sys.modules):
+        if name.startswith(f"{PACKAGE}."):
+            del sys.modules[name]
+
+
+def test_import_hook(hook):
+    finder = hook([PACKAGE])
+    services = importlib.import_module(f"{PACKAGE}.services")
+
+    assert services.add_movie("Avengers", 2012) == "Avengers (2012)"
+    assert services.add_movie.__name__ == "add_movie"
+    assert hasattr(services.add_movie, "__polycheck__")
+
+    with pytest.raises(ValidationError) as raised:
+        services.add_movie("Avengers", year="2012")
+
+    assert raised.value.errors() == [
+        {
+            "source": "add_movie",
+            "value": "2012",
+            "input": "year",
+            "expected": "int",
+            "message": "Expected 'int' for attribute 'year', but received type 'str'.",
+        }
+    ]
+    assert f"{PACKAGE}.services.add_movie" in finder.decorated[f"{PACKAGE}.services"]
+
+
+def test_import_hook_skips_untyped(hook):
+    services = hook(PACKAGE) and importlib.import_module(f"{PACKAGE}.services")
+
+    assert services.untyped(1) == 1
+    assert not hasattr(services.untyped, "__polycheck__")
+
+
+def test_import_hook_methods(hook):
+    hook([PACKAGE])
+    services = importlib.import_module(f"{PACKAGE}.services")
+
+    catalog = services.Catalog("movies")
+    assert catalog.search("Avengers") == ("Avengers", 10)
+    assert services.Catalog.parse(1) == 1
+    assert services.Catalog.create("movies") == catalog
+
+    with pytest.raises(ValidationError):
+        services.Catalog(1)
+
+    with pytest.raises(ValidationError):
+        catalog.search("Avengers", limit="10")
+
+    with pytest.raises(ValidationError):
+        services.Catalog.parse("1")
+
+    with pytest.raises(ValidationError):
+        services.Catalog.create(1)
+
+    # The special methods, other than `__init__`, are not decorated.
+    assert not hasattr(services.Catalog.__eq__, "__polycheck__")
+
+
+def test_import_hook_dataclass(hook):
+    hook([PACKAGE])
+    services = importlib.import_module(f"{PACKAGE}.services")
+
+    assert services.Movie("Avengers").year == 2000
+
+    with pytest.raises(ValidationError):
+        services.Movie("Avengers", year="2012")
+
+
+def test_import_hook_patterns(hook):
+    finder = hook([PACKAGE], exclude=["*._*", f"{PACKAGE}.legacy.*", "*.Catalog.parse"])
+    services = importlib.import_module(f"{PACKAGE}.services")
+    legacy = importlib.import_module(f"{PACKAGE}.legacy")
+
+    assert services._private("1") == "1"
+    assert services.Catalog.parse("1") == "1"
+    assert legacy.add_movie("Avengers", "2012") == "Avengers (2012)"
+    assert finder.decorated[f"{PACKAGE}.legacy"] == []
+
+    with pytest.raises(ValidationError):
+        services.add_movie("Avengers", year="2012")
+
+
+def test_import_hook_include(hook):
+    hook([PACKAGE], include=[f"{PACKAGE}.legacy.*"])
+    services = importlib.import_module(f"{PACKAGE}.services")
+    legacy = importlib.import_module(f"{PACKAGE}.legacy")
+
+    assert services.add_movie("Avengers", "2012") == "Avengers (2012)"
+
+    with pytest.raises(ValidationError):
+        legacy.add_movie("Avengers", "2012")
+
+
+def test_import_hook_options(hook):
+    hook([PACKAGE], coerce=True)
+    services = importlib.import_module(f"{PACKAGE}.services")
+
+    assert services.add_movie("Avengers", "2012") == "Avengers (2012)"
+    assert services.Movie("Avengers", "2012").year == 2012
+
+
+def test_import_hook_other_packages(hook):
+    finder = hook([PACKAGE])
+
+    assert finder.find_spec("tests.monitoring.services", None) is None
+
+
+def test_uninstall(hook):
+    finder = hook([PACKAGE])
+    finder.uninstall()
+
+    assert finder not in sys.meta_path
+    services = importlib.import_module(f"{PACKAGE}.services")
+    assert not hasattr(services.add_movie, "__polycheck__")
@@ -0,0 +1,246 @@
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+
+from polyforce import Config, PolyModel, polycheck
+from polyforce._internal._plan import CallPlan
+from polyforce.backends import Backend, PythonBackend, get_backend, register_backend
+from polyforce.exceptions import ValidationError
+from polyforce.stream import validate_records
+
+pytest.importorskip("pydantic_core")
+
+
+class Movie(PolyModel):
+    config = Config(backend="pydantic-core")
+
+    def __init__(
+        self,
+        name: str,
+        year: int,
+        tags: Optional[List[str]] = None,
+        sequel: Optional["Movie"] = None,
+    ) -> None:
+        self.name = name
+        self.year = year
+        self.tags = tags
+        self.sequel = sequel
+
+    def rate(self, ratings: Dict[str, float]) -> float:
+        return sum(ratings.values())
+
+
+class Actor(PolyModel):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class CoercedMovie(Movie):
+    config = Config(coerce=True)
+
+
+@polycheck(backend="pydantic-core")
+def add_movie(name: str, year: int, tags: List[str]) -> List[str]:
+    return tags
+
+
+def test_backend_is_selected():
+    assert Movie.__polymodel_config__.backend is get_backend("pydantic-core")
+    assert Actor.__polymodel_config__.backend is get_backend("python")
+
+
+def test_pydantic_core_backend():
+    movie = Movie(name="Avengers", year=2012, tags=["action"])
+    sequel = Movie(name="Avengers 2", year=2015, sequel=movie)
+
+    assert sequel.sequel is movie
+    assert movie.rate(ratings={"imdb": 8.0}) == 8.0
+
+
+def test_pydantic_core_backend_errors():
+    with pytest.raises(ValidationError) as raised:
+        Movie(name=1, year="2012")
+
+    assert raised.value.errors() == [
+        {
+            "source": "__init__",
+            "value": 1,
+            "input": "name",
+            "expected": "str",
+            "message": "Expected 'str' for attribute 'name', but received type 'int'.",
+        },
+        {
+            "source": "__init__",
+            "value": "2012",
+            "input": "year",
+            "expected": "int",
+            "message": "Expected 'int' for attribute 'year', but received type 'str'.",
+        },
+    ]
+
+
+def test_pydantic_core_backend_validates_items():
+    with pytest.raises(ValidationError) as raised:
+        Movie(name="Avengers", year=2012, tags=["action", 1])
+
+    assert raised.value.errors() == [
+        {
+            "source": "__init__",
+            "value": ["action", 1],
+            "input": "tags",
+            "expected": "Union[List[str], NoneType]",
+            "message": "Expected 'Union[List[str], NoneType]' for attribute 'tags[1]', but received type 'int'.",
+        }
+    ]
+
+    with pytest.raises(ValidationError):
+        Movie(name="Avengers", year=2012, sequel="Avengers 2")
+
+
+def test_pydantic_core_backend_coerce():
+    movie = CoercedMovie(name="Avengers", year="2012", tags=("action",))
+
+    assert movie.year == 2012
+    assert movie.tags == ["action"]
+    assert movie.rate(ratings={"imdb": "8"}) == 8.0
+
+
+def test_pydantic_core_backend_polycheck():
+    tags = ["action"]
+
+    assert add_movie(name="Avengers", year=2012, tags=tags) is tags
+
+    with pytest.raises(ValidationError) as raised:
+        add_movie("Avengers", 2012, [1])
+
+    assert raised.value.errors()[0]["input"] == "tags"
+
+
+def test_pydantic_core_backend_stream():
+    errors = []
+
+    movies = list(
+        validate_records(
+            [{"name": "Avengers", "year": "2012"}, {"name": "Thor", "year": "x"}],
+            Movie,
+            errors=errors.append,
+            coerce=True,
+        )
+    )
+
+    assert [movie.year for movie in movies] == [2012]
+    assert errors[0]["row"] == 1
+
+
+def test_custom_backend():
+    plans = []
+
+    class RecordingBackend(Backend):
+        name = "recording"
+
+        def build_plan(self, **options: Any) -> CallPlan:
+            plan = PythonBackend().build_plan(**options)
+            plans.append(plan)
+            return plan
+
+    register_backend(RecordingBackend())
+
+    class Director(PolyModel):
+        config = Config(backend="recording")
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    assert [plan.source for plan in plans] == ["__init__"]
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+
+        class Director(PolyModel):
+            config = Config(backend="rust")
+
+
+def test_variadic_pydantic_core():
+    @polycheck(backend="pydantic-core")
+    def log(*values: int, **tags: str) -> tuple:
+        return values, tags
+
+    assert log(1, 2, level="info") == ((1, 2), {"level": "info"})
+
+    with pytest.raises(ValidationError) as raised:
+        log(1, "2")
+
+    assert raised.value.errors()[0]["message"] == (
+        "Expected 'int' for attribute 'values[1]', but received type 'str'."
+    )
+
+    with pytest.raises(ValidationError) as raised:
+        log(level=1)
+
+    assert raised.value.errors()[0]["message"] == (
+        "Expected 'str' for attribute 'tags['level']', but received type 'int'."
+    )
+
+
+def test_backend_is_abstract():
+    class IncompleteBackend(Backend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+@pytest.mark.parametrize(
+    "annotation,value,python,pydantic_core",
+    [(int, True, True, False), (float, 1, False, True), (bool, 1, False, False)],
+)
+def test_strict_scalars(annotation, value, python, pydantic_core):
+    for backend, valid in (("python", python), ("pydantic-core", pydantic_core)):
+
+        @polycheck(backend=backend)
+        def function(value: annotation) -> None:
+            ...
+
+        if valid:
+            function(value)
+        else:
+            with pytest.raises(ValidationError):
+                function(value)
+
+
+@pytest.mark.parametrize(
+    "kwargs,attribute",
+    [
+        ({"ratings": [1, "10"]}, "ratings[1]"),
+        ({"ratings": "high", "roles": {"Thor": [1, "2"]}}, "roles['Thor']"),
+    ],
+)
+def test_union_error_paths(kwargs, attribute):
+    @polycheck(backend="pydantic-core")
+    def rate(
+        ratings: Union[List[int], str], roles: Optional[Dict[str, Union[int, List[int]]]] = None
+    ) -> None:
+        ...
+
+    with pytest.raises(ValidationError) as raised:
+        rate(**kwargs)
+
+    assert f"for attribute '{attribute}'" in raised.value.errors()[0]["message"]
+
+
+def test_pydantic_core_backend_coerce_keeps_valid_arguments():
+    @polycheck(backend="pydantic-core", coerce=True)
+    def add_rating(ratings: List[int], scores: Dict[str, float], rating: int) -> List[int]:
+        ratings.append(rating)
+        return ratings
+
+    ratings: List[int] = [1]
+    scores = {"imdb": 8.0}
+
+    assert add_rating(ratings, scores, "2") is ratings
+    assert ratings == [1, 2]
+
+    converted = add_rating(("1",), scores, 2)
+    assert converted == [1, 2]
+    assert isinstance(converted, list)
@@ -0,0 +1,178 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, List, Union
+
+import pytest
+
+from polyforce import Config, Field, ModelBatch, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+class Movie(PolyModel):
+    created: ClassVar[int] = 0
+
+    def __init__(
+        self, name: str, year: int, rating: float = 0.0, tags: Union[List[str], None] = None
+    ) -> None:
+        Movie.created += 1
+        self.name = name
+        self.year = year
+        self.rating = rating
+        self.tags = tags
+
+
+class Point(PolyModel):
+    config = Config(frozen=True, coerce=True)
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+def test_batch():
+    movies = Movie.batch({"name": ["Avengers", "Thor"], "year": [2012, 2011]})
+
+    assert isinstance(movies, ModelBatch)
+    assert len(movies) == 2
+    assert movies["name"] == ["Avengers", "Thor"]
+    assert list(movies["year"]) == [2012, 2011]
+
+
+def test_batch_columns_are_arrays():
+    movies = Movie.batch(
+        {"name": ["Avengers", "Thor"], "year": [2012, 2011], "rating": [8.0, 7.0]}
+    )
+
+    assert not isinstance(movies["year"], list)
+    assert not isinstance(movies["rating"], list)
+    assert isinstance(movies["name"], list)
+
+
+def test_batch_mixed_columns_are_lists():
+    movies = Movie.batch({"name": ["Avengers", "Thor"], "year": [2012, True]})
+
+    assert isinstance(movies["year"], list)
+    assert movies[1].year is True
+
+
+def test_batch_materializes_on_access():
+    Movie.created = 0
+    movies = Movie.batch({"name": ["Avengers", "Thor"], "year": [2012, 2011]})
+
+    assert Movie.created == 0
+
+    movie = movies[1]
+
+    assert Movie.created == 1
+    assert isinstance(movie, Movie)
+    assert movie.name == "Thor"
+    assert movie.year == 2011
+    assert movie.rating == 0.0
+    assert movies[-1].name == "Thor"
+    assert [movie.name for movie in movies] == ["Avengers", "Thor"]
+
+
+def test_batch_from_arrays():
+    movies = Movie.batch({"name": ("Avengers",), "year": array("q", [2012])})
+
+    assert movies[0].year == 2012
+
+
+def test_batch_errors_with_rows():
+    with pytest.raises(ValidationError) as raised:
+        Movie.batch({"name": ["Avengers", 1, "Thor"], "year": [2012, 2011, "2011"]})
+
+    assert raised.value.errors() == [
+        {
+            "source": "__init__",
+            "value": 1,
+            "input": "name",
+            "expected": "str",
+            "message": "Expected 'str' for attribute 'name', but received type 'int'.",
+            "row": 1,
+        },
+        {
+            "source": "__init__",
+            "value": "2011",
+            "input": "year",
+            "expected": "int",
+            "message": "Expected 'int' for attribute 'year', but received type 'str'.",
+            "row": 2,
+        },
+    ]
+
+
+def test_batch_generic_columns():
+    movies = Movie.batch({"name": ["Avengers"], "year": [2012], "tags": [["action"]]})
+
+    assert movies[0].tags == ["action"]
+
+    with pytest.raises(ValidationError) as raised:
+        Movie.batch({"name": ["Avengers"], "year": [2012], "tags": ["action"]})
+
+    assert raised.value.errors()[0]["row"] == 0
+
+
+def test_batch_coerce_and_frozen():
+    points = Point.batch({"x": ["1", 2], "y": [3, "4"]})
+
+    assert list(points["x"]) == [1, 2]
+    assert points[0] == Point(x=1, y=3)
+
+
+def test_batch_invalid_columns():
+    with pytest.raises(TypeError):
+        Movie.batch({"name": ["Avengers"]})
+
+    with pytest.raises(TypeError):
+        Movie.batch({"name": ["Avengers"], "year": [2012], "director": ["Joss"]})
+
+    with pytest.raises(ValueError):
+        Movie.batch({"name": ["Avengers", "Thor"], "year": [2012]})
+
+
+def test_batch_parallel():
+    names = [f"Movie {index}" for index in range(10)]
+    years = [2000 + index for index in range(10)]
+    years[3] = "2003"
+    years[8] = None
+
+    with pytest.raises(ValidationError) as raised:
+        Movie.batch({"name": names, "year": years}, parallel=2, chunk_size=3)
+
+    assert [error["row"] for error in raised.value.errors()] == [3, 8]
+
+    years[3], years[8] = 2003, 2008
+    movies = Movie.batch({"name": names, "year": years}, parallel=2, chunk_size=3)
+
+    assert len(movies) == 10
+    assert movies[9].year == 2009
+
+
+def test_batch_parallel_coerce():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        points = Point.batch(
+            {"x": ["1", 2, "3"], "y": [4, "5", 6]}, parallel=executor, chunk_size=2
+        )
+
+    assert list(points["x"]) == [1, 2, 3]
+    assert list(points["y"]) == [4, 5, 6]
+
+
+def test_batch_field_defaults_of_missing_columns():
+    class Serie(PolyModel):
+        def __init__(
+            self,
+            name: str,
+            tags: List[str] = Field(factory=list),
+            seasons: int = Field(default=1),
+        ) -> None:
+            self.name = name
+            self.tags = tags
+            self.seasons = seasons
+
+    series = Serie.batch({"name": ["Friends", "Lost"]})
+
+    assert series[0].tags == [] and series[0].seasons == 1
+    assert series[0].tags is not series[1].tags
+    assert series[1].tags == Serie("Lost").tags
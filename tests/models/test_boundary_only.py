@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from polyforce import Config, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+class Service(PolyModel):
+    config = Config(boundary_only=True)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+
+    def handle(self, value: Any) -> int:
+        # An internal call with a value the public method did not validate.
+        return self.store(value)
+
+    def store(self, value: int) -> int:
+        self.calls += 1
+        return value
+
+    def forward(self, other: "Service", value: Any) -> int:
+        return other.store(value)
+
+    def fail(self) -> None:
+        raise RuntimeError("Failed")
+
+    @staticmethod
+    def parse(value: Any) -> int:
+        return Service.convert(value)
+
+    @staticmethod
+    def convert(value: int) -> int:
+        return value
+
+
+@pytest.fixture
+def service():
+    return Service(name="movies")
+
+
+def test_outermost_call_is_checked(service):
+    with pytest.raises(ValidationError):
+        service.store(value="1")
+
+
+def test_internal_calls_are_not_checked(service):
+    assert service.handle(value="1") == "1"
+    assert service.calls == 1
+    assert Service.parse(value="1") == "1"
+
+    with pytest.raises(ValidationError):
+        Service.convert(value="1")
+
+
+def test_calls_on_other_instances_are_checked(service):
+    with pytest.raises(ValidationError):
+        service.forward(other=Service(name="books"), value="1")
+
+
+def test_boundary_is_reset(service):
+    service.handle(value="1")
+
+    with pytest.raises(ValidationError):
+        service.store(value="1")
+
+    with pytest.raises(RuntimeError):
+        service.fail()
+
+    with pytest.raises(ValidationError):
+        service.store(value="1")
+
+
+def test_boundary_per_thread(service):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda value: service.handle(value=value), ["1", "2"]))
+
+        with pytest.raises(ValidationError):
+            executor.submit(service.store, value="1").result()
+
+    assert results == ["1", "2"]
+
+
+def test_boundary_per_task(service):
+    async def handle(value: Any) -> int:
+        await asyncio.sleep(0)
+        return service.handle(value=value)
+
+    async def store(value: Any) -> int:
+        await asyncio.sleep(0)
+        return service.store(value=value)
+
+    async def main() -> Any:
+        return await asyncio.gather(handle("1"), store("2"), return_exceptions=True)
+
+    handled, stored = asyncio.run(main())
+
+    assert handled == "1"
+    assert isinstance(stored, ValidationError)
+
+
+def test_inherited_without_boundary():
+    class Strict(Service):
+        config = Config(boundary_only=False)
+
+    with pytest.raises(ValidationError):
+        Strict(name="strict").handle(value="1")
+
+
+def test_internal_awaited_calls_are_not_checked():
+    class Repository(PolyModel):
+        config = Config(boundary_only=True)
+
+        async def outer(self, value: Any) -> Any:
+            await asyncio.sleep(0)
+            return await self.inner(value=value)
+
+        async def inner(self, value: int) -> Any:
+            await asyncio.sleep(0)
+            return value
+
+        @staticmethod
+        async def parse(value: Any) -> Any:
+            return await Repository.convert(value)
+
+        @staticmethod
+        async def convert(value: int) -> Any:
+            return value
+
+    repository = Repository()
+
+    assert asyncio.run(repository.outer("1")) == "1"
+    assert asyncio.run(Repository.parse("1")) == "1"
+
+    with pytest.raises(ValidationError):
+        asyncio.run(repository.inner("1"))
+    with pytest.raises(ValidationError):
+        asyncio.run(Repository.convert("1"))
@@ -0,0 +1,44 @@
+from datetime import date
+
+import pytest
+
+from polyforce import Config, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+class Movie(PolyModel):
+    config = Config(coerce=True)
+
+    def __init__(self, name: str, year: int) -> None:
+        self.name = name
+        self.year = year
+
+    def set_release(self, release: date) -> date:
+        self.release = release
+        return release
+
+
+def test_coerce_on_init():
+    movie = Movie(name="Avengers", year="2012")
+
+    assert movie.year == 2012
+
+
+def test_coerce_on_method():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert movie.set_release("2012-04-11") == date(2012, 4, 11)
+
+
+def test_coerce_invalid_value():
+    with pytest.raises(ValidationError):
+        Movie(name="Avengers", year="twenty")
+
+
+def test_coerce_inherited():
+    class Serie(Movie):
+        ...
+
+    serie = Serie("24", "2001")
+
+    assert serie.year == 2001
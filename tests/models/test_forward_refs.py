@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from polyforce import Field, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+class Movie(PolyModel):
+    def __init__(self, name: str, year: int = Field(default=2023)) -> None:
+        self.name = name
+        self.year = year
+
+    def add_sequel(self, sequel: Movie) -> Movie:
+        return sequel
+
+    def add_actors(self, actors: List[Actor]) -> None:
+        self.actors = actors
+
+
+class Actor(PolyModel):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def test_resolves_init():
+    movie = Movie(name="Avengers")
+
+    assert movie.year == 2023
+    assert movie.poly_fields["__init__"]["name"].annotation is str
+
+    with pytest.raises(ValidationError):
+        Movie(name=1)
+
+
+def test_resolves_class_reference():
+    movie = Movie(name="Avengers")
+    sequel = Movie(name="Avengers 2")
+
+    assert movie.add_sequel(sequel) is sequel
+
+    with pytest.raises(ValidationError):
+        movie.add_sequel("Avengers 2")
+
+
+def test_resolves_names_declared_later():
+    movie = Movie(name="Avengers")
+    movie.add_actors(actors=[Actor(name="Tony")])
+
+    assert movie.poly_fields["add_actors"]["actors"].annotation == List[Actor]
+
+    with pytest.raises(ValidationError):
+        movie.add_actors(actors="Tony")
+
+
+def test_default_validated_once_resolved():
+    with pytest.raises(TypeError):
+
+        class Serie(PolyModel):
+            def __init__(self, name: str = Field(default=1)) -> None:
+                ...
@@ -0,0 +1,155 @@
+import copy
+import pickle
+import weakref
+from typing import List, Union
+
+import pytest
+
+from polyforce import Config, PolyModel
+from polyforce.exceptions import FrozenInstanceError
+
+
+class Point(PolyModel):
+    config = Config(frozen=True)
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def move(self, x: int) -> None:
+        self.x = x
+
+
+class Point3D(Point):
+    def __init__(self, x: int, y: int, z: int = 0) -> None:
+        super().__init__(x=x, y=y)
+        self.z = z
+
+
+class Movie(PolyModel):
+    config = Config(frozen=True, slots=True)
+
+    point: Point
+
+    def __init__(self, name: str, tags: Union[List[str], None] = None) -> None:
+        self.name = name
+        self.tags = tags
+        self.point = Point(x=1, y=2)
+
+
+def test_frozen_assignment_in_init():
+    point = Point(x=1, y=2)
+
+    assert point.x == 1
+    assert point.y == 2
+
+
+def test_frozen_raises_on_assignment():
+    point = Point(x=1, y=2)
+
+    with pytest.raises(FrozenInstanceError) as raised:
+        point.x = 3
+
+    assert str(raised.value) == "'x' cannot be assigned, the instances of 'Point' are frozen."
+    assert isinstance(raised.value, AttributeError)
+    assert point.x == 1
+
+
+def test_frozen_raises_on_delete():
+    point = Point(x=1, y=2)
+
+    with pytest.raises(FrozenInstanceError):
+        del point.x
+
+
+def test_frozen_raises_on_methods():
+    point = Point(x=1, y=2)
+
+    with pytest.raises(FrozenInstanceError):
+        point.move(x=4)
+
+
+def test_frozen_equality():
+    assert Point(x=1, y=2) == Point(x=1, y=2)
+    assert Point(x=1, y=2) != Point(x=2, y=1)
+    assert Point(x=1, y=2) != Point3D(x=1, y=2)
+    assert Point3D(x=1, y=2, z=3) != Point3D(x=1, y=2)
+
+
+def test_frozen_hash():
+    point = Point(x=1, y=2)
+
+    assert hash(point) == hash(Point(x=1, y=2))
+    assert hash(point) == hash(point)
+    assert len({point, Point(x=1, y=2), Point(x=3, y=4)}) == 2
+    assert repr(point) == "Point(x=1, y=2)"
+
+
+def test_frozen_inherited():
+    point = Point3D(x=1, y=2, z=3)
+
+    assert Point3D.__polymodel_fields__ == ("x", "y", "z")
+
+    with pytest.raises(FrozenInstanceError):
+        point.z = 4
+
+
+def test_frozen_keeps_weakref():
+    point = Point(x=1, y=2)
+
+    assert weakref.ref(point)() is point
+
+
+def test_frozen_slots():
+    movie = Movie(name="Avengers", tags=["action"])
+
+    assert not hasattr(movie, "__dict__")
+    assert movie.__polymodel_slots__ == ("name", "tags", "point")
+    assert Movie.__polymodel_fields__ == ("name", "tags", "point")
+    assert movie == Movie(name="Avengers", tags=["action"])
+    assert movie.point == Point(x=1, y=2)
+
+    with pytest.raises(FrozenInstanceError):
+        movie.name = "Avengers 2"
+
+
+def test_frozen_unhashable_fields():
+    movie = Movie(name="Avengers", tags=["action"])
+
+    with pytest.raises(TypeError):
+        hash(movie)
+
+
+def test_not_frozen_by_default():
+    class Film(PolyModel):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    assert Film(name="Avengers") != Film(name="Avengers")
+
+    film = Film(name="Avengers")
+    film.name = "Avengers 2"
+
+    assert film.name == "Avengers 2"
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+@pytest.mark.parametrize("hashed", [False, True])
+def test_frozen_copy_and_pickle(duplicate, hashed):
+    point = Point3D(x=1, y=2, z=3)
+    movie = Movie(name="Avengers")
+    if hashed:
+        hash(point)
+        hash(movie)
+
+    for value in (point, movie):
+        duplicated = duplicate(value)
+
+        assert duplicated == value
+        assert hash(duplicated) == hash(value)
+        with pytest.raises(FrozenInstanceError):
+            duplicated.x = 2
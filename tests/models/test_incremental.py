@@ -0,0 +1,80 @@
+import pytest
+
+from polyforce import Config, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+def audit(func):
+    func.__audited__ = True
+    return func
+
+
+class Movie(PolyModel):
+    def __init__(self, name: str, year: int) -> None:
+        self.name = name
+        self.year = year
+
+    @audit
+    def set_year(self, year: int) -> None:
+        self.year = year
+
+    @classmethod
+    def create(cls, name: str) -> "Movie":
+        return cls(name=name, year=2023)
+
+
+class Serie(Movie):
+    def set_name(self, name: str) -> None:
+        self.name = name
+
+
+class IgnoredSerie(Serie):
+    config = Config(ignore=True)
+
+
+class CoercedSerie(Serie):
+    config = Config(coerce=True)
+
+
+def test_subclass_reuses_config():
+    assert Serie.__polymodel_config__ is Movie.__polymodel_config__
+    assert IgnoredSerie.__polymodel_config__ is not Movie.__polymodel_config__
+
+
+def test_subclass_reuses_inherited_plans():
+    assert "set_year" not in Serie.__dict__
+    assert set(Serie.__polymodel_plans__.maps[0]) == {"set_name"}
+    assert Serie.__polymodel_plans__["set_year"] is Movie.__polymodel_plans__["set_year"]
+
+    with pytest.raises(ValidationError):
+        Serie(name="24", year=2001).set_year(year="2002")
+
+
+def test_inherited_methods_rechecked_with_ignore():
+    assert (
+        IgnoredSerie.__polymodel_plans__["set_year"] is not Movie.__polymodel_plans__["set_year"]
+    )
+
+    serie = IgnoredSerie(name="24", year="2001")
+    serie.set_year(year="2002")
+    serie.set_name(name=1)
+
+    assert serie.year == "2002"
+    assert serie.name == 1
+    assert IgnoredSerie.create(name=1).name == 1
+
+
+def test_inherited_methods_rechecked_with_coerce():
+    serie = CoercedSerie(name="24", year="2001")
+    serie.set_year(year="2002")
+
+    assert serie.year == 2002
+    assert CoercedSerie.set_year.__audited__ is True
+
+
+def test_bases_not_changed():
+    with pytest.raises(ValidationError):
+        Movie(name="Avengers", year="2012")
+
+    with pytest.raises(ValidationError):
+        Serie(name="24", year="2001")
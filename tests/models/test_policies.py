@@ -0,0 +1,204 @@
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from polyforce import Config, Policy, PolyModel, policy
+from polyforce.exceptions import ValidationError
+
+
+class Movie(PolyModel):
+    config = Config(policies={"rank": "off", "rate": Policy("return")})
+
+    def __init__(self, name: str, year: int) -> None:
+        self.name = name
+        self.year = year
+
+    def rank(self, score: float) -> float:
+        return score
+
+    def rate(self, score: float) -> float:
+        return score
+
+    @policy("full")
+    def title(self, prefix: str) -> str:
+        return prefix
+
+    @policy("sampled", sample=3)
+    def set_year(self, year: int) -> None:
+        self.year = year
+
+    @policy(trusted=("year",))
+    def set_release(self, name: str, year: int) -> None:
+        self.name = name
+        self.year = year
+
+    @staticmethod
+    @policy("full")
+    def parse(value: str) -> int:
+        return value  # type: ignore[return-value]
+
+    @policy("off")
+    @classmethod
+    def create(cls, name: str) -> "Movie":
+        return cls(name=str(name), year=2023)
+
+
+@pytest.fixture
+def movie():
+    return Movie(name="Avengers", year=2012)
+
+
+def test_off(movie):
+    assert movie.rank(score="high") == "high"
+    assert Movie.create(name=1).name == "1"
+    assert not hasattr(Movie.rank, "__polymodel_wrapped__")
+
+
+def test_args_only_is_the_default(movie):
+    with pytest.raises(ValidationError):
+        Movie(name="Avengers", year="2012")
+
+
+def test_return_only(movie):
+    assert movie.rate(score=1.0) == 1.0
+
+    with pytest.raises(ValidationError) as raised:
+        movie.rate(score="high")
+
+    assert raised.value.errors() == [
+        {
+            "source": "Movie",
+            "value": "high",
+            "input": "return",
+            "expected": "float",
+            "message": "Expected 'float' for attribute 'return', but received type 'str'.",
+        }
+    ]
+
+
+def test_full(movie):
+    assert movie.title(prefix="The") == "The"
+
+    with pytest.raises(ValidationError) as raised:
+        movie.title(prefix=1)
+
+    assert raised.value.errors()[0]["input"] == "prefix"
+
+    with pytest.raises(ValidationError) as raised:
+        Movie.parse(value="1")
+
+    assert raised.value.errors()[0]["input"] == "return"
+
+
+def test_sampled(movie):
+    with pytest.raises(ValidationError):
+        movie.set_year(year="2013")
+
+    movie.set_year(year="2014")
+    movie.set_year(year="2015")
+
+    with pytest.raises(ValidationError):
+        movie.set_year(year="2016")
+
+
+def test_trusted(movie):
+    movie.set_release(name="Avengers 2", year="2015")
+
+    assert movie.year == "2015"
+
+    with pytest.raises(ValidationError):
+        movie.set_release(name=2, year=2015)
+
+
+def test_policy_inherited_and_overridden():
+    class Serie(Movie):
+        config = Config(policies={"rank": "args"})
+
+    serie = Serie(name="24", year=2001)
+
+    with pytest.raises(ValidationError):
+        serie.rank(score="high")
+
+    assert Movie(name="Avengers", year=2012).rank(score="high") == "high"
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        Policy("sometimes")
+
+    with pytest.raises(ValueError):
+        Policy("sampled", sample=0)
+
+
+def test_policy_of_unknown_method():
+    with pytest.raises(ValueError) as raised:
+
+        class Serie(PolyModel):
+            config = Config(policies={"rnak": "off"})
+
+            def rank(self, score: float) -> float:
+                return score
+
+    assert str(raised.value) == "'rnak' of the policies is not a method of 'Serie'."
+
+
+@pytest.mark.parametrize(
+    "policies,marker",
+    [
+        ({"rank": Policy(trusted=("scroe",))}, lambda function: function),
+        ({}, policy(trusted=("scroe",))),
+    ],
+)
+def test_policy_of_unknown_trusted(policies, marker):
+    with pytest.raises(ValueError) as raised:
+
+        class Serie(PolyModel):
+            config = Config(policies=policies)
+
+            @marker
+            def rank(self, score: float) -> float:
+                return score
+
+    assert str(raised.value) == "The trusted ['scroe'] are not parameters of 'Serie.rank'."
+
+
+def test_policy_of_inherited_method():
+    class Serie(Movie):
+        config = Config(policies={"rate": "off"})
+
+    assert Serie(name="24", year=2001).rate(score="high") == "high"
+
+
+def test_async_method_return_checked():
+    class Repository(PolyModel):
+        @policy("full")
+        async def get(self, key: int) -> int:
+            await asyncio.sleep(0)
+            return key
+
+        @staticmethod
+        @policy("return")
+        async def parse(value: str) -> int:
+            return value  # type: ignore[return-value]
+
+    repository = Repository()
+
+    assert asyncio.run(repository.get(1)) == 1
+
+    with pytest.raises(ValidationError):
+        asyncio.run(repository.get("1"))
+
+    with pytest.raises(ValidationError) as raised:
+        asyncio.run(Repository.parse("1"))
+
+    assert raised.value.errors()[0]["input"] == "return"
+
+
+def test_generator_method_return_checked():
+    class Repository(PolyModel):
+        @policy("full")
+        def keys(self, limit: int) -> Iterator[int]:
+            yield from range(limit)
+
+    assert list(Repository().keys(2)) == [0, 1]
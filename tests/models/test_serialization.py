@@ -0,0 +1,139 @@
+import gc
+import weakref
+from typing import Dict, List, Set, Union
+
+import orjson
+import pytest
+
+from polyforce import Config, PolyModel
+
+
+class Actor(PolyModel):
+    def __init__(self, name: str, age: int) -> None:
+        self.name = name
+        self.age = age
+
+
+class Movie(PolyModel):
+    rating: float
+
+    def __init__(
+        self,
+        name: str,
+        year: int,
+        actors: Union[List[Actor], None] = None,
+        roles: Union[Dict[str, Actor], None] = None,
+    ) -> None:
+        self.name = name
+        self.year = year
+        self.actors = actors or []
+        self.roles = roles or {}
+
+    def set_rating(self, rating: float) -> None:
+        self.rating = rating
+
+
+class SlottedMovie(PolyModel):
+    config = Config(slots=True)
+
+    def __init__(self, name: str, tags: Union[List[str], Set[str], None] = None) -> None:
+        self.name = name
+        self.tags = tags
+
+
+def test_to_dict():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert movie.to_dict() == {"name": "Avengers", "year": 2012, "actors": [], "roles": {}}
+
+
+def test_to_dict_declared_attributes():
+    movie = Movie(name="Avengers", year=2012)
+    movie.set_rating(8.0)
+
+    assert movie.to_dict()["rating"] == 8.0
+
+
+def test_to_dict_nested():
+    actor = Actor(name="Robert", age=58)
+    movie = Movie(name="Avengers", year=2012, actors=[actor], roles={"iron man": actor})
+
+    assert movie.to_dict() == {
+        "name": "Avengers",
+        "year": 2012,
+        "actors": [{"name": "Robert", "age": 58}],
+        "roles": {"iron man": {"name": "Robert", "age": 58}},
+    }
+
+
+def test_to_dict_include_exclude():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert movie.to_dict(include={"name", "year"}) == {"name": "Avengers", "year": 2012}
+    assert movie.to_dict(exclude={"actors", "roles"}) == {"name": "Avengers", "year": 2012}
+    assert movie.to_dict(include={"name", "year"}, exclude={"year"}) == {"name": "Avengers"}
+
+
+def test_to_dict_slots():
+    movie = SlottedMovie(name="Avengers", tags=["action"])
+
+    assert movie.to_dict() == {"name": "Avengers", "tags": ["action"]}
+
+
+def test_to_json():
+    actor = Actor(name="Robert", age=58)
+    movie = Movie(name="Avengers", year=2012, actors=[actor])
+
+    assert movie.to_json() == (
+        '{"name":"Avengers","year":2012,"actors":[{"name":"Robert","age":58}],"roles":{}}'
+    )
+    assert orjson.loads(movie.to_json_bytes()) == movie.to_dict()
+
+
+def test_to_json_include_exclude():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert movie.to_json(include={"name"}) == '{"name":"Avengers"}'
+    assert movie.to_json_bytes(exclude={"actors", "roles", "year"}) == b'{"name":"Avengers"}'
+
+
+def test_to_json_sets():
+    movie = SlottedMovie(name="Avengers", tags={"action"})
+
+    assert movie.to_json() == '{"name":"Avengers","tags":["action"]}'
+
+
+def test_to_json_unsupported_type():
+    movie = SlottedMovie(name="Avengers", tags=[object()])
+
+    with pytest.raises(TypeError):
+        movie.to_json()
+
+
+def test_serializers_kept_by_the_class():
+    class Director(Actor):
+        def __init__(self, name: str, age: int, movies: int) -> None:
+            super().__init__(name=name, age=age)
+            self.movies = movies
+
+    assert Actor(name="Robert", age=58).to_dict(exclude={"age"}) == {"name": "Robert"}
+    assert Director(name="Joss", age=59, movies=7).to_dict(exclude={"age"}) == {
+        "name": "Joss",
+        "movies": 7,
+    }
+    assert list(Director.__polymodel_serializers__) == [(None, frozenset({"age"}))]
+    assert Director.__polymodel_serializers__ is not Actor.__polymodel_serializers__
+
+
+def test_dynamic_models_collected():
+    class Serie(PolyModel):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    assert Serie(name="Friends").to_dict() == {"name": "Friends"}
+
+    reference = weakref.ref(Serie)
+    del Serie
+    gc.collect()
+
+    assert reference() is None
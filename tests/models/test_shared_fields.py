@@ -0,0 +1,48 @@
+from polyforce import PolyModel
+from polyforce.fields import PolyField
+
+
+class Base(PolyModel):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def set_name(self, name: str) -> None:
+        self.name = name
+
+    def set_year(self, year: int) -> None:
+        self.year = year
+
+
+class Child(Base):
+    def set_year(self, year: str) -> None:
+        self.year = year
+
+
+class GrandChild(Child):
+    def set_rating(self, rating: float) -> None:
+        self.rating = rating
+
+
+def test_inherited_fields_are_shared():
+    assert GrandChild.poly_fields["set_name"] is Base.poly_fields["set_name"]
+    assert GrandChild.poly_fields["__init__"] is Base.poly_fields["__init__"]
+    assert GrandChild.__signature__["set_name"] is Base.__signature__["set_name"]
+    assert GrandChild.__polymodel_plans__["set_name"] is Base.__polymodel_plans__["set_name"]
+
+
+def test_only_own_fields_are_stored():
+    assert set(Child.poly_fields.maps[0]) == {"set_year"}
+    assert set(GrandChild.poly_fields.maps[0]) == {"set_rating"}
+    assert set(GrandChild.poly_fields) == {"__init__", "set_name", "set_year", "set_rating"}
+
+
+def test_overridden_fields():
+    assert Base.poly_fields["set_year"]["year"].annotation is int
+    assert Child.poly_fields["set_year"]["year"].annotation is str
+    assert GrandChild.poly_fields["set_year"]["year"].annotation is str
+
+    GrandChild(name="Avengers").set_year(year="2012")
+
+
+def test_polyfield_has_no_attributes_set():
+    assert "_attributes_set" not in PolyField.__slots__
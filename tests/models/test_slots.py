@@ -0,0 +1,91 @@
+import sys
+from typing import ClassVar, List, Union
+
+import pytest
+
+from polyforce import Config, Field, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+class Movie(PolyModel):
+    config = Config(slots=True)
+
+    def __init__(self, name: str, year: int, tags: Union[List[str], None] = None) -> None:
+        self.name = name
+        self.year = year
+        self.tags = tags
+
+    def set_name(self, name: str) -> None:
+        self.name = name
+
+
+class Serie(Movie):
+    season: int
+    kind: ClassVar[str] = "serie"
+
+    def __init__(self, name: str, year: int = Field(default=2023), episodes: int = 1) -> None:
+        super().__init__(name=name, year=year)
+        self.episodes = episodes
+        self.season = 1
+
+
+class Film(PolyModel):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def test_slots_generated_from_init():
+    assert Movie.__slots__ == ("name", "year", "tags")
+
+    movie = Movie(name="Avengers", year=2012)
+
+    assert not hasattr(movie, "__dict__")
+    assert movie.name == "Avengers"
+    assert movie.year == 2012
+
+
+def test_slots_inherited():
+    assert Serie.__slots__ == ("episodes", "season")
+
+    serie = Serie(name="24")
+
+    assert not hasattr(serie, "__dict__")
+    assert serie.year == 2023
+    assert serie.season == 1
+    assert Serie.kind == "serie"
+
+
+def test_slots_reject_unknown_attributes():
+    movie = Movie(name="Avengers", year=2012)
+
+    with pytest.raises(AttributeError):
+        movie.director = "Joss Whedon"
+
+
+def test_slots_methods_still_checked():
+    movie = Movie(name="Avengers", year=2012)
+    movie.set_name("The Avengers")
+
+    assert movie.name == "The Avengers"
+
+    with pytest.raises(ValidationError):
+        movie.set_name(1)
+
+
+def test_slots_smaller_than_dict():
+    movie = Movie(name="Avengers", year=2012)
+    film = Film(name="Avengers")
+
+    assert sys.getsizeof(movie) < sys.getsizeof(film) + sys.getsizeof(film.__dict__)
+
+
+def test_slots_repr():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert repr(movie) == "Movie(name='Avengers', year=2012)"
+
+
+def test_no_slots_by_default():
+    film = Film(name="Avengers")
+
+    assert film.__dict__ == {"name": "Avengers"}
@@ -0,0 +1,125 @@
+from typing import Any, List, Optional
+
+import pytest
+
+from polyforce import Config, PolyModel
+from polyforce.exceptions import ValidationError
+
+
+class Movie(PolyModel):
+    config = Config(validate_assignment=True)
+
+    rating: float = 0.0
+    director: "Optional[Director]"
+
+    def __init__(self, name: str, year: int, tags: Optional[List[str]] = None) -> None:
+        self.name = name
+        self.year = year
+        self.tags = tags
+
+    def rate(self, rating: float) -> None:
+        self.rating = rating
+
+
+class Director(PolyModel):
+    def __init__(self, name: Any) -> None:
+        self.name = name
+
+
+class SlottedMovie(Movie):
+    config = Config(slots=True)
+
+    def __init__(self, name: str, year: int, season: int = 1) -> None:
+        super().__init__(name=name, year=year)
+        self.season = season
+
+
+def test_assignment_validated():
+    movie = Movie(name="Avengers", year=2012)
+    movie.year = 2013
+
+    assert movie.year == 2013
+    assert movie.__dict__["year"] == 2013
+
+    with pytest.raises(ValidationError) as raised:
+        movie.year = "2013"
+
+    assert raised.value.errors() == [
+        {
+            "source": "Movie",
+            "value": "2013",
+            "input": "year",
+            "expected": "int",
+            "message": "Expected 'int' for attribute 'year', but received type 'str'.",
+        }
+    ]
+
+
+def test_unknown_attributes_not_validated():
+    movie = Movie(name="Avengers", year=2012)
+    movie.anything = object()
+
+    assert "anything" not in Movie.__dict__
+
+
+def test_declared_attributes_validated():
+    movie = Movie(name="Avengers", year=2012)
+
+    assert movie.rating == 0.0
+
+    movie.rate(4.5)
+    assert movie.rating == 4.5
+
+    with pytest.raises(ValidationError):
+        movie.rating = "good"
+
+
+def test_forward_reference_validated_on_assignment():
+    movie = Movie(name="Avengers", year=2012)
+    movie.director = Director(name="Joss Whedon")
+    movie.director = None
+
+    with pytest.raises(ValidationError):
+        movie.director = "Joss Whedon"
+
+
+def test_slots_init_validated():
+    with pytest.raises(ValidationError):
+        SlottedMovie(name="Avengers", year=2012, season="1")
+
+
+def test_slots_validated():
+    movie = SlottedMovie(name="Avengers", year=2012)
+    movie.season = 2
+
+    assert movie.season == 2
+
+    with pytest.raises(ValidationError):
+        movie.season = "3"
+
+    with pytest.raises(ValidationError):
+        movie.year = "2013"
+
+
+def test_coerce_on_assignment():
+    class Serie(PolyModel):
+        config = Config(validate_assignment=True, coerce=True)
+
+        def __init__(self, season: int) -> None:
+            self.season = season
+
+    serie = Serie(season=1)
+    serie.season = "2"
+
+    assert serie.season == 2
+
+
+def test_not_validated_by_default():
+    class Serie(PolyModel):
+        def __init__(self, season: int) -> None:
+            self.season = season
+
+    serie = Serie(season=1)
+    serie.season = "2"
+
+    assert serie.season == "2"
@@ -0,0 +1,51 @@
+from functools import wraps
+from typing import Any, Callable, List
+
+from polyforce import polycheck
+
+
+def logged(func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def add_movie(name: str, year: int) -> str:
+    return f"{name} ({year})"
+
+
+def count(tags: List[str]) -> int:
+    return len(tags)
+
+
+def untyped(name):
+    return name
+
+
+class Catalog:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def search(self, query: str, limit: int = 10) -> Any:
+        return query, limit
+
+    @staticmethod
+    def parse(value: int) -> int:
+        return value
+
+
+@logged
+def rate(score: int) -> int:
+    return score
+
+
+@logged
+def rename(name: str) -> str:
+    return name
+
+
+@polycheck()
+def checked(name: str) -> str:
+    return name
@@ -0,0 +1,99 @@
+import sys
+
+import pytest
+
+import polyforce
+from polyforce.exceptions import ValidationError
+
+from . import services
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="sys.monitoring requires Python 3.12+"
+)
+
+
+@pytest.fixture
+def enforcer():
+    enforcer = polyforce.enforce(services)
+    yield enforcer
+    enforcer.stop()
+
+
+def test_enforce(enforcer):
+    assert services.add_movie("Avengers", 2012) == "Avengers (2012)"
+    assert services.add_movie.__name__ == "add_movie"
+
+    with pytest.raises(ValidationError) as raised:
+        services.add_movie("Avengers", year="2012")
+
+    assert raised.value.errors() == [
+        {
+            "source": "add_movie",
+            "value": "2012",
+            "input": "year",
+            "expected": "int",
+            "message": "Expected 'int' for attribute 'year', but received type 'str'.",
+        }
+    ]
+
+
+def test_enforce_methods(enforcer):
+    catalog = services.Catalog(name="movies")
+
+    assert catalog.search("avengers") == ("avengers", 10)
+    assert services.Catalog.parse(1) == 1
+
+    with pytest.raises(ValidationError):
+        catalog.search(query=1)
+
+    with pytest.raises(ValidationError):
+        services.Catalog.parse("1")
+
+    with pytest.raises(ValidationError):
+        services.Catalog(name=1)
+
+
+def test_enforce_decorated(enforcer):
+    assert services.rate(1) == 1
+    assert services.rename("Avengers") == "Avengers"
+    assert enforcer.add(services.checked) is False
+
+    with pytest.raises(ValidationError) as raised:
+        services.rate("bad")
+
+    assert raised.value.errors()[0]["input"] == "score"
+
+    with pytest.raises(ValidationError) as raised:
+        services.rename(1)
+
+    assert raised.value.errors()[0]["input"] == "name"
+
+    enforcer.disable(services.rate)
+    assert services.rate("bad") == "bad"
+
+
+def test_enforce_skips_untyped(enforcer):
+    assert services.untyped(1) == 1
+
+
+def test_enforce_disable(enforcer):
+    enforcer.disable(services.count)
+
+    assert services.count("action") == 6
+
+
+def test_enforce_sample():
+    enforcer = polyforce.enforce("tests.monitoring.services", sample=2)
+    try:
+        with pytest.raises(ValidationError):
+            services.count("action")
+
+        services.count(["action"])
+
+        # Sampled enough, the function is no longer checked.
+        assert services.count("action") == 6
+    finally:
+        enforcer.stop()
+        sys.monitoring.restart_events()
+
+    assert services.count("action") == 6
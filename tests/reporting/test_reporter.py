@@ -0,0 +1,86 @@
+import logging
+import time
+
+import pytest
+
+from polyforce import reporting
+from polyforce.exceptions import PolyforceWarning
+from polyforce.reporting import Failure, Reporter, warn_failure
+
+
+def test_flush_aggregates():
+    received = []
+    reporter = Reporter(handler=lambda failure, count: received.append((failure, count)))
+
+    reporter.queue.extend([("f", "x", int), ("f", "x", int), ("f", "y", str)])
+
+    assert reporter.flush() == {Failure("f", "x", int): 2, Failure("f", "y", str): 1}
+    assert received == [(Failure("f", "x", int), 2), (Failure("f", "y", str), 1)]
+    assert reporter.counts == {Failure("f", "x", int): 2, Failure("f", "y", str): 1}
+
+
+def test_without_deduplication():
+    received = []
+    reporter = Reporter(handler=lambda failure, count: received.append(count), deduplicate=False)
+
+    for count in (1, 2):
+        reporter.queue.extend([("f", "x", int)] * count)
+        reporter.flush()
+
+    assert received == [1, 2]
+    assert reporter.counts == {Failure("f", "x", int): 3}
+
+
+def test_drops_when_full(caplog):
+    reporter = Reporter(maxsize=2)
+    reporter.thread = object()  # Not started.
+
+    for _ in range(5):
+        reporter.push(("f", "x", int))
+
+    assert len(reporter.queue) == 2
+    assert reporter.dropped == 3
+
+    reporter.thread = None
+    with caplog.at_level(logging.WARNING, logger="polyforce"):
+        reporter.flush()
+
+    assert "3 failures dropped" in caplog.text
+    assert "Invalid value of type 'int' for attribute 'x' of 'f'. (2 times)" in caplog.text
+
+
+def test_background_thread():
+    received = []
+    reporter = Reporter(handler=lambda failure, count: received.append(failure), interval=0.01)
+    reporter.push(("f", "x", int))
+
+    assert reporter.thread is not None
+
+    deadline = time.monotonic() + 5
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    reporter.stop()
+    assert received == [Failure("f", "x", int)]
+    assert reporter.thread is None
+
+
+def test_warn_failure():
+    reporter = Reporter(handler=warn_failure)
+    reporter.queue.append(("f", "x", int))
+
+    with pytest.warns(PolyforceWarning, match="attribute 'x' of 'f'"):
+        reporter.flush()
+
+
+def test_exit_handler_registered_once(monkeypatch):
+    registered = []
+    monkeypatch.setattr(reporting, "exit_registered", False)
+    monkeypatch.setattr(reporting.atexit, "register", registered.append)
+
+    reporter = Reporter(interval=3600)
+    for _ in range(3):
+        reporter.start()
+        reporter.stop()
+
+    assert registered == [reporting.stop_reporter]
@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from typing_extensions import Annotated
+
+from polyforce import Config, Field, PolyModel, polycheck
+from polyforce.exceptions import ValidationError
+from polyforce.reporting import Failure, Reporter, set_reporter
+
+
+@pytest.fixture
+def failures():
+    received = []
+    reporter = Reporter(handler=lambda failure, count: received.append((failure, count)))
+    previous = set_reporter(reporter)
+
+    def flush():
+        reporter.flush()
+        return received
+
+    yield flush
+    set_reporter(previous)
+
+
+class Movie(PolyModel):
+    config = Config(mode="warn")
+
+    year: int
+
+    def __init__(self, name: str, year: int) -> None:
+        self.name = name
+        self.year = year
+
+    def rate(self, score: float, *tags: str) -> float:
+        return score
+
+
+def test_model_warns(failures):
+    movie = Movie(name=1, year="2012")
+
+    assert movie.name == 1
+    assert movie.year == "2012"
+    assert failures() == [
+        (Failure("__init__", "name", int), 1),
+        (Failure("__init__", "year", str), 1),
+    ]
+
+
+def test_deduplicated(failures):
+    for _ in range(3):
+        Movie("Avengers", year="2012")
+
+    assert failures() == [(Failure("__init__", "year", str), 3)]
+
+    Movie("Avengers", year="2012")
+    assert failures() == [(Failure("__init__", "year", str), 3)]
+
+
+def test_assignment_warns(failures):
+    class Serie(PolyModel):
+        config = Config(mode="warn", validate_assignment=True)
+
+        year: int
+
+    serie = Serie()
+    serie.year = "2013"
+
+    assert serie.year == "2013"
+    assert failures() == [(Failure("Serie", "year", str), 1)]
+
+
+def test_variadic_warns(failures):
+    assert Movie("Avengers", 2012).rate(1.0, "action", 1) == 1.0
+    assert failures() == [(Failure("Movie", "tags", int), 1)]
+
+
+def test_polycheck_warns(failures):
+    @polycheck(mode="warn")
+    def count(values: List[int]) -> int:
+        return "many"
+
+    assert count(values=(1,)) == "many"
+    assert failures() == [(Failure("count", "values", tuple), 1)]
+
+
+def test_warn_with_coerce(failures):
+    @polycheck(mode="warn", coerce=True)
+    def count(value: int, limit: Annotated[int, lambda value: value > 0] = 1) -> int:
+        return value
+
+    assert count("1") == 1
+    assert count("one") == "one"
+    assert count(1, 0) == 1
+    assert failures() == [(Failure("count", "value", str), 1), (Failure("count", "limit", int), 1)]
+
+
+def test_dataclass_warns(failures):
+    @polycheck(mode="warn")
+    @dataclass
+    class Serie:
+        name: str
+        season: int = 1
+
+    assert Serie("Friends", season="1").season == "1"
+    assert failures() == [(Failure("Serie", "season", str), 1)]
+
+
+def test_raise_by_default():
+    class Serie(PolyModel):
+        def __init__(self, name: str) -> None:
+            ...
+
+    with pytest.raises(ValidationError):
+        Serie(name=1)
+
+
+def test_subclass_raises(failures):
+    class Serie(Movie):
+        config = Config(mode="raise")
+
+    with pytest.raises(ValidationError):
+        Serie("Friends", year="1994")
+
+    assert failures() == []
+
+
+@pytest.mark.parametrize("factory", [lambda: Config(mode="loud"), lambda: polycheck(mode="loud")])
+def test_invalid_mode(factory):
+    with pytest.raises(ValueError):
+
+        class Serie(PolyModel):
+            config = factory()
+
+
+def test_pydantic_core_warns(failures):
+    pytest.importorskip("pydantic_core")
+
+    class Serie(PolyModel):
+        config = Config(mode="warn", backend="pydantic-core")
+
+        def __init__(self, name: str, seasons: int) -> None:
+            self.seasons = seasons
+
+    assert Serie(name="Friends", seasons="ten").seasons == "ten"
+    assert failures() == [(Failure("__init__", "seasons", str), 1)]
+
+
+def test_factory_warns(failures):
+    @polycheck(mode="warn")
+    def count(values: List[int] = Field(factory=tuple)) -> int:
+        return len(values)
+
+    class Serie(PolyModel):
+        config = Config(mode="warn")
+
+        def __init__(self, seasons: int = Field(factory=lambda: "ten")) -> None:
+            self.seasons = seasons
+
+    assert count() == 0
+    assert count() == 0
+    assert Serie().seasons == "ten"
+    assert failures() == [
+        (Failure("count", "values", tuple), 2),
+        (Failure("__init__", "seasons", str), 1),
+    ]
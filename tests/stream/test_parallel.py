@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from polyforce.exceptions import ValidationError
+from polyforce.stream import stream_csv, stream_ndjson, validate_records
+
+from .test_stream import Movie, add_movie
+
+
+@pytest.fixture
+def ndjson(tmp_path):
+    path = tmp_path / "movies.ndjson"
+    lines = [b'{"name": "Movie %d", "year": %d}' % (index, 2000 + index) for index in range(20)]
+    lines[5] = b'{"name": "Movie 5", "year": "2005"}'
+    lines[12] = b"{not json}"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    return path
+
+
+def test_parallel_ndjson(ndjson):
+    errors = []
+
+    movies = list(stream_ndjson(ndjson, Movie, errors=errors.append, parallel=2, chunk_size=3))
+
+    assert [movie.year for movie in movies] == [
+        2000 + index for index in range(20) if index not in (5, 12)
+    ]
+    assert [error["row"] for error in errors] == [5, 12]
+
+
+def test_parallel_ndjson_coerce(ndjson):
+    errors = []
+
+    movies = list(
+        stream_ndjson(ndjson, Movie, errors=errors.append, coerce=True, parallel=2, chunk_size=4)
+    )
+
+    assert len(movies) == 19
+    assert movies[5].year == 2005
+    assert [error["row"] for error in errors] == [12]
+
+
+def test_parallel_raises_without_sink(ndjson):
+    movies = stream_ndjson(ndjson, Movie, parallel=2, chunk_size=3)
+
+    assert len([next(movies) for _ in range(5)]) == 5
+
+    with pytest.raises(ValidationError) as raised:
+        next(movies)
+
+    assert raised.value.errors()[0]["row"] == 5
+
+
+def test_parallel_csv(tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text("name,year\n" + "".join(f"Movie {i},{2000 + i}\n" for i in range(10)))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        records = list(stream_csv(path, add_movie, parallel=executor, chunk_size=4))
+
+    assert records[-1] == {"name": "Movie 9", "year": 2009}
+    assert len(records) == 10
+
+
+def test_parallel_records():
+    records = [{"name": f"Movie {i}", "year": 2000 + i} for i in range(10)]
+    records[7]["year"] = "2007"
+    errors = []
+
+    movies = list(validate_records(records, Movie, errors=errors.append, parallel=2, chunk_size=2))
+
+    assert len(movies) == 9
+    assert errors[0]["row"] == 7
@@ -0,0 +1,133 @@
+from typing import List, Union
+
+import pytest
+
+from polyforce import PolyModel, polycheck
+from polyforce.exceptions import ValidationError
+from polyforce.stream import stream_csv, stream_ndjson, validate_records
+
+
+class Movie(PolyModel):
+    def __init__(self, name: str, year: int, tags: Union[List[str], None] = None) -> None:
+        self.name = name
+        self.year = year
+        self.tags = tags
+
+
+@polycheck()
+def add_movie(name: str, year: int) -> None:
+    ...
+
+
+def import_movie(name: str, year: int) -> None:
+    ...
+
+
+@pytest.fixture
+def ndjson(tmp_path):
+    path = tmp_path / "movies.ndjson"
+    path.write_bytes(
+        b'{"name": "Avengers", "year": 2012, "tags": ["action"]}\n'
+        b"\n"
+        b'{"name": "Thor", "year": "2011"}\n'
+        b"{not json}\n"
+        b'{"name": "Hulk"}\n'
+        b'{"name": "Iron Man", "year": 2008}\n'
+    )
+    return path
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text("name,year\nAvengers,2012\nThor,twenty\nIron Man,2008\n")
+    return path
+
+
+def test_stream_ndjson_models(ndjson):
+    errors = []
+
+    movies = list(stream_ndjson(ndjson, Movie, errors=errors.append))
+
+    assert [movie.name for movie in movies] == ["Avengers", "Iron Man"]
+    assert all(isinstance(movie, Movie) for movie in movies)
+    assert movies[0].tags == ["action"]
+    assert [error["row"] for error in errors] == [1, 2, 3]
+    assert errors[0] == {
+        "source": "__init__",
+        "value": "2011",
+        "input": "year",
+        "expected": "int",
+        "message": "Expected 'int' for attribute 'year', but received type 'str'.",
+        "row": 1,
+    }
+    assert errors[1]["value"] == "{not json}"
+
+
+def test_stream_ndjson_coerce(ndjson):
+    errors = []
+
+    movies = list(stream_ndjson(ndjson, Movie, errors=errors.append, coerce=True))
+
+    assert [movie.year for movie in movies] == [2012, 2011, 2008]
+    assert [error["row"] for error in errors] == [2, 3]
+
+
+def test_stream_ndjson_raises_without_sink(ndjson):
+    movies = stream_ndjson(ndjson, Movie)
+
+    assert next(movies).name == "Avengers"
+
+    with pytest.raises(ValidationError) as raised:
+        next(movies)
+
+    assert raised.value.errors()[0]["row"] == 1
+
+
+def test_stream_ndjson_functions(ndjson):
+    errors = []
+
+    records = list(stream_ndjson(ndjson, add_movie, errors=errors.append))
+
+    assert records == [{"name": "Iron Man", "year": 2008}]
+    # The first record has "tags" which is not a parameter of the function.
+    assert [error["row"] for error in errors] == [0, 1, 2, 3]
+
+
+def test_stream_csv(csv_file):
+    errors = []
+
+    movies = list(stream_csv(csv_file, Movie, errors=errors.append))
+
+    assert [(movie.name, movie.year) for movie in movies] == [
+        ("Avengers", 2012),
+        ("Iron Man", 2008),
+    ]
+    assert errors[0]["row"] == 1
+    assert errors[0]["value"] == "twenty"
+
+
+def test_stream_csv_undecorated_function(csv_file):
+    errors = []
+
+    records = list(stream_csv(csv_file, import_movie, errors=errors.append))
+
+    assert records == [{"name": "Avengers", "year": 2012}, {"name": "Iron Man", "year": 2008}]
+
+
+def test_stream_empty_file(tmp_path):
+    path = tmp_path / "empty.ndjson"
+    path.write_bytes(b"")
+
+    assert list(stream_ndjson(path, Movie)) == []
+
+
+def test_validate_records():
+    records = [{"name": "Avengers", "year": 2012}, {"name": 1, "year": 2012}, []]
+    errors = []
+
+    movies = list(validate_records(records, Movie, errors=errors.append))
+
+    assert len(movies) == 1
+    assert [error["row"] for error in errors] == [1, 2]
+    assert errors[1]["message"] == "Expected a record as 'dict', but received type 'list'."